@@ -18,6 +18,20 @@ from .client import *
 from .finance import *
 from .errors import *
 from .enums import *
+from .markets import *
+from .planner import *
+from .currency import *
+from .portfolio import *
+from .iban import *
+from .inflation import *
+from .symbols import *
+from .history import *
+from .ticks import *
+from .bars import *
+from .alerts import *
+from .hub import *
+from .cache import *
+from .access import *
 from . import (
     utils as utils,
     abc as abc,
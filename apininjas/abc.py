@@ -24,12 +24,19 @@ SOFTWARE.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict
+import datetime
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
 from . import utils
+from .history import PriceHistory
+from .markets import get_trading_session, is_closed_since
 
 if TYPE_CHECKING:
-    import datetime
+    from .client import Client
+    from .http import HTTPClient
+    from .markets import TradingSession
 
 
 # fmt: off
@@ -39,6 +46,9 @@ __all__ = (
 # fmt: on
 
 
+_log = logging.getLogger(__name__)
+
+
 class FinancialInstrument:
     """An ABC representing the common operations of a financial instrument.
 
@@ -54,7 +64,11 @@ class FinancialInstrument:
         The current price of the instrument, last updated at :attr:`updated_at`.
     """
 
+    # weakly referenceable for the identity map of the client
+    __slots__ = ("__weakref__", "_cs_updated_at", "_history")
+
     price: float
+    _http: HTTPClient
     _updated: int
 
     def __lt__(self, other: FinancialInstrument) -> bool:
@@ -72,12 +86,102 @@ class FinancialInstrument:
     def _update(self, *, data: Dict[str, Any]) -> None:
         raise NotImplementedError
 
+    def _key(self) -> str:
+        # the ticker, symbol or commodity type identifying the instrument
+        raise NotImplementedError
+
+    def _kind(self) -> str:
+        # e.g. stock, distinguishing instruments of different kinds with the same key
+        raise NotImplementedError
+
+    def _on_update(self, previous: Optional[float]) -> None:
+        # called at the end of _update, once the new price is set
+        utils.reset_cached_slots(self, "_cs_updated_at")
+
+        # a failing listener must neither fail the call which set the price nor skip the other listeners
+        for listener in self._http.price_listeners:
+            try:
+                listener(self, previous)
+            except Exception:
+                _log.exception("Price listener %r failed for %r", listener, self)
+
+        history = self.history
+        if history is None:
+            capacity = self._http.price_history
+            if capacity is None:
+                return
+            history = self.track_history(capacity)
+
+        # polling an unchanged price doesn't add a new one
+        if not history or history.last_timestamp != self._updated:
+            history.append(self._updated, self.price)
+
+    def _is_updated_within(self, max_age: Optional[float]) -> bool:
+        # whether the price the API returned was updated at most max_age seconds ago
+        return max_age is not None and time.time() - self._updated <= max_age
+
+    def _exchange(self) -> Optional[str]:
+        return None
+
+    def _is_price_final(self) -> bool:
+        # the price can't have changed if the exchange was closed ever since the server updated it
+        return self._http.skip_closed_markets and is_closed_since(self._exchange(), self._updated)
+
+    @property
+    def trading_session(self) -> Optional[TradingSession]:
+        """Optional[:class:`~apininjas.TradingSession`]: The trading session of the exchange the instrument is traded on.
+
+        ``None`` if the exchange is unknown or trades around the clock.
+        """
+        return get_trading_session(self._exchange())
+
+    def is_market_open(self) -> bool:
+        """:class:`bool`: Whether the exchange the instrument is traded on is currently open.
+
+        Always ``True`` if the :attr:`trading_session` is unknown.
+        """
+        session = self.trading_session
+        return session is None or session.is_open()
+
     @property
+    def history(self) -> Optional[PriceHistory]:
+        """Optional[:class:`~apininjas.PriceHistory`]: The recent prices of the instrument, if tracked.
+
+        See :meth:`track_history`.
+        """
+        try:
+            return self._history
+        except AttributeError:
+            return None
+
+    def track_history(self, capacity: int) -> PriceHistory:
+        """Starts recording the prices of the instrument in a :class:`~apininjas.PriceHistory`.
+
+        Every price retrieved afterwards is recorded, unless it has the same
+        :attr:`updated_at` as the previous one. If the prices are already recorded,
+        the existing :attr:`history` is returned.
+
+        Parameters
+        -----------
+        capacity: :class:`int`
+            The maximum number of prices kept.
+
+        Returns
+        --------
+        :class:`~apininjas.PriceHistory`
+            The history of the instrument.
+        """
+        history = self.history
+        if history is None:
+            history = self._history = PriceHistory(capacity)
+        return history
+
+    @utils.cached_slot_property("_cs_updated_at")
     def updated_at(self) -> datetime.datetime:
-        """:class:`datetime.datetime`: Date and time the :attr:`price` was last updated."""
+        """:class:`datetime.datetime`: Date and time the :attr:`price` was last updated, in UTC."""
         return utils.from_timestamp(self._updated)
 
-    async def update(self) -> float:
+    async def update(self, *, max_age: Optional[float] = None) -> float:
         """|coro|
 
         Updates :attr:`price` and :attr:`.updated_at` of the current object and
@@ -85,7 +189,17 @@ class FinancialInstrument:
 
         .. note::
 
-            This makes an API call.
+            This makes an API call, unless the exchange has been closed ever since
+            :attr:`updated_at`. Then the price can't have changed and the current
+            one is returned.
+
+        Parameters
+        -----------
+        max_age: Optional[:class:`float`]
+            The maximum time in seconds since :attr:`updated_at` of an acceptable price.
+            If passed, the current price or one in the :attr:`~apininjas.Client.cache` is returned
+            without an API call if it's recent enough. Defaults to ``None``, which always
+            retrieves the price.
 
         Raises
         -------
@@ -98,3 +212,35 @@ class FinancialInstrument:
             The newly updated price.
         """
         raise NotImplementedError
+
+
+class _PriceListener:
+    # the registration with the price listeners of a client, shared by
+    # TickStore, BarAggregator and AlertEngine
+
+    __slots__ = ()
+
+    def _on_price(self, instrument: FinancialInstrument, previous: Optional[float]) -> None:
+        raise NotImplementedError
+
+    def _on_close(self) -> Optional[Callable[[], None]]:
+        # the function to call when the client is closed, if any
+        return None
+
+    def _attach(self, client: Client) -> None:
+        http = client._http
+        if self._on_price not in http.price_listeners:
+            http.price_listeners.append(self._on_price)
+
+        callback = self._on_close()
+        if callback is not None and callback not in http.close_callbacks:
+            http.close_callbacks.append(callback)
+
+    def _detach(self, client: Client) -> None:
+        http = client._http
+        if self._on_price in http.price_listeners:
+            http.price_listeners.remove(self._on_price)
+
+        callback = self._on_close()
+        if callback is not None and callback in http.close_callbacks:
+            http.close_callbacks.remove(callback)
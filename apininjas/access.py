@@ -0,0 +1,216 @@
+"""
+MIT License
+
+Copyright (c) 2024-present codeofandrin
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import json
+import os
+import time
+from typing import Any, ClassVar, Counter, Dict, List, Optional, Tuple, Union
+
+
+# fmt: off
+__all__ = (
+    "AccessRecorder",
+)
+# fmt: on
+
+
+class AccessRecorder:
+    """Records how often every API call is made and persists the counts to a file.
+
+    The most frequent calls are retrieved ahead of time by :meth:`~apininjas.Client.warmup`, e.g.
+    right after a restart, so the first calls are served from the :attr:`~apininjas.Client.cache`.
+    Calls served from a cache are recorded too, since they show which responses are
+    requested the most.
+
+    The counts are written to the file every :attr:`interval` seconds while calls are
+    recorded and when the client is closed. Existing counts are loaded from the file
+    when the recorder is created.
+
+    The counts decay exponentially with a :attr:`half_life`, also while the client isn't
+    running, so calls which were frequent long ago make way for the current ones.
+
+    This is usually created by the :class:`Client` if ``access_log`` is passed and then
+    available with :attr:`Client.access_recorder`.
+
+    .. container:: operations
+
+        .. describe:: len(x)
+
+            Returns the number of distinct calls recorded.
+
+    Attributes
+    -----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        The JSON file the counts are persisted to.
+    interval: :class:`float`
+        The time in seconds between two writes of the file.
+    max_size: :class:`int`
+        The maximum number of distinct calls kept. The least frequent ones are dropped.
+    half_life: Optional[:class:`float`]
+        The time in seconds after which a count is halved, or ``None`` to never decay.
+    """
+
+    # decayed counts below this are dropped
+    MIN_COUNT: ClassVar[float] = 0.1
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike[str]],
+        *,
+        interval: float = 60.0,
+        max_size: int = 10000,
+        half_life: Optional[float] = 7 * 86400.0,
+    ):
+        self.path: Union[str, os.PathLike[str]] = path
+        self.interval: float = interval
+        self.max_size: int = max_size
+        self.half_life: Optional[float] = half_life
+        # (path, sorted params) -> decayed number of calls
+        self._counts: Counter[Tuple[str, Tuple[Tuple[str, Any], ...]]] = collections.Counter()
+        # the time the counts were last decayed
+        self._decayed: float = time.time()
+        self._task: Optional[asyncio.Task[None]] = None
+        self.load()
+
+    def __repr__(self) -> str:
+        return f"<AccessRecorder path={self.path!r} calls={len(self._counts)}>"
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def record(self, path: str, params: Optional[Dict[str, Any]] = None) -> None:
+        """Records a call.
+
+        Parameters
+        -----------
+        path: :class:`str`
+            The path of the route, e.g. ``/stockprice``.
+        params: Optional[Dict[:class:`str`, Any]]
+            The query parameters of the call.
+        """
+        counts = self._counts
+        counts[(path, tuple(sorted(params.items())) if params else ())] += 1
+        if len(counts) > 2 * self.max_size:
+            self._counts = collections.Counter(dict(counts.most_common(self.max_size)))
+
+        if self._task is None and self.interval > 0:
+            try:
+                self._task = asyncio.get_running_loop().create_task(self._save_periodically())
+            except RuntimeError:
+                # not within an event loop, the counts are saved on close
+                pass
+
+    def _decay(self) -> None:
+        now = time.time()
+        elapsed = now - self._decayed
+        self._decayed = now
+        if self.half_life is None or elapsed <= 0:
+            return
+
+        factor = 0.5 ** (elapsed / self.half_life)
+        minimum = self.MIN_COUNT
+        self._counts = collections.Counter(
+            {key: decayed for key, count in self._counts.items() if (decayed := count * factor) >= minimum}
+        )
+
+    def top(self, count: int) -> List[Tuple[str, Dict[str, Any]]]:
+        """Returns the most frequent calls.
+
+        Parameters
+        -----------
+        count: :class:`int`
+            The maximum number of calls to return.
+
+        Returns
+        --------
+        List[Tuple[:class:`str`, Dict[:class:`str`, Any]]]
+            The paths and query parameters of the calls, most frequent first.
+        """
+        self._decay()
+        return [(path, dict(params)) for (path, params), _ in self._counts.most_common(count)]
+
+    def load(self) -> None:
+        """Loads the counts from the file and adds them to the recorded ones.
+
+        The loaded counts are decayed by the time since the file was written.
+        A missing, unreadable or malformed file is ignored.
+        """
+        loaded: Counter[Tuple[str, Tuple[Tuple[str, Any], ...]]] = collections.Counter()
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+
+            factor = 1.0
+            if self.half_life is not None:
+                elapsed = max(0.0, time.time() - float(data.get("saved", time.time())))
+                factor = 0.5 ** (elapsed / self.half_life)
+
+            for entry in data["calls"]:
+                key = (entry["path"], tuple(sorted(entry["params"].items())))
+                loaded[key] += float(entry["count"]) * factor
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return
+
+        self._counts.update(loaded)
+
+    def save(self) -> None:
+        """Writes the counts to the file.
+
+        The file is replaced atomically, so a crash while writing keeps the previous counts.
+        """
+        self._decay()
+        calls = [
+            {"path": path, "params": dict(params), "count": count}
+            for (path, params), count in self._counts.most_common(self.max_size)
+        ]
+        temp = f"{os.fspath(self.path)}.tmp"
+        with open(temp, "w", encoding="utf-8") as file:
+            json.dump({"saved": self._decayed, "calls": calls}, file)
+        os.replace(temp, self.path)
+
+    async def _save_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.save()
+            except OSError:
+                # the next interval tries again
+                pass
+
+    def close(self) -> None:
+        """Stops writing the counts periodically and writes them a last time.
+
+        A failed write is ignored, like the periodic ones.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        try:
+            self.save()
+        except OSError:
+            pass
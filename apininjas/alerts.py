@@ -0,0 +1,334 @@
+"""
+MIT License
+
+Copyright (c) 2024-present codeofandrin
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import bisect
+from array import array
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from .abc import _PriceListener
+
+if TYPE_CHECKING:
+    from .abc import FinancialInstrument
+    from .client import Client
+
+    AlertDirection = Literal["above", "below"]
+    AlertKind = Literal["stock", "commodity", "crypto"]
+
+
+# fmt: off
+__all__ = (
+    "Alert",
+    "AlertEngine",
+)
+# fmt: on
+
+
+class Alert(NamedTuple):
+    """A namedtuple which represents a price alert of an :class:`AlertEngine`.
+
+    Attributes
+    -----------
+    id: :class:`collections.abc.Hashable`
+        The unique identifier of the alert.
+    kind: :class:`str`
+        The kind of the instrument. One of ``stock``, ``commodity`` or ``crypto``.
+    key: :class:`str`
+        The ticker, symbol or commodity type of the instrument, e.g. ``AAPL``. Case-insensitive.
+    threshold: :class:`float`
+        The price to alert at.
+    direction: :class:`str`
+        ``above`` to alert once the price rises above the threshold or ``below``
+        to alert once it falls below.
+    """
+
+    id: Hashable
+    kind: AlertKind
+    key: str
+    threshold: float
+    direction: AlertDirection
+
+
+class _Book:
+    # the alerts of an instrument and direction, sorted by their thresholds
+
+    __slots__ = ("thresholds", "alerts")
+
+    def __init__(self) -> None:
+        self.thresholds: array[float] = array("d")
+        self.alerts: List[Alert] = []
+
+    def extend(self, alerts: Iterable[Alert]) -> None:
+        merged = sorted((*self.alerts, *alerts), key=lambda alert: alert.threshold)
+        self.thresholds = array("d", [alert.threshold for alert in merged])
+        self.alerts = merged
+
+    def remove(self, ids: Iterable[Hashable]) -> None:
+        ids = set(ids)
+        kept = [alert for alert in self.alerts if alert.id not in ids]
+        self.thresholds = array("d", [alert.threshold for alert in kept])
+        self.alerts = kept
+
+
+class AlertEngine(_PriceListener):
+    """Evaluates many price alerts whenever the price of an instrument changes.
+
+    The thresholds of every instrument are kept sorted, so the alerts crossed by a price
+    change are found by bisection in ``O(log n + k)`` for ``n`` alerts of the instrument
+    and ``k`` crossed ones, instead of checking every alert.
+
+    An ``above`` alert is triggered when the price rises from at most its threshold to
+    above it, and a ``below`` alert when the price falls from at least its threshold to
+    below it. Alerts stay registered after being triggered, until they are removed.
+
+    .. container:: operations
+
+        .. describe:: len(x)
+
+            Returns the number of alerts.
+
+        .. describe:: x in y
+
+            Checks if an alert with the given ID exists.
+    """
+
+    def __init__(self) -> None:
+        # (kind, upper-cased key, direction) -> alerts
+        self._books: Dict[Tuple[str, str, AlertDirection], _Book] = {}
+        self._alerts: Dict[Hashable, Alert] = {}
+        self._listeners: List[Callable[[Alert, float], None]] = []
+
+    def __repr__(self) -> str:
+        return f"<AlertEngine alerts={len(self._alerts)}>"
+
+    def __len__(self) -> int:
+        return len(self._alerts)
+
+    def __contains__(self, id: Hashable) -> bool:
+        return id in self._alerts
+
+    def get_alert(self, id: Hashable) -> Optional[Alert]:
+        """Returns the alert with the given ID.
+
+        Parameters
+        -----------
+        id: :class:`collections.abc.Hashable`
+            The ID of the alert.
+
+        Returns
+        --------
+        Optional[:class:`Alert`]
+            The alert or ``None`` if not found.
+        """
+        return self._alerts.get(id)
+
+    def add_alert(
+        self, id: Hashable, kind: AlertKind, key: str, threshold: float, direction: AlertDirection
+    ) -> Alert:
+        """Adds an alert.
+
+        Parameters
+        -----------
+        id: :class:`collections.abc.Hashable`
+            The unique identifier of the alert. An existing alert with the same ID is replaced.
+        kind: :class:`str`
+            The kind of the instrument. One of ``stock``, ``commodity`` or ``crypto``.
+        key: :class:`str`
+            The ticker, symbol or commodity type of the instrument, e.g. ``AAPL``. Case-insensitive.
+        threshold: :class:`float`
+            The price to alert at.
+        direction: :class:`str`
+            ``above`` or ``below``.
+
+        Returns
+        --------
+        :class:`Alert`
+            The added alert.
+        """
+        alert = Alert(id, kind, key, threshold, direction)
+        self.add_alerts([alert])
+        return alert
+
+    def add_alerts(self, alerts: Iterable[Alert]) -> None:
+        """Adds many alerts at once.
+
+        This sorts the thresholds of every affected instrument only once.
+
+        Parameters
+        -----------
+        alerts: Iterable[:class:`Alert`]
+            The alerts to add. Existing alerts with the same IDs are replaced.
+        """
+        added: Dict[Hashable, Alert] = {}
+        for alert in alerts:
+            if alert.kind not in ("stock", "commodity", "crypto"):
+                raise ValueError(f"kind must be 'stock', 'commodity' or 'crypto', not {alert.kind!r}")
+            if alert.direction not in ("above", "below"):
+                raise ValueError(f"direction must be 'above' or 'below', not {alert.direction!r}")
+            added[alert.id] = alert
+
+        self.remove_alerts([id for id in added if id in self._alerts])
+
+        grouped: Dict[Tuple[str, str, AlertDirection], List[Alert]] = {}
+        for alert in added.values():
+            grouped.setdefault((alert.kind, alert.key.upper(), alert.direction), []).append(alert)
+
+        for book_key, group in grouped.items():
+            book = self._books.get(book_key)
+            if book is None:
+                book = self._books[book_key] = _Book()
+            book.extend(group)
+
+        self._alerts.update(added)
+
+    def remove_alerts(self, ids: Iterable[Hashable]) -> None:
+        """Removes many alerts at once. Unknown IDs are ignored.
+
+        Parameters
+        -----------
+        ids: Iterable[:class:`collections.abc.Hashable`]
+            The IDs of the alerts to remove.
+        """
+        grouped: Dict[Tuple[str, str, AlertDirection], List[Hashable]] = {}
+        for id in ids:
+            alert = self._alerts.pop(id, None)
+            if alert is not None:
+                grouped.setdefault((alert.kind, alert.key.upper(), alert.direction), []).append(id)
+
+        for book_key, group in grouped.items():
+            book = self._books[book_key]
+            book.remove(group)
+            if not book.alerts:
+                del self._books[book_key]
+
+    def add_listener(self, listener: Callable[[Alert, float], None]) -> None:
+        """Registers a function which is called with every triggered :class:`Alert`
+        and the price which triggered it.
+
+        Parameters
+        -----------
+        listener: Callable[[:class:`Alert`, :class:`float`], None]
+            The function to call.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Alert, float], None]) -> None:
+        """Removes a listener registered with :meth:`add_listener`.
+
+        Parameters
+        -----------
+        listener: Callable[[:class:`Alert`, :class:`float`], None]
+            The function to remove.
+        """
+        try:
+            self._listeners.remove(listener)
+        except ValueError:
+            pass
+
+    def check(self, kind: AlertKind, key: str, previous: float, price: float) -> List[Alert]:
+        """Returns the alerts of an instrument crossed by a price change and passes
+        them to the listeners.
+
+        Parameters
+        -----------
+        kind: :class:`str`
+            The kind of the instrument. One of ``stock``, ``commodity`` or ``crypto``.
+        key: :class:`str`
+            The ticker, symbol or commodity type of the instrument. Case-insensitive.
+        previous: :class:`float`
+            The previous price.
+        price: :class:`float`
+            The new price.
+
+        Returns
+        --------
+        List[:class:`Alert`]
+            The triggered alerts, in the order of their thresholds.
+        """
+        key = key.upper()
+        if price > previous:
+            # thresholds in [previous, price)
+            book = self._books.get((kind, key, "above"))
+            if book is None:
+                return []
+            lower = bisect.bisect_left(book.thresholds, previous)
+            upper = bisect.bisect_left(book.thresholds, price, lower)
+        elif price < previous:
+            # thresholds in (price, previous]
+            book = self._books.get((kind, key, "below"))
+            if book is None:
+                return []
+            lower = bisect.bisect_right(book.thresholds, price)
+            upper = bisect.bisect_right(book.thresholds, previous, lower)
+        else:
+            return []
+
+        triggered = book.alerts[lower:upper]
+        for alert in triggered:
+            for listener in self._listeners:
+                listener(alert, price)
+        return triggered
+
+    def _on_price(self, instrument: FinancialInstrument, previous: Optional[float]) -> None:
+        # the first price of an instrument doesn't cross anything
+        if previous is not None:
+            self.check(instrument._kind(), instrument._key(), previous, instrument.price)  # type: ignore
+
+    def attach(self, client: Client) -> None:
+        """Checks the alerts on every price change of the instruments of the client from now on,
+        e.g. with :meth:`.FinancialInstrument.update`.
+
+        .. note::
+
+            Only updates of existing objects can cross alerts, so use the ``identity_map``
+            option of the :class:`Client` to check the prices of repeated fetches too.
+
+        Parameters
+        -----------
+        client: :class:`Client`
+            The client to check the prices of.
+        """
+        self._attach(client)
+
+    def detach(self, client: Client) -> None:
+        """Stops checking the alerts on price changes of the client.
+
+        Parameters
+        -----------
+        client: :class:`Client`
+            The client to stop checking the prices of.
+        """
+        self._detach(client)
@@ -0,0 +1,287 @@
+"""
+MIT License
+
+Copyright (c) 2024-present codeofandrin
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from .abc import _PriceListener
+from .utils import import_optional
+
+if TYPE_CHECKING:
+    from .abc import FinancialInstrument
+    from .client import Client
+
+
+# fmt: off
+__all__ = (
+    "Bar",
+    "BarAggregator",
+)
+# fmt: on
+
+
+class Bar(NamedTuple):
+    """A namedtuple which represents an OHLC bar of an instrument.
+
+    Attributes
+    -----------
+    key: :class:`str`
+        The ticker, symbol or commodity type of the instrument.
+    start: :class:`int`
+        The Unix timestamp the interval of the bar starts at.
+    open: :class:`float`
+        The first price within the interval.
+    high: :class:`float`
+        The highest price within the interval.
+    low: :class:`float`
+        The lowest price within the interval.
+    close: :class:`float`
+        The last price within the interval.
+    count: :class:`int`
+        The number of prices within the interval.
+    """
+
+    key: str
+    start: int
+    open: float
+    high: float
+    low: float
+    close: float
+    count: int
+
+
+class BarAggregator(_PriceListener):
+    """Aggregates the prices of many instruments into OHLC bars of a fixed interval.
+
+    The open bar of every instrument is updated incrementally with each price. Once a
+    price of a later interval arrives, the bar is closed and passed to the listeners.
+    A price which is not newer than the last one of the instrument is ignored, e.g. when
+    an unchanged price is polled again.
+
+    Use :meth:`resample` to aggregate many stored prices at once instead.
+
+    Parameters
+    -----------
+    interval: :class:`int`
+        The length of the bars in seconds, e.g. ``60`` for 1 minute bars.
+    """
+
+    def __init__(self, interval: int):
+        if interval < 1:
+            raise ValueError("interval must be at least 1 second")
+
+        self.interval: int = interval
+        # key -> [start, open, high, low, close, count] of the open bar
+        self._open: Dict[str, List[Any]] = {}
+        # key -> timestamp of the last added price
+        self._last: Dict[str, int] = {}
+        self._listeners: List[Callable[[Bar], None]] = []
+
+    def __repr__(self) -> str:
+        return f"<BarAggregator interval={self.interval} instruments={len(self._open)}>"
+
+    def add_listener(self, listener: Callable[[Bar], None]) -> None:
+        """Registers a function which is called with every closed :class:`Bar`.
+
+        Parameters
+        -----------
+        listener: Callable[[:class:`Bar`], None]
+            The function to call.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Bar], None]) -> None:
+        """Removes a listener registered with :meth:`add_listener`.
+
+        Parameters
+        -----------
+        listener: Callable[[:class:`Bar`], None]
+            The function to remove.
+        """
+        try:
+            self._listeners.remove(listener)
+        except ValueError:
+            pass
+
+    def _emit(self, key: str, state: List[Any]) -> Bar:
+        bar = Bar(key, *state)
+        for listener in self._listeners:
+            listener(bar)
+        return bar
+
+    def add(self, key: str, timestamp: int, price: float) -> Optional[Bar]:
+        """Adds a price of an instrument.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The ticker, symbol or commodity type of the instrument, e.g. ``AAPL``.
+        timestamp: :class:`int`
+            The Unix timestamp the price was updated at.
+        price: :class:`float`
+            The price.
+
+        Returns
+        --------
+        Optional[:class:`Bar`]
+            The bar which was closed by the price, if any.
+        """
+        last = self._last.get(key)
+        if last is not None and timestamp <= last:
+            return None
+        self._last[key] = timestamp
+
+        start = timestamp - timestamp % self.interval
+        state = self._open.get(key)
+
+        if state is not None and start == state[0]:
+            if price > state[2]:
+                state[2] = price
+            elif price < state[3]:
+                state[3] = price
+            state[4] = price
+            state[5] += 1
+            return None
+
+        self._open[key] = [start, price, price, price, price, 1]
+        if state is not None:
+            return self._emit(key, state)
+        return None
+
+    def _on_price(self, instrument: FinancialInstrument, previous: Optional[float]) -> None:
+        self.add(instrument._key(), instrument._updated, instrument.price)
+
+    def attach(self, client: Client) -> None:
+        """Aggregates every price the client retrieves from now on, e.g. with
+        :meth:`Client.fetch_stock` or :meth:`.FinancialInstrument.update`.
+
+        Parameters
+        -----------
+        client: :class:`Client`
+            The client to aggregate the prices of.
+        """
+        self._attach(client)
+
+    def detach(self, client: Client) -> None:
+        """Stops aggregating the prices of the client.
+
+        Parameters
+        -----------
+        client: :class:`Client`
+            The client to stop aggregating the prices of.
+        """
+        self._detach(client)
+
+    def get_bar(self, key: str) -> Optional[Bar]:
+        """Returns the open bar of an instrument.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The ticker, symbol or commodity type of the instrument.
+
+        Returns
+        --------
+        Optional[:class:`Bar`]
+            The bar of the current interval, which may still change, or ``None`` if
+            the instrument has no prices yet.
+        """
+        state = self._open.get(key)
+        return Bar(key, *state) if state is not None else None
+
+    def flush(self) -> List[Bar]:
+        """Closes the open bars of all instruments and passes them to the listeners.
+
+        Returns
+        --------
+        List[:class:`Bar`]
+            The closed bars.
+        """
+        opened, self._open = self._open, {}
+        return [self._emit(key, state) for key, state in opened.items()]
+
+    @staticmethod
+    def resample(timestamps: Sequence[int], prices: Sequence[float], interval: int) -> Dict[str, Any]:
+        """Aggregates many prices of an instrument into OHLC bars at once.
+
+        With :mod:`numpy` installed, this is a single vectorized pass, so it can be
+        used on the results of :meth:`TickStore.range` directly.
+
+        Like with :meth:`add`, a price which is not newer than the ones before it is
+        ignored, so the bars are the same as adding the prices one by one.
+
+        Parameters
+        -----------
+        timestamps: Sequence[:class:`int`]
+            The Unix timestamps of the prices, in the order they were retrieved.
+        prices: Sequence[:class:`float`]
+            The prices.
+        interval: :class:`int`
+            The length of the bars in seconds.
+
+        Returns
+        --------
+        Dict[:class:`str`, Union[:class:`numpy.ndarray`, List]]
+            The ``start``, ``open``, ``high``, ``low``, ``close`` and ``count`` columns
+            of the bars in ascending order, as :class:`numpy.ndarray` if :mod:`numpy` is
+            installed. Intervals without prices have no bar.
+        """
+        np = import_optional("numpy")
+        if np is None:
+            aggregator = BarAggregator(interval)
+            bars = [aggregator.add("", timestamp, price) for timestamp, price in zip(timestamps, prices)]
+            bars = [bar for bar in bars if bar is not None] + aggregator.flush()
+            return {field: [getattr(bar, field) for bar in bars] for field in Bar._fields[1:]}
+
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        prices = np.asarray(prices, dtype=np.float64)
+        if len(timestamps) > 1:
+            # only prices newer than every one before them, like add
+            newer = np.r_[True, timestamps[1:] > np.maximum.accumulate(timestamps)[:-1]]
+            if not newer.all():
+                timestamps, prices = timestamps[newer], prices[newer]
+
+        if not len(timestamps):
+            return {
+                "start": timestamps,
+                "open": prices,
+                "high": prices,
+                "low": prices,
+                "close": prices,
+                "count": timestamps,
+            }
+
+        buckets = timestamps - timestamps % interval
+        # the index of the first price of every interval
+        firsts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        counts = np.diff(np.r_[firsts, len(prices)])
+        return {
+            "start": buckets[firsts],
+            "open": prices[firsts],
+            "high": np.maximum.reduceat(prices, firsts),
+            "low": np.minimum.reduceat(prices, firsts),
+            "close": prices[firsts + counts - 1],
+            "count": counts,
+        }
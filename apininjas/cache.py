@@ -0,0 +1,407 @@
+"""
+MIT License
+
+Copyright (c) 2024-present codeofandrin
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    Hashable,
+    Optional,
+    OrderedDict,
+    Tuple,
+)
+
+from .utils import MISSING
+
+if TYPE_CHECKING:
+    Fetch = Callable[[], Awaitable[Any]]
+
+
+# fmt: off
+__all__ = (
+    "ResponseCache",
+    "NegativeCache",
+)
+# fmt: on
+
+
+class _Entry:
+    __slots__ = ("data", "stored", "hits")
+
+    def __init__(self, data: Any, stored: float):
+        self.data: Any = data
+        self.stored: float = stored
+        # accesses since the data was stored
+        self.hits: int = 0
+
+
+class ResponseCache:
+    """Represents an in-memory cache of successful API responses.
+
+    A response younger than :attr:`ttl` is returned without an API call. An expired
+    response is still returned immediately for up to :attr:`max_stale` more seconds,
+    while it's retrieved again in the background (stale-while-revalidate), so only
+    the first call for a key or one after a long pause waits for the API.
+
+    If :attr:`refresh_ahead` is set, responses which were accessed at least
+    :attr:`hot_threshold` times are retrieved again in the background once they
+    reach that fraction of :attr:`ttl`, so frequently requested keys usually never
+    expire at all.
+
+    A call can also pass its own condition for acceptable responses, e.g. the
+    ``max_age`` of :meth:`~apininjas.Client.fetch_stock`, which then replaces :attr:`ttl`,
+    and a condition for final responses, e.g. prices of an exchange which has been closed
+    ever since, which are returned regardless of their age and never refreshed.
+
+    Concurrent calls for the same uncached key share a single API call. Failed
+    calls are not cached, and a failed background refresh keeps the old response
+    until it's too stale.
+
+    This is usually created by the :class:`Client` if ``cache_ttl`` is passed and then
+    available with :attr:`~apininjas.Client.cache`.
+
+    .. container:: operations
+
+        .. describe:: len(x)
+
+            Returns the number of cached responses.
+
+    Attributes
+    -----------
+    ttl: :class:`float`
+        The time in seconds a response is fresh.
+    max_stale: :class:`float`
+        The time in seconds an expired response may still be returned while it's refreshed.
+    refresh_ahead: Optional[:class:`float`]
+        The fraction of :attr:`ttl` after which hot responses are refreshed, e.g. ``0.8``.
+    hot_threshold: :class:`int`
+        The number of accesses after which a response is hot.
+    max_size: :class:`int`
+        The maximum number of cached responses. The least recently used ones are evicted.
+    hits: :class:`int`
+        The number of calls served with a fresh response.
+    stale_hits: :class:`int`
+        The number of calls served with an expired response.
+    misses: :class:`int`
+        The number of calls which waited for the API.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float,
+        max_stale: float = 0.0,
+        refresh_ahead: Optional[float] = None,
+        hot_threshold: int = 2,
+        max_size: int = 4096,
+    ):
+        if refresh_ahead is not None and not 0.0 < refresh_ahead < 1.0:
+            raise ValueError("refresh_ahead must be between 0 and 1")
+
+        self.ttl: float = ttl
+        self.max_stale: float = max_stale
+        self.refresh_ahead: Optional[float] = refresh_ahead
+        self.hot_threshold: int = hot_threshold
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.stale_hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[Hashable, _Entry] = collections.OrderedDict()
+        # the running API calls, shared by concurrent misses and refreshes of a key
+        self._pending: Dict[Hashable, asyncio.Task[Any]] = {}
+
+    def __repr__(self) -> str:
+        return f"<ResponseCache ttl={self.ttl} max_stale={self.max_stale} size={len(self._entries)}>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(path: str, params: Optional[Dict[str, Any]]) -> Tuple[Any, ...]:
+        # e.g. ("/stockprice", ("ticker", "AAPL"))
+        if not params:
+            return (path,)
+        return (path, *sorted(params.items()))
+
+    def _store(self, key: Hashable, data: Any) -> None:
+        entries = self._entries
+        entries[key] = _Entry(data, time.monotonic())
+        entries.move_to_end(key)
+        while len(entries) > self.max_size:
+            entries.popitem(last=False)
+
+    async def _call(self, key: Hashable, fetch: Fetch) -> Any:
+        try:
+            data = await fetch()
+            self._store(key, data)
+            return data
+        finally:
+            self._pending.pop(key, None)
+
+    def _fetch(self, key: Hashable, fetch: Fetch) -> asyncio.Task[Any]:
+        task = self._pending.get(key)
+        if task is None:
+            task = self._pending[key] = asyncio.ensure_future(self._call(key, fetch))
+        return task
+
+    def _refresh(self, key: Hashable, fetch: Fetch) -> None:
+        if key not in self._pending:
+            task = self._fetch(key, fetch)
+            # the error of a background refresh is never retrieved otherwise
+            task.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+    async def get(
+        self,
+        key: Hashable,
+        fetch: Fetch,
+        *,
+        accept: Optional[Callable[[Any], bool]] = None,
+        final: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """|coro|
+
+        Returns the cached response of a key, calling ``fetch`` if there is none.
+
+        Parameters
+        -----------
+        key: :class:`collections.abc.Hashable`
+            The key of the response.
+        fetch: Callable[[], Awaitable[Any]]
+            The function retrieving the response from the API.
+        accept: Optional[Callable[[Any], :class:`bool`]]
+            The function deciding whether a cached response can be returned, regardless
+            of its age. Defaults to ``None``, which uses :attr:`ttl` and :attr:`max_stale`.
+        final: Optional[Callable[[Any], :class:`bool`]]
+            The function deciding whether an expired response can't change anymore, so
+            it's returned without refreshing it. Only used without ``accept``.
+
+        Returns
+        --------
+        Any
+            The response.
+        """
+        entry = self._entries.get(key)
+        if accept is not None:
+            if entry is not None and accept(entry.data):
+                self.hits += 1
+                entry.hits += 1
+                self._entries.move_to_end(key)
+                return entry.data
+        elif entry is not None:
+            age = time.monotonic() - entry.stored
+            if age <= self.ttl:
+                self.hits += 1
+                entry.hits += 1
+                self._entries.move_to_end(key)
+                refresh_ahead = self.refresh_ahead
+                if (
+                    refresh_ahead is not None
+                    and age >= self.ttl * refresh_ahead
+                    and entry.hits >= self.hot_threshold
+                ):
+                    self._refresh(key, fetch)
+                return entry.data
+
+            if final is not None and final(entry.data):
+                self.hits += 1
+                entry.hits += 1
+                self._entries.move_to_end(key)
+                return entry.data
+
+            if age <= self.ttl + self.max_stale:
+                self.stale_hits += 1
+                entry.hits += 1
+                self._entries.move_to_end(key)
+                self._refresh(key, fetch)
+                return entry.data
+
+        self.misses += 1
+        # shielded, so a cancelled caller doesn't cancel the call shared with others
+        return await asyncio.shield(self._fetch(key, fetch))
+
+    def peek(
+        self,
+        key: Hashable,
+        *,
+        accept: Optional[Callable[[Any], bool]] = None,
+        final: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """Returns the cached response of a key without calling the API.
+
+        Unlike :meth:`get`, an expired response is not refreshed.
+
+        Parameters
+        -----------
+        key: :class:`collections.abc.Hashable`
+            The key of the response.
+        accept: Optional[Callable[[Any], :class:`bool`]]
+            The function deciding whether a cached response can be returned, regardless
+            of its age. Defaults to ``None``, which uses :attr:`ttl` and :attr:`max_stale`.
+        final: Optional[Callable[[Any], :class:`bool`]]
+            The function deciding whether an expired response can't change anymore, so
+            it's returned regardless of its age. Only used without ``accept``.
+
+        Returns
+        --------
+        Any
+            The response, or ``MISSING`` if there is no acceptable one.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            if accept is not None:
+                usable = accept(entry.data)
+            else:
+                usable = time.monotonic() - entry.stored <= self.ttl + self.max_stale or (
+                    final is not None and final(entry.data)
+                )
+
+            if usable:
+                self.hits += 1
+                entry.hits += 1
+                self._entries.move_to_end(key)
+                return entry.data
+
+        self.misses += 1
+        return MISSING
+
+    def invalidate(self, key: Hashable) -> None:
+        """Removes the cached response of a key.
+
+        Parameters
+        -----------
+        key: :class:`collections.abc.Hashable`
+            The key of the response.
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes all cached responses and cancels the running refreshes."""
+        self._entries.clear()
+        for task in self._pending.values():
+            task.cancel()
+        self._pending.clear()
+
+
+class NegativeCache:
+    """Represents an in-memory cache of API calls which failed due to invalid input.
+
+    These are calls rejected with the status code 400 or 404, e.g. for an unknown
+    currency pair, and empty responses, e.g. for an unknown ticker. Repeating such a
+    call within :attr:`ttl` fails again immediately, with the same outcome but without
+    an API call. Other failures, e.g. server errors or rate limits, are never cached.
+
+    This is usually created by the :class:`Client` if ``negative_cache_ttl`` is passed
+    and then available with :attr:`Client.negative_cache`.
+
+    .. container:: operations
+
+        .. describe:: len(x)
+
+            Returns the number of cached failures.
+
+    Attributes
+    -----------
+    ttl: :class:`float`
+        The time in seconds a failure is cached.
+    max_size: :class:`int`
+        The maximum number of cached failures. The oldest ones are evicted.
+    hits: :class:`int`
+        The number of calls which failed without an API call.
+    """
+
+    STATUSES: ClassVar[Tuple[int, ...]] = (400, 404)
+
+    def __init__(self, *, ttl: float, max_size: int = 1024):
+        self.ttl: float = ttl
+        self.max_size: int = max_size
+        self.hits: int = 0
+        # key -> (time stored, exception or empty response)
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = collections.OrderedDict()
+
+    def __repr__(self) -> str:
+        return f"<NegativeCache ttl={self.ttl} size={len(self._entries)}>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        """Returns the cached outcome of a failed call, or ``MISSING`` if there is none.
+
+        Parameters
+        -----------
+        key: :class:`collections.abc.Hashable`
+            The key of the call.
+
+        Returns
+        --------
+        Any
+            The exception raised or the empty response returned by the call.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+        if time.monotonic() - entry[0] > self.ttl:
+            del self._entries[key]
+            return MISSING
+
+        self.hits += 1
+        return entry[1]
+
+    def add(self, key: Hashable, outcome: Any) -> None:
+        """Caches the outcome of a failed call.
+
+        Parameters
+        -----------
+        key: :class:`collections.abc.Hashable`
+            The key of the call.
+        outcome: Any
+            The exception raised or the empty response returned by the call.
+        """
+        entries = self._entries
+        entries.pop(key, None)
+        entries[key] = (time.monotonic(), outcome)
+        while len(entries) > self.max_size:
+            entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Removes the cached failure of a call.
+
+        Parameters
+        -----------
+        key: :class:`collections.abc.Hashable`
+            The key of the call.
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes all cached failures."""
+        self._entries.clear()
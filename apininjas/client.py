@@ -24,9 +24,30 @@ SOFTWARE.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List
+import array
+import asyncio
+import contextlib
+import os
+import weakref
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from .http import HTTPClient
+from .access import AccessRecorder
+from .cache import NegativeCache, ResponseCache
+from .currency import CurrencyGraph
 from .finance import (
     Stock,
     Commodity,
@@ -38,12 +59,18 @@ from .finance import (
     Inflation,
 )
 from .enums import CommodityType, InflationCountry, InflationIndicatorType
-from .errors import StockNotFound
-from .utils import MISSING
+from .errors import StockNotFound, CryptoNotFound
+from .iban import validate_with_bank_details
+from .inflation import InflationDataset, InflationSnapshot, payloads_to_columns
+from .symbols import CryptoSymbolIndex
+from .utils import MISSING, import_optional
 
 if TYPE_CHECKING:
     from typing_extensions import Self
 
+    from .utils import ColumnarFormat
+
+T = TypeVar("T")
 
 # fmt: off
 __all__ = (
@@ -65,13 +92,133 @@ class Client:
     -----------
     api_key: :class:`str`
         The API key to authenticate.
+    skip_closed_markets: :class:`bool`
+        Whether :meth:`.FinancialInstrument.update` should skip the API call if the exchange
+        has been closed ever since the price was updated by the API. Such prices also never
+        expire in the :attr:`cache` and are always recent enough for a ``max_age``.
+        Defaults to ``True``.
+    currency_pivots: Optional[Sequence[:class:`str`]]
+        The pivot currencies of the :attr:`currency_graph`, e.g. ``["USD", "EUR"]``.
+        If passed, exchange rates are derived locally from the rates against the pivots
+        whenever possible. Defaults to ``None``, which disables the graph.
+    currency_max_age: :class:`float`
+        The maximum age in seconds of a cached exchange rate in the :attr:`currency_graph`.
+        Defaults to ``60``.
+    triangulation_tolerance: :class:`float`
+        The maximum allowed relative error of a rate derived by the :attr:`currency_graph`.
+        Defaults to ``1e-4``.
+    inflation_max_age: Optional[:class:`float`]
+        The maximum age in seconds of an :class:`InflationDataset` until it's loaded again.
+        If passed, :meth:`fetch_inflation` and :meth:`fetch_inflations` are served from
+        the dataset, which is loaded with a single API call per indicator type.
+        Defaults to ``None``, which disables this.
+    validate_crypto_symbols: :class:`bool`
+        Whether :meth:`fetch_crypto` should reject unknown symbols locally using the
+        :class:`CryptoSymbolIndex`, instead of making an API call. Defaults to ``False``.
+    identity_map: :class:`bool`
+        Whether fetching an instrument or currency which is still referenced elsewhere
+        should update and return the existing object instead of creating a new one.
+        The objects are only weakly referenced. Defaults to ``False``.
+    price_history: Optional[:class:`int`]
+        The capacity of the :class:`~apininjas.PriceHistory` which records the prices of every
+        instrument, see :meth:`.FinancialInstrument.track_history`. Defaults to ``None``,
+        which only records the prices of instruments which track their history explicitly.
+    cache_ttl: Optional[:class:`float`]
+        The time in seconds a response of the API is fresh in the :attr:`cache`.
+        Defaults to ``None``, which disables the cache.
+    cache_max_stale: :class:`float`
+        The time in seconds an expired response in the :attr:`cache` may still be returned
+        while it's retrieved again in the background. Defaults to ``0``.
+    cache_refresh_ahead: Optional[:class:`float`]
+        The fraction of ``cache_ttl`` after which frequently requested responses in the
+        :attr:`cache` are retrieved again in the background, e.g. ``0.8``. Defaults to ``None``,
+        which disables this.
+    cache_size: :class:`int`
+        The maximum number of responses in the :attr:`cache`. Defaults to ``4096``.
+    negative_cache_ttl: Optional[:class:`float`]
+        The time in seconds a call which failed due to invalid input, e.g. an unknown
+        ticker, is cached in the :attr:`negative_cache`. Defaults to ``None``, which
+        disables the negative cache.
+    negative_cache_size: :class:`int`
+        The maximum number of failed calls in the :attr:`negative_cache`. Defaults to ``1024``.
+    cache_only: :class:`bool`
+        Whether every call is served exclusively from the :attr:`cache` and the
+        :attr:`negative_cache`, without ever waiting for the API. Calls with a ``max_age``
+        are also served by an object of the ``identity_map`` which is recent enough.
+        A call which can't be served raises :exc:`CacheMiss`. See also :meth:`cache_only`
+        to enable this temporarily. Defaults to ``False``.
+    access_log: Optional[Union[:class:`str`, :class:`os.PathLike`]]
+        The JSON file the :attr:`access_recorder` persists the frequency of every call to,
+        for :meth:`warmup`. Defaults to ``None``, which disables recording.
+    access_log_interval: :class:`float`
+        The time in seconds between two writes of the ``access_log``. Defaults to ``60``.
     """
 
-    __slots__ = ("_http", "_is_closed")
-
-    def __init__(self, api_key: str):
-        self._http: HTTPClient = HTTPClient(api_key)
+    __slots__ = (
+        "_http",
+        "_is_closed",
+        "_inflation_max_age",
+        "_inflation_datasets",
+        "_crypto_symbols",
+        "_validate_crypto_symbols",
+        "_identities",
+    )
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        skip_closed_markets: bool = True,
+        currency_pivots: Optional[Sequence[str]] = None,
+        currency_max_age: float = 60.0,
+        triangulation_tolerance: float = 1e-4,
+        inflation_max_age: Optional[float] = None,
+        validate_crypto_symbols: bool = False,
+        identity_map: bool = False,
+        price_history: Optional[int] = None,
+        cache_ttl: Optional[float] = None,
+        cache_max_stale: float = 0.0,
+        cache_refresh_ahead: Optional[float] = None,
+        cache_size: int = 4096,
+        negative_cache_ttl: Optional[float] = None,
+        negative_cache_size: int = 1024,
+        cache_only: bool = False,
+        access_log: Optional[Union[str, os.PathLike[str]]] = None,
+        access_log_interval: float = 60.0,
+    ):
+        self._http: HTTPClient = HTTPClient(api_key, skip_closed_markets=skip_closed_markets)
+        self._http.price_history = price_history
+        self._http.cache_only = cache_only
         self._is_closed: bool = False
+        self._inflation_max_age: Optional[float] = inflation_max_age
+        self._inflation_datasets: Dict[Optional[InflationIndicatorType], InflationDataset] = {}
+        self._crypto_symbols: CryptoSymbolIndex = CryptoSymbolIndex(self._http)
+        self._validate_crypto_symbols: bool = validate_crypto_symbols
+        self._identities: Optional[weakref.WeakValueDictionary[Hashable, Any]] = (
+            weakref.WeakValueDictionary() if identity_map else None
+        )
+
+        if cache_ttl is not None:
+            self._http.cache = ResponseCache(
+                ttl=cache_ttl,
+                max_stale=cache_max_stale,
+                refresh_ahead=cache_refresh_ahead,
+                max_size=cache_size,
+            )
+
+        if negative_cache_ttl is not None:
+            self._http.negative_cache = NegativeCache(ttl=negative_cache_ttl, max_size=negative_cache_size)
+
+        if access_log is not None:
+            self._http.access_recorder = AccessRecorder(access_log, interval=access_log_interval)
+
+        if currency_pivots:
+            self._http.currency_graph = CurrencyGraph(
+                self._http,
+                pivots=currency_pivots,
+                max_age=currency_max_age,
+                tolerance=triangulation_tolerance,
+            )
 
     async def __aenter__(self) -> Self:
         return self
@@ -79,6 +226,151 @@ class Client:
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         await self.close()
 
+    @property
+    def currency_graph(self) -> Optional[CurrencyGraph]:
+        """Optional[:class:`CurrencyGraph`]: The graph used to derive exchange rates locally.
+
+        ``None`` if no ``currency_pivots`` were passed.
+        """
+        return self._http.currency_graph
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        """Optional[:class:`ResponseCache`]: The cache of the responses of the API.
+
+        ``None`` if no ``cache_ttl`` was passed.
+        """
+        return self._http.cache
+
+    @property
+    def negative_cache(self) -> Optional[NegativeCache]:
+        """Optional[:class:`NegativeCache`]: The cache of the calls which failed due to invalid input.
+
+        ``None`` if no ``negative_cache_ttl`` was passed.
+        """
+        return self._http.negative_cache
+
+    @property
+    def access_recorder(self) -> Optional[AccessRecorder]:
+        """Optional[:class:`AccessRecorder`]: The recorder of the frequency of every call.
+
+        ``None`` if no ``access_log`` was passed.
+        """
+        return self._http.access_recorder
+
+    async def warmup(self, *, top: int = 100, rate: float = 10.0, connections: int = 4) -> int:
+        """|coro|
+
+        Prepares the client to serve calls quickly, e.g. right after starting and before
+        serving traffic.
+
+        This opens pooled connections to the API, so later calls don't pay for resolving
+        the host and the TLS handshake, and retrieves the most frequent calls recorded by
+        the :attr:`access_recorder` into the :attr:`cache`.
+
+        .. note::
+
+            This makes an API call per prefetched call. Without a :attr:`cache`, nothing
+            is prefetched. Calls whose failure is still stored in the :attr:`negative_cache`
+            are skipped.
+
+        Parameters
+        -----------
+        top: :class:`int`
+            The maximum number of recorded calls to prefetch. Defaults to ``100``.
+        rate: :class:`float`
+            The maximum number of calls started per second. Defaults to ``10``.
+        connections: :class:`int`
+            The number of connections to open. Defaults to ``4``.
+
+        Returns
+        --------
+        :class:`int`
+            The number of calls which were prefetched successfully.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+
+        await self._http.open_connections(connections)
+
+        recorder = self._http.access_recorder
+        if recorder is None or self._http.cache is None:
+            return 0
+        return await self._http.prefetch(recorder.top(top), rate=rate)
+
+    def _resolve(self, key: Hashable, create: Callable[[], T], update: Callable[[T], None]) -> T:
+        # returns the live object for the key updated in place, or a newly created one
+        identities = self._identities
+        if identities is None:
+            return create()
+
+        existing = identities.get(key)
+        if existing is not None:
+            update(existing)
+            return existing
+
+        created = create()
+        identities[key] = created
+        return created
+
+    def _held(self, key: Hashable, max_age: Optional[float]) -> Any:
+        # returns the live instrument for the key if its price is recent enough
+        if max_age is None or self._identities is None:
+            return None
+
+        existing = self._identities.get(key)
+        if existing is not None and existing._is_updated_within(max_age):
+            return existing
+        return None
+
+    @contextlib.contextmanager
+    def cache_only(self) -> Iterator[None]:
+        """Returns a context manager which serves the calls made within it exclusively from
+        the :attr:`cache` and the :attr:`negative_cache`, and calls with a ``max_age`` also
+        by an object of the ``identity_map`` which is recent enough.
+
+        A call which can't be served raises :exc:`CacheMiss` instead of waiting for the API.
+        This only applies to the current task and the tasks it creates, so other tasks
+        using the client aren't affected.
+
+        .. code-block:: python3
+
+            with client.cache_only():
+                stock = await client.fetch_stock("AAPL")
+        """
+        token = self._http.cache_only_context.set(True)
+        try:
+            yield
+        finally:
+            self._http.cache_only_context.reset(token)
+
+    @property
+    def cache_misses(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """List[Tuple[:class:`str`, Dict[:class:`str`, Any]]]: The URLs and query parameters of the
+        calls which raised :exc:`CacheMiss` and were not prefetched yet, oldest first.
+
+        At most the last ``1024`` are kept.
+        """
+        return [(route.url, params or {}) for route, params, _ in self._http.cache_misses.values()]
+
+    async def prefetch_cache_misses(self) -> int:
+        """|coro|
+
+        Retrieves the responses of the :attr:`cache_misses` and stores them in the :attr:`cache`,
+        e.g. periodically in a background task while serving calls in cache-only mode.
+
+        .. note::
+
+            This makes an API call per miss, even in cache-only mode. Misses whose failure
+            is still stored in the :attr:`negative_cache` are skipped.
+
+        Returns
+        --------
+        :class:`int`
+            The number of misses which were retrieved successfully.
+        """
+        return await self._http.prefetch_cache_misses()
+
     def is_closed(self) -> bool:
         """:class:`bool`: Whether the client is closed or not."""
         return self._is_closed
@@ -90,9 +382,10 @@ class Client:
         """
         if not self.is_closed():
             self._is_closed = True
+            self._crypto_symbols.close()
             await self._http.close()
 
-    async def fetch_stock(self, ticker: str) -> Stock:
+    async def fetch_stock(self, ticker: str, *, max_age: Optional[float] = None) -> Stock:
         """|coro|
 
         Retrieves a :class:`Stock` with the specified ticker.
@@ -101,6 +394,10 @@ class Client:
         -----------
         ticker: :class:`str`
             The ticker to fetch from.
+        max_age: Optional[:class:`float`]
+            The maximum time in seconds since :attr:`.Stock.updated_at` of an acceptable price.
+            If passed, a stock held by the ``identity_map`` or a response in the :attr:`cache`
+            is returned without an API call if it's recent enough. Defaults to ``None``.
 
         Raises
         -------
@@ -114,13 +411,21 @@ class Client:
         :class:`Stock`
             The retrieved stock.
         """
-        data = await self._http.get_stock(ticker=ticker)
+        held = self._held(("stock", ticker.upper()), max_age)
+        if held is not None:
+            return held
+
+        data = await self._http.get_stock(ticker=ticker, max_age=max_age)
         if data:
-            return Stock(http=self._http, data=data)
+            return self._resolve(
+                ("stock", ticker.upper()),
+                lambda: Stock(http=self._http, data=data),
+                lambda stock: stock._update(data=data),
+            )
         else:
             raise StockNotFound(f"stock with ticker '{ticker}' could not be found")
 
-    async def fetch_commodity(self, type: CommodityType) -> Commodity:
+    async def fetch_commodity(self, type: CommodityType, *, max_age: Optional[float] = None) -> Commodity:
         """|coro|
 
         Retrieves a :class:`Commodity` with the specified type.
@@ -129,6 +434,10 @@ class Client:
         -----------
         type: :class:`CommodityType`
             The type of the commodity to fetch from.
+        max_age: Optional[:class:`float`]
+            The maximum time in seconds since :attr:`.Commodity.updated_at` of an acceptable price.
+            If passed, a commodity held by the ``identity_map`` or a response in the :attr:`cache`
+            is returned without an API call if it's recent enough. Defaults to ``None``.
 
         Raises
         -------
@@ -140,14 +449,22 @@ class Client:
         :class:`Commodity`
             The retrieved commodity.
         """
+        held = self._held(("commodity", type), max_age)
+        if held is not None:
+            return held
+
         if type == CommodityType.gold:
-            data = await self._http.get_gold()
+            data = await self._http.get_gold(max_age=max_age)
         else:
-            data = await self._http.get_commodity(name=type.value)
+            data = await self._http.get_commodity(name=type.value, max_age=max_age)
 
-        return Commodity(http=self._http, type=type, data=data)
+        return self._resolve(
+            ("commodity", type),
+            lambda: Commodity(http=self._http, type=type, data=data),
+            lambda commodity: commodity._update(data=data),
+        )
 
-    async def fetch_crypto(self, symbol: str) -> Crypto:
+    async def fetch_crypto(self, symbol: str, *, max_age: Optional[float] = None) -> Crypto:
         """|coro|
 
         Retrieves a :class:`Crypto` with the specified symbol.
@@ -156,9 +473,15 @@ class Client:
         -----------
         symbol: :class:`str`
             The symbol to fetch from.
+        max_age: Optional[:class:`float`]
+            The maximum time in seconds since :attr:`.Crypto.updated_at` of an acceptable price.
+            If passed, a cryptocurrency held by the ``identity_map`` or a response in the
+            :attr:`cache` is returned without an API call if it's recent enough. Defaults to ``None``.
 
         Raises
         -------
+        CryptoNotFound
+            The symbol is not available. Only raised if ``validate_crypto_symbols`` is enabled.
         HTTPException
             Retrieving the cryptocurrency failed.
 
@@ -167,8 +490,21 @@ class Client:
         :class:`Crypto`
             The retrieved cryptocurrency.
         """
-        data = await self._http.get_crypto(symbol=symbol)
-        return Crypto(http=self._http, data=data)
+        if self._validate_crypto_symbols:
+            await self._crypto_symbols.ensure_loaded()
+            if symbol not in self._crypto_symbols:
+                raise CryptoNotFound(f"cryptocurrency with symbol '{symbol}' could not be found")
+
+        held = self._held(("crypto", symbol.upper()), max_age)
+        if held is not None:
+            return held
+
+        data = await self._http.get_crypto(symbol=symbol, max_age=max_age)
+        return self._resolve(
+            ("crypto", symbol.upper()),
+            lambda: Crypto(http=self._http, data=data),
+            lambda crypto: crypto._update(data=data),
+        )
 
     async def fetch_crypto_symbols(self) -> List[str]:
         """|coro|
@@ -188,6 +524,30 @@ class Client:
         data = await self._http.get_crypto_symbols()
         return data["symbols"]
 
+    async def fetch_crypto_symbol_index(self) -> CryptoSymbolIndex:
+        """|coro|
+
+        Retrieves the :class:`CryptoSymbolIndex` of all available cryptocurrency symbols.
+
+        The index is kept by the client and refreshed in the background once it's stale.
+
+        .. note::
+
+            This makes an API call the first time.
+
+        Raises
+        -------
+        HTTPException
+            Retrieving the symbols failed.
+
+        Returns
+        --------
+        :class:`CryptoSymbolIndex`
+            The index of available symbols.
+        """
+        await self._crypto_symbols.ensure_loaded()
+        return self._crypto_symbols
+
     async def fetch_currency_conversion(
         self,
         *,
@@ -245,11 +605,92 @@ class Client:
 
         return CurrencyConversion(old=old_currency_with_amount, new=new_currency_with_amount)
 
+    async def convert_currencies(
+        self,
+        amounts: Sequence[float],
+        *,
+        have: Union[str, Sequence[str]],
+        want: Union[str, Sequence[str]],
+    ) -> Any:
+        """|coro|
+
+        Converts many amounts at once, retrieving each distinct exchange rate only once.
+
+        The rates are applied in a single vectorized pass if :mod:`numpy` is installed.
+
+        .. note::
+
+            This makes one API call per distinct currency pair, or less if a
+            :attr:`currency_graph` is set up. The rates are the ones of :meth:`fetch_currency`.
+
+        Parameters
+        ----------
+        amounts: Sequence[:class:`float`]
+            The amounts to convert, e.g. a list or a :class:`numpy.ndarray`.
+        have: Union[:class:`str`, Sequence[:class:`str`]]
+            The currency name to convert from, either one for all amounts or one per amount.
+        want: Union[:class:`str`, Sequence[:class:`str`]]
+            The currency name to convert to, either one for all amounts or one per amount.
+
+        Raises
+        -------
+        ValueError
+            The number of currency names doesn't match the number of amounts.
+        HTTPException
+            Retrieving an exchange rate failed.
+
+        Returns
+        -------
+        Union[:class:`numpy.ndarray`, :class:`array.array`]
+            The converted amounts as a float64 array, or as an :class:`array.array` of
+            doubles if :mod:`numpy` is not installed.
+        """
+        size = len(amounts)
+        for names in (have, want):
+            if not isinstance(names, str) and len(names) != size:
+                raise ValueError("the number of currency names must match the number of amounts")
+
+        np = import_optional("numpy")
+        if np is None:
+            haves = [have] * size if isinstance(have, str) else have
+            wants = [want] * size if isinstance(want, str) else want
+            indices: Dict[Tuple[str, str], int] = {}
+            codes = [indices.setdefault(pair, len(indices)) for pair in zip(haves, wants)]
+            rates = await self._fetch_rates(list(indices))
+            return array.array("d", [amount * rates[code] for amount, code in zip(amounts, codes)])
+
+        def factorize(names: Union[str, Sequence[str]]) -> Tuple[Any, Any]:
+            if isinstance(names, str):
+                return np.array([names]), np.zeros(size, dtype=np.intp)
+            return np.unique(np.asarray(names), return_inverse=True)
+
+        have_names, have_codes = factorize(have)
+        want_names, want_codes = factorize(want)
+        pair_codes, inverse = np.unique(have_codes * len(want_names) + want_codes, return_inverse=True)
+        pairs = [
+            (str(have_names[c // len(want_names)]), str(want_names[c % len(want_names)])) for c in pair_codes
+        ]
+
+        rates = np.asarray(await self._fetch_rates(pairs), dtype=np.float64)
+        return np.asarray(amounts, dtype=np.float64) * rates[inverse]
+
+    async def _fetch_rates(self, pairs: List[Tuple[str, str]]) -> List[float]:
+        async def fetch_rate(have: str, want: str) -> float:
+            if have.upper() == want.upper():
+                return 1.0
+            currency = await self.fetch_currency(want, reference=have)
+            return currency.exchange_rate
+
+        return await asyncio.gather(*(fetch_rate(have, want) for have, want in pairs))
+
     async def fetch_currency(self, name: str, *, reference: str) -> Currency:
         """|coro|
 
         Retrieves a :class:`Currency` with the specified name and reference.
 
+        If a :attr:`currency_graph` is set up, the exchange rate is derived from fresh
+        cached rates whenever possible instead of making an API call.
+
         Parameters
         ----------
         name: :class:`str`
@@ -267,16 +708,20 @@ class Client:
         :class:`Currency`
             The retrieved currency.
         """
-
-        pair = f"{reference}_{name}"
-        data = await self._http.get_exchange_rate(pair=pair)
-        currencies = data["currency_pair"].split("_")
-
-        return Currency(
-            http=self._http,
-            name=currencies[1],
-            exchange_rate=data["exchange_rate"],
-            reference=currencies[0],
+        graph = self._http.currency_graph
+        if graph is not None:
+            rate = await graph.fetch_rate(reference, name)
+            reference, name = reference.upper(), name.upper()
+        else:
+            pair = f"{reference}_{name}"
+            data = await self._http.get_exchange_rate(pair=pair)
+            reference, name = data["currency_pair"].split("_")
+            rate = data["exchange_rate"]
+
+        return self._resolve(
+            ("currency", name.upper(), reference.upper()),
+            lambda: Currency(http=self._http, name=name, exchange_rate=rate, reference=reference),
+            lambda currency: currency._update(exchange_rate=rate),
         )
 
     async def fetch_iban_validation(self, iban: str) -> IBANValidation:
@@ -302,6 +747,52 @@ class Client:
         data = await self._http.get_iban_validation(iban=iban)
         return IBANValidation(data=data)
 
+    async def validate_ibans(
+        self,
+        ibans: Sequence[str],
+        *,
+        bank_names: bool = False,
+        concurrency: int = 10,
+        format: ColumnarFormat = MISSING,
+    ) -> Union[List[IBANValidation], Any]:
+        """|coro|
+
+        Validates many IBANs, locally wherever possible.
+
+        Every IBAN is validated locally like :func:`validate_ibans`. Only if ``bank_names``
+        is ``True``, the valid ones are retrieved from the API to fill in the bank details,
+        each distinct IBAN only once.
+        An IBAN whose retrieval failed keeps its local validation with empty bank details.
+
+        Parameters
+        ----------
+        ibans: Sequence[:class:`str`]
+            The IBANs to validate.
+        bank_names: :class:`bool`
+            Whether to retrieve the bank details of valid IBANs from the API. Defaults to ``False``.
+        concurrency: :class:`int`
+            The maximum number of concurrent API calls. Defaults to ``10``.
+        format: :class:`str`
+            If passed, the validations are returned column-wise without creating an
+            :class:`IBANValidation` per IBAN. ``numpy`` for a :class:`dict` of
+            :class:`numpy.ndarray`, ``pandas`` for a :class:`pandas.DataFrame` or ``arrow``
+            for a :class:`pyarrow.Table`. The columns are named like the attributes
+            of :class:`IBANValidation`.
+
+        Raises
+        -------
+        RuntimeError
+            The library required for the ``format`` is not installed.
+
+        Returns
+        -------
+        Union[List[:class:`IBANValidation`], Dict[:class:`str`, :class:`numpy.ndarray`], :class:`pandas.DataFrame`, :class:`pyarrow.Table`]
+            The IBAN validations, in the order the IBANs were passed.
+        """
+        return await validate_with_bank_details(
+            self._http, ibans, bank_names=bank_names, concurrency=concurrency, format=format
+        )
+
     async def fetch_inflation(
         self, country: InflationCountry, *, type: InflationIndicatorType = MISSING
     ) -> Inflation:
@@ -309,6 +800,9 @@ class Client:
 
         Retrieves an :class:`Inflation` with the specified country.
 
+        If ``inflation_max_age`` is set, this is served from the :class:`InflationDataset`
+        of the indicator type, see :meth:`fetch_inflation_dataset`.
+
         Parameters
         ----------
         country: :class:`str`
@@ -326,6 +820,12 @@ class Client:
         :class:`Inflation`
             The retrieved inflation.
         """
+        if self._inflation_max_age is not None:
+            dataset = await self.fetch_inflation_dataset(type=type)
+            inflation = dataset.get(country)
+            if inflation is not None:
+                return inflation
+
         fields = {"country": country.value}
         if type is not MISSING:
             fields["type"] = type.value
@@ -333,29 +833,125 @@ class Client:
         data = await self._http.get_inflation(**fields)
         return Inflation(data=data[0])
 
-    async def fetch_inflations(self, *, type: InflationIndicatorType = MISSING) -> List[Inflation]:
+    async def fetch_inflations(
+        self, *, type: InflationIndicatorType = MISSING, format: ColumnarFormat = MISSING
+    ) -> Union[List[Inflation], Any]:
         """|coro|
 
         Retrieves a list of available :class:`Inflation`.
 
+        If ``inflation_max_age`` is set, this is served from the :class:`InflationDataset`
+        of the indicator type, see :meth:`fetch_inflation_dataset`.
+
         Parameters
         ----------
         type: :class:`InflationIndicatorType`
             The inflation indicator type.
+        format: :class:`str`
+            If passed, the inflations are returned column-wise without creating an
+            :class:`Inflation` per row, see :meth:`InflationDataset.to_columns`.
 
         Raises
         -------
         HTTPException
             Retrieving the inflation failed.
+        RuntimeError
+            The library required for the ``format`` is not installed.
 
         Returns
         -------
-        List[:class:`Inflation`]
+        Union[List[:class:`Inflation`], Dict[:class:`str`, :class:`numpy.ndarray`], :class:`pandas.DataFrame`, :class:`pyarrow.Table`]
             The retrieved list of available inflation.
         """
+        if self._inflation_max_age is not None:
+            dataset = await self.fetch_inflation_dataset(type=type)
+            if format is not MISSING:
+                return dataset.to_columns(format)
+            return list(dataset)
+
         fields = {}
         if type is not MISSING:
             fields["type"] = type.value
 
         data = await self._http.get_inflation(**fields)
+        if format is not MISSING:
+            return payloads_to_columns(data, format)
         return [Inflation(data=inflation) for inflation in data]
+
+    async def fetch_inflation_changes(
+        self, snapshot: InflationSnapshot, *, type: InflationIndicatorType = MISSING, commit: bool = True
+    ) -> List[Inflation]:
+        """|coro|
+
+        Retrieves the list of :class:`Inflation` which were added or changed since the
+        last call with the given snapshot.
+
+        Only the changed inflations are constructed, so the work after the API call
+        scales with the number of changes rather than the number of inflations.
+
+        .. note::
+
+            This always makes an API call.
+
+        Parameters
+        ----------
+        snapshot: :class:`InflationSnapshot`
+            The snapshot to compare against, which is updated afterwards.
+        type: :class:`InflationIndicatorType`
+            The inflation indicator type.
+        commit: :class:`bool`
+            Whether to update and save the snapshot. Defaults to ``True``.
+
+        Raises
+        -------
+        HTTPException
+            Retrieving the inflation failed.
+
+        Returns
+        -------
+        List[:class:`Inflation`]
+            The added or changed inflations.
+        """
+        fields = {}
+        if type is not MISSING:
+            fields["type"] = type.value
+
+        data = await self._http.get_inflation(**fields)
+        return snapshot._diff(data, commit=commit)
+
+    async def fetch_inflation_dataset(self, *, type: InflationIndicatorType = MISSING) -> InflationDataset:
+        """|coro|
+
+        Retrieves an :class:`InflationDataset` containing every available :class:`Inflation`.
+
+        The dataset is kept by the client and only loaded again once it's older than
+        ``inflation_max_age``, or an hour if that's not set.
+
+        .. note::
+
+            This makes an API call if the dataset is stale.
+
+        Parameters
+        ----------
+        type: :class:`InflationIndicatorType`
+            The inflation indicator type. Defaults to all types.
+
+        Raises
+        -------
+        HTTPException
+            Retrieving the inflation failed.
+
+        Returns
+        -------
+        :class:`InflationDataset`
+            The retrieved dataset.
+        """
+        key = type or None
+        dataset = self._inflation_datasets.get(key)
+        if dataset is None:
+            max_age = self._inflation_max_age if self._inflation_max_age is not None else 3600.0
+            dataset = InflationDataset(self._http, type=type, max_age=max_age)
+            self._inflation_datasets[key] = dataset
+
+        await dataset.refresh()
+        return dataset
@@ -0,0 +1,309 @@
+"""
+MIT License
+
+Copyright (c) 2024-present codeofandrin
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .errors import HTTPException
+
+if TYPE_CHECKING:
+    from .http import HTTPClient
+
+
+# fmt: off
+__all__ = (
+    "CurrencyGraph",
+)
+# fmt: on
+
+
+class CurrencyGraph:
+    """Represents a graph of exchange rates which derives cross rates locally.
+
+    Only the pairs of each currency against a pivot currency are retrieved from the API,
+    using the first pivot which supports the currency. Every other rate is derived by
+    composing the cached rates along a path through the graph, so a matrix of ``n``
+    currencies costs ``n - 1`` API calls instead of ``n * (n - 1)``.
+
+    A derived rate is only used if every rate along its path is younger than ``max_age``.
+    If it can be derived along multiple paths which disagree by more than ``tolerance``,
+    or a previously retrieved direct rate deviated by more than ``tolerance`` from the
+    derived one, the pair is retrieved directly instead.
+
+    This is usually created by the :class:`Client` if ``currency_pivots`` is passed
+    and then available with :attr:`Client.currency_graph`.
+
+    Attributes
+    -----------
+    pivots: Tuple[:class:`str`, ...]
+        The pivot currencies, in order of preference.
+    max_age: :class:`float`
+        The maximum age of a rate in seconds until it's retrieved again.
+    tolerance: :class:`float`
+        The maximum allowed relative error of a derived rate.
+    max_hops: :class:`int`
+        The maximum number of rates composed into a derived rate.
+    """
+
+    def __init__(
+        self,
+        http: HTTPClient,
+        *,
+        pivots: Sequence[str] = ("USD",),
+        max_age: float = 60.0,
+        tolerance: float = 1e-4,
+        max_hops: int = 3,
+    ):
+        if not pivots:
+            raise ValueError("at least one pivot currency is required")
+
+        self._http: HTTPClient = http
+        self.pivots: Tuple[str, ...] = tuple(p.upper() for p in pivots)
+        self.max_age: float = max_age
+        self.tolerance: float = tolerance
+        self.max_hops: int = max_hops
+
+        # base -> quote -> (rate, retrieved at), where rate is the amount of quote per base
+        self._edges: Dict[str, Dict[str, Tuple[float, float]]] = {}
+        # pairs which can't be derived within the tolerance
+        self._direct_only: Set[Tuple[str, str]] = set()
+        self._pending: Dict[Tuple[str, str], asyncio.Task[float]] = {}
+
+    def __repr__(self) -> str:
+        return f"<CurrencyGraph pivots={self.pivots!r} currencies={len(self._edges)}>"
+
+    def add_rate(self, base: str, quote: str, rate: float, *, timestamp: Optional[float] = None) -> None:
+        """Adds a retrieved exchange rate to the graph.
+
+        Parameters
+        -----------
+        base: :class:`str`
+            The base currency, e.g. ``GBP``.
+        quote: :class:`str`
+            The quote currency, e.g. ``AUD``.
+        rate: :class:`float`
+            The amount of ``quote`` equivalent to one ``base``.
+        timestamp: Optional[:class:`float`]
+            The time the rate was retrieved at. Defaults to now.
+        """
+        if rate <= 0:
+            return
+
+        base, quote = base.upper(), quote.upper()
+        retrieved = time.time() if timestamp is None else timestamp
+
+        derived = self._derive(base, quote, exclude_direct=True)
+        if derived is not None:
+            if abs(derived - rate) / rate > self.tolerance:
+                self._direct_only.update(((base, quote), (quote, base)))
+            else:
+                self._direct_only.difference_update(((base, quote), (quote, base)))
+
+        self._edges.setdefault(base, {})[quote] = (rate, retrieved)
+        self._edges.setdefault(quote, {})[base] = (1 / rate, retrieved)
+
+    def _is_fresh(self, retrieved: float, now: float) -> bool:
+        return now - retrieved <= self.max_age
+
+    def _paths(self, base: str, quote: str, *, exclude_direct: bool) -> List[float]:
+        # rates of all shortest paths from base to quote using fresh rates only
+        now = time.time()
+        frontier: Dict[str, List[float]] = {base: [1.0]}
+        visited = {base}
+        for _ in range(self.max_hops):
+            following: Dict[str, List[float]] = {}
+            for currency, rates in frontier.items():
+                for neighbour, (rate, retrieved) in self._edges.get(currency, {}).items():
+                    if neighbour in visited or not self._is_fresh(retrieved, now):
+                        continue
+                    if exclude_direct and currency == base and neighbour == quote:
+                        continue
+                    following.setdefault(neighbour, []).extend(r * rate for r in rates)
+
+            if quote in following:
+                return following[quote]
+            if not following:
+                break
+
+            visited.update(following)
+            frontier = following
+
+        return []
+
+    def _derive(self, base: str, quote: str, *, exclude_direct: bool = False) -> Optional[float]:
+        rates = self._paths(base, quote, exclude_direct=exclude_direct)
+        if not rates:
+            return None
+
+        lowest, highest = min(rates), max(rates)
+        if (highest - lowest) / lowest > self.tolerance:
+            return None
+        return sum(rates) / len(rates)
+
+    def get_rate(self, base: str, quote: str) -> Optional[float]:
+        """Returns the exchange rate between two currencies without making an API call.
+
+        Parameters
+        -----------
+        base: :class:`str`
+            The base currency, e.g. ``GBP``.
+        quote: :class:`str`
+            The quote currency, e.g. ``AUD``.
+
+        Returns
+        --------
+        Optional[:class:`float`]
+            The amount of ``quote`` equivalent to one ``base`` or ``None`` if it can't be
+            derived from fresh rates within the tolerance.
+        """
+        base, quote = base.upper(), quote.upper()
+        if base == quote:
+            return 1.0
+
+        direct = self._edges.get(base, {}).get(quote)
+        if direct is not None and self._is_fresh(direct[1], time.time()):
+            return direct[0]
+        if (base, quote) in self._direct_only:
+            return None
+
+        return self._derive(base, quote)
+
+    async def _fetch_pair(self, base: str, quote: str) -> float:
+        key = (base, quote)
+        task = self._pending.get(key)
+        if task is None:
+            task = self._pending[key] = asyncio.ensure_future(self._call_pair(base, quote))
+            # the error is never retrieved otherwise if every caller was cancelled
+            task.add_done_callback(lambda task: task.cancelled() or task.exception())
+        # shielded, so a cancelled caller doesn't cancel the call shared with others
+        return await asyncio.shield(task)
+
+    async def _call_pair(self, base: str, quote: str) -> float:
+        try:
+            data = await self._http.get_exchange_rate(pair=f"{base}_{quote}")
+            rate = data["exchange_rate"]
+            self.add_rate(base, quote, rate)
+            return rate
+        finally:
+            del self._pending[(base, quote)]
+
+    def _missing(self, currencies: Iterable[str]) -> List[str]:
+        # currencies without a fresh rate against any pivot
+        now = time.time()
+        missing = []
+        for currency in dict.fromkeys(currencies):
+            if currency == self.pivots[0]:
+                continue
+            edges = self._edges.get(currency, {})
+            if not any(p in edges and self._is_fresh(edges[p][1], now) for p in self.pivots if p != currency):
+                missing.append(currency)
+        return missing
+
+    async def _fetch_pivot(self, currency: str) -> None:
+        # retrieve against the first pivot supporting the currency
+        pivots = [p for p in self.pivots if p != currency]
+        for pivot in pivots[:-1]:
+            try:
+                await self._fetch_pair(pivot, currency)
+                return
+            except HTTPException:
+                continue
+
+        await self._fetch_pair(pivots[-1], currency)
+
+    async def fetch_rate(self, base: str, quote: str) -> float:
+        """|coro|
+
+        Returns the exchange rate between two currencies, retrieving only the pivot pairs
+        required to derive it.
+
+        .. note::
+
+            This makes API calls if the rate can't be derived from fresh rates.
+
+        Parameters
+        -----------
+        base: :class:`str`
+            The base currency, e.g. ``GBP``.
+        quote: :class:`str`
+            The quote currency, e.g. ``AUD``.
+
+        Raises
+        -------
+        HTTPException
+            Retrieving an exchange rate failed.
+
+        Returns
+        --------
+        :class:`float`
+            The amount of ``quote`` equivalent to one ``base``.
+        """
+        base, quote = base.upper(), quote.upper()
+        rate = self.get_rate(base, quote)
+        if rate is not None:
+            return rate
+
+        if (base, quote) not in self._direct_only:
+            await asyncio.gather(*(self._fetch_pivot(c) for c in self._missing((base, quote))))
+
+            rate = self.get_rate(base, quote)
+            if rate is not None:
+                return rate
+
+        return await self._fetch_pair(base, quote)
+
+    async def fetch_matrix(self, currencies: Sequence[str]) -> Dict[Tuple[str, str], float]:
+        """|coro|
+
+        Returns the exchange rates between every pair of the given currencies.
+
+        .. note::
+
+            This makes at most one API call per currency, unless pairs need to be
+            retrieved directly because they can't be derived within the tolerance.
+
+        Parameters
+        -----------
+        currencies: Sequence[:class:`str`]
+            The currencies, e.g. ``["GBP", "AUD", "CHF"]``.
+
+        Raises
+        -------
+        HTTPException
+            Retrieving an exchange rate failed.
+
+        Returns
+        --------
+        Dict[Tuple[:class:`str`, :class:`str`], :class:`float`]
+            The amount of the second currency equivalent to one of the first, for every pair.
+        """
+        names = list(dict.fromkeys(c.upper() for c in currencies))
+        await asyncio.gather(*(self._fetch_pivot(c) for c in self._missing(names)))
+
+        pairs = [(base, quote) for base in names for quote in names if base != quote]
+        rates = await asyncio.gather(*(self.fetch_rate(base, quote) for base, quote in pairs))
+        return dict(zip(pairs, rates))
@@ -0,0 +1,67 @@
+"""
+MIT License
+
+Copyright (c) 2024-present codeofandrin
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+from typing import Any, Callable, Optional
+
+from .utils import import_optional
+
+
+Decoder = Callable[[bytes], Any]
+
+
+@functools.lru_cache(maxsize=None)
+def _typed_decoder(schema: Any) -> Optional[Decoder]:
+    msgspec = import_optional("msgspec")
+    if msgspec is None:
+        return None
+
+    # parses and validates against the TypedDicts in a single pass, without building
+    # untyped intermediate objects first
+    decoder = msgspec.json.Decoder(schema)
+    error = msgspec.ValidationError
+
+    def decode(body: bytes) -> Any:
+        try:
+            return decoder.decode(body)
+        except error:
+            # e.g. an empty list for a stock which could not be found
+            return json.loads(body)
+
+    return decode
+
+
+def get_decoder(schema: Any = None) -> Decoder:
+    """Returns the function to decode a JSON response body with.
+
+    If :mod:`msgspec` is installed and a schema is passed, the body is decoded and
+    validated against the schema in one pass. Bodies which don't match the schema
+    and every body without :mod:`msgspec` are decoded with :func:`json.loads`.
+    """
+    if schema is None:
+        return json.loads
+    return _typed_decoder(schema) or json.loads
@@ -35,6 +35,15 @@ __all__ = (
 
 
 class EnumMeta(enum.EnumMeta):
+    # the maximum number of interned fallback objects per enum, so untrusted input can't grow it unbounded
+    MAX_UNKNOWN_MEMBERS = 256
+
+    def __new__(mcls, *args, **kwargs):
+        cls = super().__new__(mcls, *args, **kwargs)
+        # fallback objects for invalid values, so the same value always returns the same object
+        cls._unknown_members = {}
+        return cls
+
     def __call__(cls, value, names=None, *, module=None, qualname=None, type=None, start=1):
         if names is not None:
             return super().__call__(
@@ -45,15 +54,36 @@ class EnumMeta(enum.EnumMeta):
                 type=type,
                 start=start,
             )
+
+        # look up the value directly instead of going through Enum.__new__
+        try:
+            return cls._value2member_map_[value]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable values can't be interned
+            return cls._fallback(value)
+
+        try:
+            return cls._unknown_members[value]
+        except KeyError:
+            pass
+
         try:
             return super().__call__(value)
         except ValueError:
             # return fallback object if value is invalid
-            obj = object.__new__(cls)  # type: ignore
-            obj._value_ = value
-            obj._name_ = f"unknown_{value}"
+            obj = cls._fallback(value)
+            if len(cls._unknown_members) < cls.MAX_UNKNOWN_MEMBERS:
+                cls._unknown_members[value] = obj
             return obj
 
+    def _fallback(cls, value):
+        obj = object.__new__(cls)  # type: ignore
+        obj._value_ = value
+        obj._name_ = f"unknown_{value}"
+        return obj
+
 
 class CommodityType(enum.Enum, metaclass=EnumMeta):
     gold = "gold"
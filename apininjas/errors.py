@@ -39,6 +39,8 @@ __all__ = (
     "MethodNotAllowed",
     "APINinjasServerError",
     "StockNotFound",
+    "CryptoNotFound",
+    "CacheMiss",
 )
 # fmt: on
 
@@ -130,3 +132,37 @@ class StockNotFound(ClientException):
     """
 
     pass
+
+
+class CryptoNotFound(ClientException):
+    """Exception that's raised when a requested cryptocurrency could not be found.
+
+    This exception is raised when the symbol is not available according to
+    the :class:`CryptoSymbolIndex`, without making an API call.
+
+    Derives from :exc:`ClientException`.
+    """
+
+    pass
+
+
+class CacheMiss(ClientException):
+    """Exception that's raised when a call can't be served from the cache in cache-only mode.
+
+    The call is recorded in :attr:`Client.cache_misses`, so it can be prefetched with
+    :meth:`Client.prefetch_cache_misses`.
+
+    Derives from :exc:`ClientException`.
+
+    Attributes
+    -----------
+    url: :class:`str`
+        The URL of the call.
+    params: Dict[:class:`str`, Any]
+        The query parameters of the call.
+    """
+
+    def __init__(self, url: str, params: Optional[Dict[str, Any]]):
+        self.url: str = url
+        self.params: Dict[str, Any] = params or {}
+        super().__init__(f"no cached response for {url} with {self.params}")
@@ -25,6 +25,7 @@ SOFTWARE.
 from __future__ import annotations
 
 import datetime
+import functools
 from typing import TYPE_CHECKING, Optional, Union, NamedTuple
 
 import apininjas.abc
@@ -51,6 +52,11 @@ __all__ = (
     "Currency",
     "IBANValidation",
     "Inflation",
+    "StockSnapshot",
+    "CommoditySnapshot",
+    "CryptoSnapshot",
+    "CurrencySnapshot",
+    "IBANValidationSnapshot",
 )
 # fmt: on
 
@@ -132,13 +138,37 @@ class Stock(apininjas.abc.FinancialInstrument):
     def __ne__(self, other: Stock) -> bool:
         return not self.__eq__(other)
 
+    def _exchange(self) -> Optional[str]:
+        return self.exchange
+
+    def _key(self) -> str:
+        return self.ticker
+
+    def _kind(self) -> str:
+        return "stock"
+
+    def snapshot(self) -> StockSnapshot:
+        """Returns an immutable and hashable snapshot of the stock's current state.
+
+        Returns
+        --------
+        :class:`StockSnapshot`
+            The snapshot.
+        """
+        return StockSnapshot(self.ticker, self.name, self.exchange, self.price, self._updated)
+
     def _update(self, *, data: StockPayload) -> None:
+        previous: Optional[float] = getattr(self, "price", None)
         self.price: float = data["price"]
         self._updated = data["updated"]
+        self._on_update(previous)
 
     @utils.copy_doc(apininjas.abc.FinancialInstrument.update)
-    async def update(self) -> float:
-        data = await self._http.get_stock(ticker=self.ticker)
+    async def update(self, *, max_age: Optional[float] = None) -> float:
+        if self._is_price_final() or self._is_updated_within(max_age):
+            return self.price
+
+        data = await self._http.get_stock(ticker=self.ticker, max_age=max_age)
         self._update(data=data)
 
         return self.price
@@ -224,13 +254,37 @@ class Commodity(apininjas.abc.FinancialInstrument):
     def __ne__(self, other: Commodity) -> bool:
         return not self.__eq__(other)
 
+    def _exchange(self) -> Optional[str]:
+        return self.exchange
+
+    def _key(self) -> str:
+        return self.type.value
+
+    def _kind(self) -> str:
+        return "commodity"
+
+    def snapshot(self) -> CommoditySnapshot:
+        """Returns an immutable and hashable snapshot of the commodity future's current state.
+
+        Returns
+        --------
+        :class:`CommoditySnapshot`
+            The snapshot.
+        """
+        return CommoditySnapshot(self.type, self.name, self.exchange, self.price, self._updated)
+
     def _update(self, *, data: Union[GoldPayload, CommodityPayload]) -> None:
+        previous: Optional[float] = getattr(self, "price", None)
         self.price: float = data["price"]
         self._updated = data["updated"]
+        self._on_update(previous)
 
     @utils.copy_doc(apininjas.abc.FinancialInstrument.update)
-    async def update(self) -> float:
-        data = await self._http.get_commodity(name=self.type.value)
+    async def update(self, *, max_age: Optional[float] = None) -> float:
+        if self._is_price_final() or self._is_updated_within(max_age):
+            return self.price
+
+        data = await self._http.get_commodity(name=self.type.value, max_age=max_age)
         self._update(data=data)
 
         return self.price
@@ -296,13 +350,34 @@ class Crypto(apininjas.abc.FinancialInstrument):
     def __ne__(self, other: Crypto) -> bool:
         return not self.__eq__(other)
 
+    def _key(self) -> str:
+        return self.symbol
+
+    def _kind(self) -> str:
+        return "crypto"
+
+    def snapshot(self) -> CryptoSnapshot:
+        """Returns an immutable and hashable snapshot of the cryptocurrency's current state.
+
+        Returns
+        --------
+        :class:`CryptoSnapshot`
+            The snapshot.
+        """
+        return CryptoSnapshot(self.symbol, self.price, self._updated)
+
     def _update(self, *, data: CryptoPayload) -> None:
+        previous: Optional[float] = getattr(self, "price", None)
         self.price: float = float(data["price"])
         self._updated = data["timestamp"]
+        self._on_update(previous)
 
     @utils.copy_doc(apininjas.abc.FinancialInstrument.update)
-    async def update(self) -> float:
-        data = await self._http.get_crypto(symbol=self.symbol)
+    async def update(self, *, max_age: Optional[float] = None) -> float:
+        if self._is_updated_within(max_age):
+            return self.price
+
+        data = await self._http.get_crypto(symbol=self.symbol, max_age=max_age)
         self._update(data=data)
 
         return self.price
@@ -335,7 +410,7 @@ class Currency:
         The name of the reference currency.
     """
 
-    __slots__ = ("_http", "name", "reference", "exchange_rate")
+    __slots__ = ("_http", "name", "reference", "exchange_rate", "__weakref__")
 
     def __init__(self, *, http: HTTPClient, name: str, exchange_rate: float, reference: str):
         self._http: HTTPClient = http
@@ -367,6 +442,16 @@ class Currency:
         """:class:`bool`: Whether the currency is stronger (more valuable) than its :attr:`reference`."""
         return self.exchange_rate < 1
 
+    def snapshot(self) -> CurrencySnapshot:
+        """Returns an immutable and hashable snapshot of the currency's current state.
+
+        Returns
+        --------
+        :class:`CurrencySnapshot`
+            The snapshot.
+        """
+        return CurrencySnapshot(self.name, self.reference, self.exchange_rate)
+
     async def update(self) -> float:
         """|coro|
 
@@ -374,7 +459,8 @@ class Currency:
 
         .. note::
 
-            This makes an API call.
+            This makes an API call, unless the rate can be derived from fresh cached rates
+            in the :attr:`Client.currency_graph`.
 
         Raises
         -------
@@ -386,6 +472,11 @@ class Currency:
         :class:`float`
             The newly updated exchange rate.
         """
+        graph = self._http.currency_graph
+        if graph is not None:
+            self._update(exchange_rate=await graph.fetch_rate(self.reference, self.name))
+            return self.exchange_rate
+
         pair = f"{self.reference}_{self.name}"
         data = await self._http.get_exchange_rate(pair=pair)
         self._update(exchange_rate=data["exchange_rate"])
@@ -492,6 +583,31 @@ class IBANValidation:
         """
         return self.valid
 
+    def snapshot(self) -> IBANValidationSnapshot:
+        """Returns an immutable and hashable snapshot of the IBAN validation.
+
+        Returns
+        --------
+        :class:`IBANValidationSnapshot`
+            The snapshot.
+        """
+        return IBANValidationSnapshot(
+            self.iban,
+            self.bank_name,
+            self.account_number,
+            self.bank_code,
+            self.country_code,
+            self.checksum,
+            self.bban,
+            self.valid,
+        )
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_period(period: str) -> datetime.datetime:
+    # only a few distinct periods are shared by all inflations
+    return datetime.datetime.strptime(period, "%b %Y")
+
 
 class Inflation:
     """Represents the inflation of a country from the Inflation API.
@@ -518,7 +634,7 @@ class Inflation:
         The inflation rate on a yearly basis, in percent.
     """
 
-    __slots__ = ("country", "type", "monthly_rate", "yearly_rate", "_period")
+    __slots__ = ("country", "type", "monthly_rate", "yearly_rate", "_period", "_cs_period")
 
     def __init__(self, *, data: InflationPayload):
         self.country: InflationCountry = InflationCountry(data["country"])
@@ -536,15 +652,15 @@ class Inflation:
         return f"<Inflation {joined}>"
 
     def __eq__(self, other: Inflation) -> bool:
-        return self.country == other.country and self.type == other.type and self.period == other.period
+        return self.country == other.country and self.type == other.type and self._period == other._period
 
     def __ne__(self, other: Inflation) -> bool:
         return not self.__eq__(other)
 
-    @property
+    @utils.cached_slot_property("_cs_period")
     def period(self) -> datetime.datetime:
         """:class:`datetime.datetime`: The time period for the inflation data."""
-        return datetime.datetime.strptime(self._period, "%b %Y")
+        return _parse_period(self._period)
 
     def is_monthly_increased(self) -> bool:
         """:class:`bool`: Whether the monthly inflation rate increased."""
@@ -553,3 +669,147 @@ class Inflation:
     def is_yearly_increased(self) -> bool:
         """:class:`bool`: Whether the yearly inflation rate increased."""
         return self.yearly_rate > 0
+
+
+class StockSnapshot(NamedTuple):
+    """A namedtuple which represents the state of a :class:`Stock` at a point in time.
+
+    Unlike the stock itself, snapshots are immutable and hashable, so they can be put in
+    sets, used as dictionary keys and shared across threads. Two snapshots are equal if
+    all of their fields are.
+
+    Attributes
+    -----------
+    ticker: :class:`str`
+        The stock's ticker symbol.
+    name: :class:`str`
+        The stock's name.
+    exchange: Optional[:class:`str`]
+        The stock exchange the stock is traded on.
+    price: :class:`float`
+        The price of the stock.
+    updated: :class:`int`
+        The Unix timestamp the price was last updated at.
+    """
+
+    ticker: str
+    name: str
+    exchange: Optional[str]
+    price: float
+    updated: int
+
+    @property
+    def updated_at(self) -> datetime.datetime:
+        """:class:`datetime.datetime`: Date and time the :attr:`price` was last updated."""
+        return utils.from_timestamp(self.updated)
+
+
+class CommoditySnapshot(NamedTuple):
+    """A namedtuple which represents the state of a :class:`Commodity` at a point in time.
+
+    See :class:`StockSnapshot` for details.
+
+    Attributes
+    -----------
+    type: :class:`CommodityType`
+        The type of the commodity future.
+    name: :class:`str`
+        The commodity future's name.
+    exchange: Optional[:class:`str`]
+        The exchange the commodity future is traded on.
+    price: :class:`float`
+        The price of the commodity future.
+    updated: :class:`int`
+        The Unix timestamp the price was last updated at.
+    """
+
+    type: CommodityType
+    name: str
+    exchange: Optional[str]
+    price: float
+    updated: int
+
+    @property
+    def updated_at(self) -> datetime.datetime:
+        """:class:`datetime.datetime`: Date and time the :attr:`price` was last updated."""
+        return utils.from_timestamp(self.updated)
+
+
+class CryptoSnapshot(NamedTuple):
+    """A namedtuple which represents the state of a :class:`Crypto` at a point in time.
+
+    See :class:`StockSnapshot` for details.
+
+    Attributes
+    -----------
+    symbol: :class:`str`
+        The cryptocurrency's symbol.
+    price: :class:`float`
+        The price of the cryptocurrency.
+    updated: :class:`int`
+        The Unix timestamp the price was last updated at.
+    """
+
+    symbol: str
+    price: float
+    updated: int
+
+    @property
+    def updated_at(self) -> datetime.datetime:
+        """:class:`datetime.datetime`: Date and time the :attr:`price` was last updated."""
+        return utils.from_timestamp(self.updated)
+
+
+class CurrencySnapshot(NamedTuple):
+    """A namedtuple which represents the state of a :class:`Currency` at a point in time.
+
+    See :class:`StockSnapshot` for details.
+
+    Attributes
+    -----------
+    name: :class:`str`
+        The name of the currency.
+    reference: :class:`str`
+        The name of the reference currency.
+    exchange_rate: :class:`float`
+        The exchange rate relative to the :attr:`reference` currency.
+    """
+
+    name: str
+    reference: str
+    exchange_rate: float
+
+
+class IBANValidationSnapshot(NamedTuple):
+    """A namedtuple which represents an :class:`IBANValidation`.
+
+    See :class:`StockSnapshot` for details.
+
+    Attributes
+    -----------
+    iban: :class:`str`
+        The IBAN.
+    bank_name: :class:`str`
+        The bank's name, which the IBAN belongs to.
+    account_number: :class:`str`
+        The account number from the IBAN.
+    bank_code: :class:`str`
+        The bank code from the IBAN.
+    country_code: :class:`str`
+        The country code from the IBAN.
+    checksum: :class:`str`
+        The checksum from the IBAN.
+    bban: :class:`str`
+        The Basic Bank Account Number (BBAN) from the IBAN.
+    valid: :class:`bool`
+        Whether the IBAN is valid or not.
+    """
+
+    iban: str
+    bank_name: str
+    account_number: str
+    bank_code: str
+    country_code: str
+    checksum: str
+    bban: str
+    valid: bool
@@ -0,0 +1,240 @@
+"""
+MIT License
+
+Copyright (c) 2024-present codeofandrin
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import collections
+import math
+from array import array
+from typing import Any, Deque, Iterator, Tuple
+
+from .utils import import_optional
+
+
+# fmt: off
+__all__ = (
+    "PriceHistory",
+)
+# fmt: on
+
+
+class PriceHistory:
+    """Represents the most recent prices of an instrument in a fixed-capacity ring buffer.
+
+    The rolling statistics are updated incrementally, so recording a price costs
+    amortized constant time regardless of the capacity.
+
+    This is usually attached to an instrument with :meth:`.FinancialInstrument.track_history`
+    or for every instrument with the ``price_history`` option of the :class:`Client`.
+
+    .. container:: operations
+
+        .. describe:: len(x)
+
+            Returns the number of recorded prices, at most :attr:`capacity`.
+
+        .. describe:: iter(x)
+
+            Returns an iterator over the ``(timestamp, price)`` pairs, oldest first.
+
+    Attributes
+    -----------
+    capacity: :class:`int`
+        The maximum number of prices kept.
+    """
+
+    __slots__ = (
+        "capacity",
+        "_timestamps",
+        "_prices",
+        "_start",
+        "_size",
+        "_count",
+        "_mean",
+        "_m2",
+        "_minima",
+        "_maxima",
+    )
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self.capacity: int = capacity
+        self._timestamps: array[int] = array("q", bytes(8 * capacity))
+        self._prices: array[float] = array("d", bytes(8 * capacity))
+        # index of the oldest price and the number of prices in the buffer
+        self._start: int = 0
+        self._size: int = 0
+        # number of prices ever recorded, used as sequence number
+        self._count: int = 0
+        # Welford's running mean and sum of squared deviations
+        self._mean: float = 0.0
+        self._m2: float = 0.0
+        # monotonic queues of (sequence number, price) for the rolling min and max
+        self._minima: Deque[Tuple[int, float]] = collections.deque()
+        self._maxima: Deque[Tuple[int, float]] = collections.deque()
+
+    def __repr__(self) -> str:
+        return f"<PriceHistory capacity={self.capacity} size={self._size}>"
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Tuple[int, float]]:
+        capacity = self.capacity
+        for offset in range(self._size):
+            index = (self._start + offset) % capacity
+            yield self._timestamps[index], self._prices[index]
+
+    def append(self, timestamp: int, price: float) -> None:
+        """Records a price, evicting the oldest one if the history is full.
+
+        Parameters
+        -----------
+        timestamp: :class:`int`
+            The Unix timestamp the price was updated at.
+        price: :class:`float`
+            The price.
+        """
+        capacity = self.capacity
+        sequence = self._count
+        self._count += 1
+
+        if self._size < capacity:
+            index = (self._start + self._size) % capacity
+            self._size += 1
+            delta = price - self._mean
+            self._mean += delta / self._size
+            self._m2 += delta * (price - self._mean)
+        else:
+            index = self._start
+            self._start = (index + 1) % capacity
+            evicted = self._prices[index]
+            previous = self._mean
+            self._mean += (price - evicted) / capacity
+            self._m2 += (price - evicted) * (price - self._mean + evicted - previous)
+
+        self._timestamps[index] = timestamp
+        self._prices[index] = price
+
+        # the incremental updates accumulate rounding errors,
+        # so they are recomputed once per full cycle
+        if self._start == 0 and self._size == capacity:
+            self._recompute()
+
+        minima, maxima = self._minima, self._maxima
+        while minima and minima[-1][1] >= price:
+            minima.pop()
+        minima.append((sequence, price))
+        while maxima and maxima[-1][1] <= price:
+            maxima.pop()
+        maxima.append((sequence, price))
+
+        oldest = sequence - self._size + 1
+        if minima[0][0] < oldest:
+            minima.popleft()
+        if maxima[0][0] < oldest:
+            maxima.popleft()
+
+    def _recompute(self) -> None:
+        prices = self._prices
+        mean = math.fsum(prices) / len(prices)
+        self._mean = mean
+        self._m2 = math.fsum((price - mean) ** 2 for price in prices)
+
+    def clear(self) -> None:
+        """Removes all recorded prices."""
+        self._start = self._size = 0
+        self._mean = self._m2 = 0.0
+        self._minima.clear()
+        self._maxima.clear()
+
+    @property
+    def last(self) -> float:
+        """:class:`float`: The most recent price, ``nan`` if empty."""
+        if not self._size:
+            return math.nan
+        return self._prices[(self._start + self._size - 1) % self.capacity]
+
+    @property
+    def last_timestamp(self) -> int:
+        """:class:`int`: The Unix timestamp of the most recent price, ``0`` if empty."""
+        if not self._size:
+            return 0
+        return self._timestamps[(self._start + self._size - 1) % self.capacity]
+
+    @property
+    def mean(self) -> float:
+        """:class:`float`: The mean of the recorded prices, ``nan`` if empty."""
+        return self._mean if self._size else math.nan
+
+    @property
+    def variance(self) -> float:
+        """:class:`float`: The population variance of the recorded prices, ``nan`` if empty."""
+        return max(self._m2, 0.0) / self._size if self._size else math.nan
+
+    @property
+    def stdev(self) -> float:
+        """:class:`float`: The population standard deviation of the recorded prices, ``nan`` if empty."""
+        return math.sqrt(self.variance)
+
+    @property
+    def min(self) -> float:
+        """:class:`float`: The lowest recorded price, ``nan`` if empty."""
+        return self._minima[0][1] if self._size else math.nan
+
+    @property
+    def max(self) -> float:
+        """:class:`float`: The highest recorded price, ``nan`` if empty."""
+        return self._maxima[0][1] if self._size else math.nan
+
+    def _window(self, buffer: array[Any]) -> Any:
+        np = import_optional("numpy")
+        end = self._start + self._size
+        if np is None:
+            if end <= self.capacity:
+                return buffer[self._start : end]
+            return buffer[self._start :] + buffer[: end - self.capacity]
+
+        values = np.frombuffer(buffer, dtype=np.int64 if buffer.typecode == "q" else np.float64)
+        if end <= self.capacity:
+            return values[self._start : end].copy()
+        return np.concatenate((values[self._start :], values[: end - self.capacity]))
+
+    @property
+    def timestamps(self) -> Any:
+        """Union[:class:`numpy.ndarray`, :class:`array.array`]: The Unix timestamps of the recorded prices, oldest first.
+
+        This is a :class:`numpy.ndarray` if :mod:`numpy` is installed.
+        """
+        return self._window(self._timestamps)
+
+    @property
+    def prices(self) -> Any:
+        """Union[:class:`numpy.ndarray`, :class:`array.array`]: The recorded prices, oldest first.
+
+        This is a :class:`numpy.ndarray` if :mod:`numpy` is installed.
+        """
+        return self._window(self._prices)
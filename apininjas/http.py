@@ -24,21 +24,47 @@ SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
+import collections
+import contextvars
 import sys
+import time
 
 import aiohttp
-from typing import TYPE_CHECKING, TypeVar, Coroutine, Any, ClassVar, Dict, Optional, List
+from typing import (
+    TYPE_CHECKING,
+    TypeVar,
+    Callable,
+    Coroutine,
+    Any,
+    ClassVar,
+    Dict,
+    Hashable,
+    Optional,
+    OrderedDict,
+    List,
+    Tuple,
+)
 
 from . import __version__
+from .cache import ResponseCache
+from .decoders import get_decoder
 from .errors import (
+    CacheMiss,
     HTTPException,
     NotFound,
     MethodNotAllowed,
     APINinjasServerError,
 )
+from .markets import is_closed_since
+from .types import finance
+from .utils import MISSING
 
 if TYPE_CHECKING:
-    from .types import finance
+    from .abc import FinancialInstrument
+    from .access import AccessRecorder
+    from .cache import NegativeCache
+    from .currency import CurrencyGraph
 
     T = TypeVar("T")
     Response = Coroutine[Any, Any, T]
@@ -47,6 +73,32 @@ if TYPE_CHECKING:
 API_VERSION: int = 1
 
 
+def _updated_within(
+    max_age: Optional[float], field: str = "updated", *, final: Optional[Callable[[Any], bool]] = None
+) -> Optional[Callable[[Any], bool]]:
+    # accepts a cached response if the server updated it at most max_age seconds ago or it's final
+    if max_age is None:
+        return None
+
+    def accept(data: Any) -> bool:
+        # e.g. an empty list for a stock which could not be found is never accepted
+        if not isinstance(data, dict):
+            return False
+        return time.time() - data.get(field, 0) <= max_age or (final is not None and final(data))
+
+    return accept
+
+
+def _closed_since_updated(exchange: Optional[str] = None) -> Callable[[Any], bool]:
+    # whether a cached price can't change anymore, since its exchange was closed ever since it was updated
+    def final(data: Any) -> bool:
+        return isinstance(data, dict) and is_closed_since(
+            exchange or data.get("exchange"), data.get("updated", 0)
+        )
+
+    return final
+
+
 class Route:
     BASE: ClassVar[str] = f"https://api.api-ninjas.com/v{API_VERSION}"
 
@@ -61,8 +113,28 @@ class Route:
 
 
 class HTTPClient:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, *, skip_closed_markets: bool = True):
         self.api_key: str = api_key
+        self.skip_closed_markets: bool = skip_closed_markets
+        self.currency_graph: Optional[CurrencyGraph] = None
+        self.cache: Optional[ResponseCache] = None
+        self.negative_cache: Optional[NegativeCache] = None
+        self.cache_only: bool = False
+        # enables the cache-only mode within a context, see Client.cache_only
+        self.cache_only_context: contextvars.ContextVar[bool] = contextvars.ContextVar(
+            "cache_only", default=False
+        )
+        # the calls which missed the cache in cache-only mode, to prefetch them later
+        self.cache_misses: OrderedDict[Hashable, Tuple[Route, Optional[Dict[str, Any]], Any]] = (
+            collections.OrderedDict()
+        )
+        self.max_cache_misses: int = 1024
+        self.access_recorder: Optional[AccessRecorder] = None
+        self.price_history: Optional[int] = None
+        # called with every instrument and its previous price whenever a price is set
+        self.price_listeners: List[Callable[[FinancialInstrument, Optional[float]], None]] = []
+        # called when the client is closed, e.g. to write buffered data
+        self.close_callbacks: List[Callable[[], None]] = []
         self.__session: aiohttp.ClientSession = aiohttp.ClientSession()
 
         sys_vers = f"Python/{sys.version_info[0]}.{sys.version_info[1]}"
@@ -76,6 +148,131 @@ class HTTPClient:
         route: Route,
         *,
         params: Optional[Dict[str, Any]] = None,
+        schema: Any = None,
+        accept: Optional[Callable[[Any], bool]] = None,
+        final: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        if route.method != "GET":
+            return await self._request(route, params=params, schema=schema)
+
+        if self.access_recorder is not None:
+            self.access_recorder.record(route.path, params)
+
+        key = ResponseCache.key(route.url, params)
+        failure = self._known_failure(key)
+        if isinstance(failure, HTTPException):
+            raise failure.with_traceback(None)
+        elif failure is not MISSING:
+            return failure
+
+        if self.cache_only or self.cache_only_context.get():
+            data = self.cache.peek(key, accept=accept, final=final) if self.cache is not None else MISSING
+            if data is MISSING:
+                self._record_miss(key, route, params, schema)
+                raise CacheMiss(route.url, params)
+            return data
+
+        return await self._fetch(key, route, params=params, schema=schema, accept=accept, final=final)
+
+    def _known_failure(self, key: Hashable) -> Any:
+        # the cached outcome of a call which failed due to invalid input, or MISSING
+        negative = self.negative_cache
+        return MISSING if negative is None else negative.get(key)
+
+    def _record_miss(
+        self, key: Hashable, route: Route, params: Optional[Dict[str, Any]], schema: Any
+    ) -> None:
+        misses = self.cache_misses
+        misses.pop(key, None)
+        misses[key] = (route, params, schema)
+        while len(misses) > self.max_cache_misses:
+            misses.popitem(last=False)
+
+    async def prefetch_cache_misses(self) -> int:
+        # calls known to fail are not repeated
+        misses = [item for item in self.cache_misses.items() if self._known_failure(item[0]) is MISSING]
+        self.cache_misses.clear()
+        results = await asyncio.gather(
+            *(
+                self._fetch(key, route, params=params, schema=schema)
+                for key, (route, params, schema) in misses
+            ),
+            return_exceptions=True,
+        )
+        return sum(not isinstance(result, BaseException) for result in results)
+
+    async def open_connections(self, count: int) -> None:
+        # resolves the host and completes the TLS handshakes, so the pool has warm connections
+        async def open_connection() -> None:
+            try:
+                async with self.__session.head(Route.BASE, headers={"User-Agent": self.user_agent}):
+                    pass
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass
+
+        await asyncio.gather(*(open_connection() for _ in range(count)))
+
+    async def prefetch(self, calls: List[Tuple[str, Dict[str, Any]]], *, rate: float) -> int:
+        # retrieves the calls into the caches, starting at most `rate` calls per second
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        routes = []
+        for path, params in calls:
+            route = Route("GET", path)
+            key = ResponseCache.key(route.url, params or None)
+            # calls known to fail are not repeated and don't take up a slot of the rate
+            if self._known_failure(key) is MISSING:
+                routes.append((key, route, params or None))
+
+        async def fetch(index: int, key: Hashable, route: Route, params: Optional[Dict[str, Any]]) -> None:
+            await asyncio.sleep(max(0.0, start + index / rate - loop.time()))
+            await self._fetch(key, route, params=params)
+
+        results = await asyncio.gather(
+            *(fetch(index, *call) for index, call in enumerate(routes)),
+            return_exceptions=True,
+        )
+        return sum(not isinstance(result, BaseException) for result in results)
+
+    async def _fetch(
+        self,
+        key: Hashable,
+        route: Route,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        schema: Any = None,
+        accept: Optional[Callable[[Any], bool]] = None,
+        final: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        cache = self.cache
+        negative = self.negative_cache
+        try:
+            if cache is not None:
+                data = await cache.get(
+                    key,
+                    lambda: self._request(route, params=params, schema=schema),
+                    accept=accept,
+                    final=final,
+                )
+            else:
+                data = await self._request(route, params=params, schema=schema)
+        except HTTPException as exc:
+            if negative is not None and exc.status in negative.STATUSES:
+                negative.add(key, exc)
+            raise
+
+        # e.g. an empty list for a stock which could not be found
+        if negative is not None and isinstance(data, (list, dict)) and not data:
+            negative.add(key, data)
+        return data
+
+    async def _request(
+        self,
+        route: Route,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        schema: Any = None,
     ) -> Any:
         method: str = route.method
         url: str = route.url
@@ -84,9 +281,11 @@ class HTTPClient:
 
         async with self.__session.request(method=method, url=url, params=params, headers=headers) as response:
             http_status = response.status
-            try:
-                data = await response.json()
-            except aiohttp.ContentTypeError:
+            if response.content_type == "application/json":
+                # error bodies don't follow the schema of the route
+                decode = get_decoder(schema if 200 <= http_status < 300 else None)
+                data = decode(await response.read())
+            else:
                 data = await response.text()
 
             if 200 <= http_status < 300:
@@ -102,43 +301,85 @@ class HTTPClient:
                     raise HTTPException(response, data)
 
     async def close(self) -> None:
+        if self.cache is not None:
+            self.cache.clear()
+        if self.negative_cache is not None:
+            self.negative_cache.clear()
+        callbacks = list(self.close_callbacks)
+        if self.access_recorder is not None:
+            callbacks.insert(0, self.access_recorder.close)
+
+        # every callback and the session are closed even if one fails, the first error is raised after
+        error: Optional[Exception] = None
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as exc:
+                if error is None:
+                    error = exc
+
         if self.__session:
             await self.__session.close()
+        if error is not None:
+            raise error
 
     # Finance
 
-    def get_stock(self, *, ticker: str) -> Response[finance.Stock]:
+    def _price_request(
+        self,
+        route: Route,
+        schema: Any,
+        max_age: Optional[float],
+        *,
+        params: Any = None,
+        exchange: Optional[str] = None,
+    ) -> Response[Any]:
+        # cached prices of a closed exchange stay valid, like FinancialInstrument.update skips them
+        final = _closed_since_updated(exchange) if self.skip_closed_markets else None
+        return self.request(
+            route, params=params, schema=schema, accept=_updated_within(max_age, final=final), final=final
+        )
+
+    def get_stock(self, *, ticker: str, max_age: Optional[float] = None) -> Response[finance.Stock]:
         params = {"ticker": ticker}
-        return self.request(Route("GET", "/stockprice"), params=params)
+        return self._price_request(Route("GET", "/stockprice"), finance.Stock, max_age, params=params)
 
-    def get_commodity(self, *, name: str) -> Response[finance.Commodity]:
+    def get_commodity(self, *, name: str, max_age: Optional[float] = None) -> Response[finance.Commodity]:
         params = {"name": name}
-        return self.request(Route("GET", "/commodityprice"), params=params)
+        return self._price_request(Route("GET", "/commodityprice"), finance.Commodity, max_age, params=params)
 
-    def get_gold(self) -> Response[finance.Gold]:
-        return self.request(Route("GET", "/goldprice"))
+    def get_gold(self, *, max_age: Optional[float] = None) -> Response[finance.Gold]:
+        # the gold price has no exchange, it's the one of the gold futures
+        return self._price_request(Route("GET", "/goldprice"), finance.Gold, max_age, exchange="CME")
 
-    def get_crypto(self, *, symbol: str) -> Response[finance.Crypto]:
+    def get_crypto(self, *, symbol: str, max_age: Optional[float] = None) -> Response[finance.Crypto]:
         params = {"symbol": symbol}
-        return self.request(Route("GET", "/cryptoprice"), params=params)
+        return self.request(
+            Route("GET", "/cryptoprice"),
+            params=params,
+            schema=finance.Crypto,
+            accept=_updated_within(max_age, "timestamp"),
+        )
 
     def get_crypto_symbols(self) -> Response[finance.CryptoSymbols]:
-        return self.request(Route("GET", "/cryptosymbols"))
+        return self.request(Route("GET", "/cryptosymbols"), schema=finance.CryptoSymbols)
 
     def get_currency_conversion(self, **fields: Any) -> Response[finance.CurrencyConversion]:
         valid_keys = ("have", "want", "amount")
         params = {k: v for k, v in fields.items() if k in valid_keys}
-        return self.request(Route("GET", "/convertcurrency"), params=params)
+        return self.request(
+            Route("GET", "/convertcurrency"), params=params, schema=finance.CurrencyConversion
+        )
 
     def get_exchange_rate(self, *, pair: str) -> Response[finance.ExchangeRate]:
         params = {"pair": pair}
-        return self.request(Route("GET", "/exchangerate"), params=params)
+        return self.request(Route("GET", "/exchangerate"), params=params, schema=finance.ExchangeRate)
 
     def get_iban_validation(self, *, iban: str) -> Response[finance.IBANValidation]:
         params = {"iban": iban}
-        return self.request(Route("GET", "/iban"), params=params)
+        return self.request(Route("GET", "/iban"), params=params, schema=finance.IBANValidation)
 
     def get_inflation(self, **fields: Any) -> Response[List[finance.Inflation]]:
         valid_keys = ("country", "type")
         params = {k: v for k, v in fields.items() if k in valid_keys}
-        return self.request(Route("GET", "/inflation"), params=params)
+        return self.request(Route("GET", "/inflation"), params=params, schema=List[finance.Inflation])
@@ -0,0 +1,415 @@
+"""
+MIT License
+
+Copyright (c) 2024-present codeofandrin
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import time
+
+import aiohttp
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .enums import CommodityType
+from .errors import APINinjasBaseException
+from .utils import MISSING
+
+if TYPE_CHECKING:
+    from .abc import FinancialInstrument
+    from .client import Client
+    from .finance import CommoditySnapshot, CryptoSnapshot, StockSnapshot
+
+    Snapshot = Union[StockSnapshot, CommoditySnapshot, CryptoSnapshot]
+    # ("stock", ticker), ("commodity", type) or ("crypto", symbol)
+    InstrumentKey = Tuple[str, Any]
+
+
+# fmt: off
+__all__ = (
+    "Subscription",
+    "SubscriptionHub",
+)
+# fmt: on
+
+
+def _instrument_keys(
+    stocks: Iterable[str], commodities: Iterable[CommodityType], cryptos: Iterable[str]
+) -> List[InstrumentKey]:
+    keys: List[InstrumentKey] = [("stock", ticker.upper()) for ticker in stocks]
+    keys.extend(("commodity", CommodityType(type)) for type in commodities)
+    keys.extend(("crypto", symbol.upper()) for symbol in cryptos)
+    return keys
+
+
+def _display_key(key: InstrumentKey) -> str:
+    kind, name = key
+    return name.value if kind == "commodity" else name
+
+
+class Subscription:
+    """Represents the interest of a subscriber of a :class:`SubscriptionHub` in some instruments.
+
+    The updates are delivered as snapshots, e.g. :class:`StockSnapshot`, through a bounded
+    queue. If the subscriber doesn't keep up and the queue is full, the oldest update is
+    dropped to make room for the new one.
+
+    .. container:: operations
+
+        .. describe:: async for x in y
+
+            Returns an asynchronous iterator over the updates, which ends once the
+            subscription is closed.
+
+        .. describe:: len(x)
+
+            Returns the number of updates waiting to be received.
+
+    Attributes
+    -----------
+    queue_size: :class:`int`
+        The maximum number of updates waiting to be received.
+    dropped: :class:`int`
+        The number of updates dropped because the queue was full.
+    """
+
+    def __init__(self, hub: SubscriptionHub, queue_size: int):
+        self.queue_size: int = queue_size
+        self.dropped: int = 0
+        self._hub: SubscriptionHub = hub
+        self._keys: Set[InstrumentKey] = set()
+        # (time published, snapshot)
+        self._queue: Deque[Tuple[float, Snapshot]] = collections.deque(maxlen=queue_size)
+        self._ready: asyncio.Event = asyncio.Event()
+        self._closed: bool = False
+
+    def __repr__(self) -> str:
+        return (
+            f"<Subscription instruments={len(self._keys)} pending={len(self._queue)} dropped={self.dropped}>"
+        )
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def __aiter__(self) -> Subscription:
+        return self
+
+    async def __anext__(self) -> Snapshot:
+        if not await self._wait():
+            raise StopAsyncIteration
+        return self._queue.popleft()[1]
+
+    async def _wait(self) -> bool:
+        # waits until an update is queued, False if closed without any left
+        while not self._queue:
+            if self._closed:
+                return False
+            self._ready.clear()
+            await self._ready.wait()
+        return True
+
+    def _put(self, published: float, snapshot: Snapshot) -> None:
+        if len(self._queue) == self.queue_size:
+            self.dropped += 1
+        self._queue.append((published, snapshot))
+        self._ready.set()
+
+    @property
+    def instruments(self) -> List[str]:
+        """List[:class:`str`]: The tickers, symbols and commodity types subscribed to."""
+        return sorted(_display_key(key) for key in self._keys)
+
+    @property
+    def lag(self) -> float:
+        """:class:`float`: The time in seconds the oldest waiting update has been waiting, ``0`` if none."""
+        if not self._queue:
+            return 0.0
+        return time.monotonic() - self._queue[0][0]
+
+    def is_closed(self) -> bool:
+        """:class:`bool`: Whether the subscription is closed or not."""
+        return self._closed
+
+    async def get(self) -> Snapshot:
+        """|coro|
+
+        Waits for the next update and returns it.
+
+        Raises
+        -------
+        RuntimeError
+            The subscription is closed and no updates are left.
+
+        Returns
+        --------
+        Union[:class:`StockSnapshot`, :class:`CommoditySnapshot`, :class:`CryptoSnapshot`]
+            The oldest update waiting to be received.
+        """
+        if not await self._wait():
+            raise RuntimeError("subscription is closed")
+        return self._queue.popleft()[1]
+
+    def add(
+        self,
+        *,
+        stocks: Iterable[str] = (),
+        commodities: Iterable[CommodityType] = (),
+        cryptos: Iterable[str] = (),
+    ) -> None:
+        """Subscribes to more instruments.
+
+        The latest known update of every added instrument is delivered immediately.
+
+        Parameters
+        -----------
+        stocks: Iterable[:class:`str`]
+            The tickers of the stocks.
+        commodities: Iterable[:class:`CommodityType`]
+            The types of the commodities.
+        cryptos: Iterable[:class:`str`]
+            The symbols of the cryptocurrencies.
+        """
+        if self._closed:
+            raise RuntimeError("subscription is closed")
+        self._hub._watch(self, _instrument_keys(stocks, commodities, cryptos))
+
+    def remove(
+        self,
+        *,
+        stocks: Iterable[str] = (),
+        commodities: Iterable[CommodityType] = (),
+        cryptos: Iterable[str] = (),
+    ) -> None:
+        """Unsubscribes from some instruments.
+
+        Parameters
+        -----------
+        stocks: Iterable[:class:`str`]
+            The tickers of the stocks.
+        commodities: Iterable[:class:`CommodityType`]
+            The types of the commodities.
+        cryptos: Iterable[:class:`str`]
+            The symbols of the cryptocurrencies.
+        """
+        self._hub._unwatch(self, _instrument_keys(stocks, commodities, cryptos))
+
+    def close(self) -> None:
+        """Unsubscribes from all instruments.
+
+        Updates waiting in the queue can still be received.
+        """
+        if not self._closed:
+            self._hub._unwatch(self, list(self._keys))
+            self._hub._subscriptions.discard(self)
+            self._closed = True
+            self._ready.set()
+
+
+class SubscriptionHub:
+    """Fans out the price updates of instruments to many subscribers.
+
+    Every instrument with at least one subscriber is polled by a single task, no matter
+    how many subscribers are interested in it, and the task is stopped once the last
+    subscriber left. An update is only published if the price was updated since the
+    previous poll. A poll which fails due to an API or network error is counted in
+    :attr:`failures` and retried after the interval. Polling stops once the client is closed.
+
+    The instruments are polled with the methods of the client, so its options apply, e.g.
+    ``skip_closed_markets``, and the price listeners, e.g. of an :class:`AlertEngine`, see
+    every polled price.
+
+    .. note::
+
+        This must be used within a running event loop.
+
+    .. container:: operations
+
+        .. describe:: len(x)
+
+            Returns the number of open subscriptions.
+
+    Parameters
+    -----------
+    client: :class:`Client`
+        The client to poll the instruments with.
+
+    Attributes
+    -----------
+    interval: :class:`float`
+        The time in seconds between two polls of an instrument. Defaults to ``60``.
+    queue_size: :class:`int`
+        The default maximum number of updates waiting to be received per subscription.
+        Defaults to ``100``.
+    """
+
+    def __init__(self, client: Client, *, interval: float = 60.0, queue_size: int = 100):
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+
+        self.interval: float = interval
+        self.queue_size: int = queue_size
+        self._client: Client = client
+        self._subscriptions: Set[Subscription] = set()
+        self._subscribers: Dict[InstrumentKey, Set[Subscription]] = {}
+        self._tasks: Dict[InstrumentKey, asyncio.Task[None]] = {}
+        # the last update of every polled instrument, as (time published, snapshot)
+        self._latest: Dict[InstrumentKey, Tuple[float, Snapshot]] = {}
+        self._failures: int = 0
+
+    def __repr__(self) -> str:
+        return f"<SubscriptionHub subscriptions={len(self._subscriptions)} instruments={len(self._tasks)}>"
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    def subscribe(
+        self,
+        *,
+        stocks: Iterable[str] = (),
+        commodities: Iterable[CommodityType] = (),
+        cryptos: Iterable[str] = (),
+        queue_size: int = MISSING,
+    ) -> Subscription:
+        """Subscribes to the updates of some instruments.
+
+        The latest known update of every instrument is delivered immediately.
+
+        Parameters
+        -----------
+        stocks: Iterable[:class:`str`]
+            The tickers of the stocks.
+        commodities: Iterable[:class:`CommodityType`]
+            The types of the commodities.
+        cryptos: Iterable[:class:`str`]
+            The symbols of the cryptocurrencies.
+        queue_size: :class:`int`
+            The maximum number of updates waiting to be received. Defaults to :attr:`~apininjas.SubscriptionHub.queue_size`.
+
+        Returns
+        --------
+        :class:`Subscription`
+            The subscription to receive the updates from.
+        """
+        if queue_size is MISSING:
+            queue_size = self.queue_size
+        elif queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+
+        subscription = Subscription(self, queue_size)
+        self._subscriptions.add(subscription)
+        self._watch(subscription, _instrument_keys(stocks, commodities, cryptos))
+        return subscription
+
+    @property
+    def subscriptions(self) -> List[Subscription]:
+        """List[:class:`Subscription`]: The open subscriptions."""
+        return list(self._subscriptions)
+
+    @property
+    def subscriber_counts(self) -> Dict[str, int]:
+        """Dict[:class:`str`, :class:`int`]: The number of subscribers of every polled instrument,
+        keyed by its ticker, symbol or commodity type."""
+        return {_display_key(key): len(subscribers) for key, subscribers in self._subscribers.items()}
+
+    @property
+    def lag(self) -> float:
+        """:class:`float`: The highest :attr:`Subscription.lag` of all subscriptions."""
+        return max((subscription.lag for subscription in self._subscriptions), default=0.0)
+
+    @property
+    def dropped(self) -> int:
+        """:class:`int`: The number of updates dropped by all open subscriptions."""
+        return sum(subscription.dropped for subscription in self._subscriptions)
+
+    @property
+    def failures(self) -> int:
+        """:class:`int`: The number of polls which failed due to an API or network error."""
+        return self._failures
+
+    def _watch(self, subscription: Subscription, keys: Iterable[InstrumentKey]) -> None:
+        for key in keys:
+            if key in subscription._keys:
+                continue
+            subscription._keys.add(key)
+
+            subscribers = self._subscribers.get(key)
+            if subscribers is None:
+                subscribers = self._subscribers[key] = set()
+                self._tasks[key] = asyncio.create_task(self._poll(key))
+            subscribers.add(subscription)
+
+            # delivered now, so the lag doesn't include the time before subscribing
+            latest = self._latest.get(key)
+            if latest is not None:
+                subscription._put(time.monotonic(), latest[1])
+
+    def _unwatch(self, subscription: Subscription, keys: Iterable[InstrumentKey]) -> None:
+        for key in keys:
+            if key not in subscription._keys:
+                continue
+            subscription._keys.discard(key)
+
+            subscribers = self._subscribers[key]
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[key]
+                self._tasks.pop(key).cancel()
+                self._latest.pop(key, None)
+
+    async def _fetch(self, key: InstrumentKey) -> FinancialInstrument:
+        kind, name = key
+        if kind == "stock":
+            return await self._client.fetch_stock(name)
+        elif kind == "commodity":
+            return await self._client.fetch_commodity(name)
+        else:
+            return await self._client.fetch_crypto(name)
+
+    async def _poll(self, key: InstrumentKey) -> None:
+        instrument: Optional[FinancialInstrument] = None
+        updated: Optional[int] = None
+        while not self._client.is_closed():
+            try:
+                if instrument is None:
+                    instrument = await self._fetch(key)
+                else:
+                    await instrument.update()
+            except (APINinjasBaseException, aiohttp.ClientError, asyncio.TimeoutError):
+                # the subscribers keep the last update and the next poll tries again
+                self._failures += 1
+            else:
+                if instrument._updated != updated:
+                    updated = instrument._updated
+                    self._publish(key, instrument.snapshot())  # type: ignore
+
+            await asyncio.sleep(self.interval)
+
+    def _publish(self, key: InstrumentKey, snapshot: Snapshot) -> None:
+        latest = self._latest[key] = (time.monotonic(), snapshot)
+        for subscription in self._subscribers.get(key, ()):
+            subscription._put(*latest)
+
+    def close(self) -> None:
+        """Stops polling and closes all subscriptions."""
+        for subscription in list(self._subscriptions):
+            subscription.close()
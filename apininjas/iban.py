@@ -0,0 +1,322 @@
+"""
+MIT License
+
+Copyright (c) 2024-present codeofandrin
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import string
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Pattern, Sequence, Tuple, Union
+
+import aiohttp
+
+from .errors import APINinjasBaseException
+from .finance import IBANValidation
+from .utils import MISSING, import_optional, to_columns
+
+if TYPE_CHECKING:
+    from .http import HTTPClient
+    from .types.finance import IBANValidation as IBANValidationPayload
+    from .utils import ColumnarFormat
+
+
+# fmt: off
+__all__ = (
+    "validate_iban",
+    "validate_ibans",
+)
+# fmt: on
+
+
+# country code -> (IBAN length, BBAN format) from the SWIFT IBAN registry, where
+# n are digits, a are upper case letters and c are alphanumeric characters
+_REGISTRY: Dict[str, Tuple[int, str]] = {
+    "AD": (24, "4n4n12c"),
+    "AE": (23, "3n16n"),
+    "AL": (28, "8n16c"),
+    "AT": (20, "5n11n"),
+    "AZ": (28, "4a20c"),
+    "BA": (20, "3n3n8n2n"),
+    "BE": (16, "3n7n2n"),
+    "BG": (22, "4a4n2n8c"),
+    "BH": (22, "4a14c"),
+    "BI": (27, "5n5n11n2n"),
+    "BR": (29, "8n5n10n1a1c"),
+    "BY": (28, "4c4n16c"),
+    "CH": (21, "5n12c"),
+    "CR": (22, "4n14n"),
+    "CY": (28, "3n5n16c"),
+    "CZ": (24, "4n6n10n"),
+    "DE": (22, "8n10n"),
+    "DJ": (27, "5n5n11n2n"),
+    "DK": (18, "4n9n1n"),
+    "DO": (28, "4c20n"),
+    "EE": (20, "2n2n11n1n"),
+    "EG": (29, "4n4n17n"),
+    "ES": (24, "4n4n1n1n10n"),
+    "FI": (18, "3n11n"),
+    "FK": (18, "2a12n"),
+    "FO": (18, "4n9n1n"),
+    "FR": (27, "5n5n11c2n"),
+    "GB": (22, "4a6n8n"),
+    "GE": (22, "2a16n"),
+    "GI": (23, "4a15c"),
+    "GL": (18, "4n9n1n"),
+    "GR": (27, "3n4n16c"),
+    "GT": (28, "4c20c"),
+    "HR": (21, "7n10n"),
+    "HU": (28, "3n4n1n15n1n"),
+    "IE": (22, "4a6n8n"),
+    "IL": (23, "3n3n13n"),
+    "IQ": (23, "4a3n12n"),
+    "IS": (26, "4n2n6n10n"),
+    "IT": (27, "1a5n5n12c"),
+    "JO": (30, "4a4n18c"),
+    "KW": (30, "4a22c"),
+    "KZ": (20, "3n13c"),
+    "LB": (28, "4n20c"),
+    "LC": (32, "4a24c"),
+    "LI": (21, "5n12c"),
+    "LT": (20, "5n11n"),
+    "LU": (20, "3n13c"),
+    "LV": (21, "4a13c"),
+    "LY": (25, "3n3n15n"),
+    "MC": (27, "5n5n11c2n"),
+    "MD": (24, "2c18c"),
+    "ME": (22, "3n13n2n"),
+    "MK": (19, "3n10c2n"),
+    "MN": (20, "4n12n"),
+    "MR": (27, "5n5n11n2n"),
+    "MT": (31, "4a5n18c"),
+    "MU": (30, "4a2n2n12n3n3a"),
+    "NI": (28, "4a20n"),
+    "NL": (18, "4a10n"),
+    "NO": (15, "4n6n1n"),
+    "OM": (23, "3n16c"),
+    "PK": (24, "4a16c"),
+    "PL": (28, "8n16n"),
+    "PS": (29, "4a21c"),
+    "PT": (25, "4n4n11n2n"),
+    "QA": (29, "4a21c"),
+    "RO": (24, "4a16c"),
+    "RS": (22, "3n13n2n"),
+    "RU": (33, "9n5n15c"),
+    "SA": (24, "2n18c"),
+    "SC": (31, "4a2n2n16n3a"),
+    "SD": (18, "2n12n"),
+    "SE": (24, "3n16n1n"),
+    "SI": (19, "5n8n2n"),
+    "SK": (24, "4n6n10n"),
+    "SM": (27, "1a5n5n12c"),
+    "SO": (23, "4n3n12n"),
+    "ST": (25, "4n4n11n2n"),
+    "SV": (28, "4a20n"),
+    "TL": (23, "3n14n2n"),
+    "TN": (24, "2n3n13n2n"),
+    "TR": (26, "5n1n16c"),
+    "UA": (29, "6n19c"),
+    "VA": (22, "3n15n"),
+    "VG": (24, "4a16n"),
+    "XK": (20, "4n10n2n"),
+    "YE": (30, "4a4n18c"),
+}
+
+_CHARACTER_CLASSES = {"n": "[0-9]", "a": "[A-Z]", "c": "[A-Z0-9]"}
+
+
+def _compile(bban_format: str) -> Pattern[str]:
+    # matches the check digits and the BBAN
+    parts = re.findall(r"(\d+)([nac])", bban_format)
+    return re.compile("[0-9]{2}" + "".join(f"{_CHARACTER_CLASSES[kind]}{{{count}}}" for count, kind in parts))
+
+
+_PATTERNS: Dict[str, Tuple[int, Pattern[str]]] = {
+    country: (length, _compile(bban_format)) for country, (length, bban_format) in _REGISTRY.items()
+}
+_MAX_LENGTH = 34
+
+# letters are replaced by two digits for the checksum, A = 10, ..., Z = 35
+_DIGITS = str.maketrans({letter: str(index) for index, letter in enumerate(string.ascii_uppercase, 10)})
+
+
+def _payload(iban: str, valid: bool) -> IBANValidationPayload:
+    return {
+        "iban": iban,
+        "bank_name": "",
+        "account_number": "",
+        "bank_code": "",
+        "country": iban[:2],
+        "checksum": iban[2:4],
+        "valid": valid,
+        "bban": iban[4:],
+    }
+
+
+def _columns(
+    rows: List[Tuple[str, bool]], fetched: Mapping[str, IBANValidationPayload]
+) -> Dict[str, List[Any]]:
+    # the columns of the validations, with the bank details of the fetched IBANs
+    ibans = [iban for iban, _ in rows]
+    empty = {"bank_name": "", "account_number": "", "bank_code": ""}
+    details = [fetched.get(iban, empty) for iban in ibans]
+    return {
+        "iban": ibans,
+        "bank_name": [detail["bank_name"] for detail in details],
+        "account_number": [detail["account_number"] for detail in details],
+        "bank_code": [detail["bank_code"] for detail in details],
+        "country_code": [iban[:2] for iban in ibans],
+        "checksum": [iban[2:4] for iban in ibans],
+        "bban": [iban[4:] for iban in ibans],
+        "valid": [valid for _, valid in rows],
+    }
+
+
+def _mod97(ibans: List[str]) -> List[bool]:
+    # whether the IBANs pass the mod-97 check, they must only contain digits and upper case letters
+    np = import_optional("numpy")
+    if np is None or not ibans:
+        digits = _DIGITS
+        return [int((iban[4:] + iban[:4]).translate(digits)) % 97 == 1 for iban in ibans]
+
+    # one row per character position, padded with zero bytes
+    codes = np.array(ibans, dtype=f"S{_MAX_LENGTH}").view(np.uint8).reshape(len(ibans), _MAX_LENGTH)
+    codes = np.ascontiguousarray(codes.T)
+
+    # digits shift the remainder by one decimal place and letters by two,
+    # the padding leaves it unchanged
+    values = np.zeros(256, dtype=np.int32)
+    shifts = np.ones(256, dtype=np.int32)
+    values[ord("0") : ord("9") + 1] = np.arange(10)
+    shifts[ord("0") : ord("9") + 1] = 10
+    values[ord("A") : ord("Z") + 1] = np.arange(10, 36)
+    shifts[ord("A") : ord("Z") + 1] = 100
+
+    remainders = np.zeros(len(ibans), dtype=np.int32)
+    # the country code and check digits are moved to the end
+    for position in (*range(4, _MAX_LENGTH), *range(4)):
+        column = codes[position]
+        remainders *= shifts[column]
+        remainders += values[column]
+        remainders %= 97
+
+    return (remainders == 1).tolist()
+
+
+def _validate(ibans: Iterable[str]) -> List[Tuple[str, bool]]:
+    # bound to locals since this runs for every row of large batches
+    patterns = _PATTERNS
+
+    normalized = []
+    well_formed = []
+    for raw in ibans:
+        iban = raw.replace(" ", "").replace("-", "").upper()
+        entry = patterns.get(iban[:2])
+        normalized.append(iban)
+        well_formed.append(
+            entry is not None and len(iban) == entry[0] and entry[1].fullmatch(iban, 2) is not None
+        )
+
+    checksums = iter(_mod97([iban for iban, ok in zip(normalized, well_formed) if ok]))
+    return [(iban, ok and next(checksums)) for iban, ok in zip(normalized, well_formed)]
+
+
+def validate_iban(iban: str, /) -> IBANValidation:
+    """Validates an IBAN locally without making an API call.
+
+    The IBAN is checked against the length and the format of its country in the
+    bundled IBAN registry, and its checksum is verified with the mod-97 algorithm.
+    Spaces and dashes are ignored.
+
+    .. note::
+
+        The :attr:`~IBANValidation.bank_name`, :attr:`~IBANValidation.bank_code` and
+        :attr:`~IBANValidation.account_number` are empty strings, since they are only
+        known by the API. Use :meth:`Client.fetch_iban_validation` or
+        :meth:`Client.validate_ibans` to retrieve them.
+
+    Parameters
+    -----------
+    iban: :class:`str`
+        The IBAN to validate.
+
+    Returns
+    --------
+    :class:`IBANValidation`
+        The IBAN validation.
+    """
+    return validate_ibans([iban])[0]
+
+
+def validate_ibans(ibans: Iterable[str], /) -> List[IBANValidation]:
+    """Validates many IBANs locally without making an API call.
+
+    This is the bulk version of :func:`validate_iban`. The checksums are computed
+    in a single vectorized pass if :mod:`numpy` is installed.
+
+    Parameters
+    -----------
+    ibans: Iterable[:class:`str`]
+        The IBANs to validate.
+
+    Returns
+    --------
+    List[:class:`IBANValidation`]
+        The IBAN validations, in the order the IBANs were passed.
+    """
+    return [IBANValidation(data=_payload(iban, valid)) for iban, valid in _validate(ibans)]
+
+
+async def validate_with_bank_details(
+    http: HTTPClient,
+    ibans: Sequence[str],
+    *,
+    bank_names: bool,
+    concurrency: int,
+    format: ColumnarFormat = MISSING,
+) -> Union[List[IBANValidation], Any]:
+    # the implementation of Client.validate_ibans
+    rows = _validate(ibans)
+
+    fetched: Dict[str, IBANValidationPayload] = {}
+    if bank_names:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(iban: str) -> IBANValidationPayload:
+            async with semaphore:
+                return await http.get_iban_validation(iban=iban)
+
+        distinct = list(dict.fromkeys(iban for iban, valid in rows if valid))
+        results = await asyncio.gather(*(fetch(iban) for iban in distinct), return_exceptions=True)
+        for iban, result in zip(distinct, results):
+            if isinstance(result, (APINinjasBaseException, aiohttp.ClientError, asyncio.TimeoutError)):
+                # the local validation is kept, without bank details
+                continue
+            elif isinstance(result, BaseException):
+                raise result
+            fetched[iban] = result
+
+    if format is not MISSING:
+        return to_columns(_columns(rows, fetched), format)
+
+    return [IBANValidation(data=fetched.get(iban) or _payload(iban, valid)) for iban, valid in rows]
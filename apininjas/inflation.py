@@ -0,0 +1,455 @@
+"""
+MIT License
+
+Copyright (c) 2024-present codeofandrin
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import struct
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .enums import InflationCountry, InflationIndicatorType
+from .finance import Inflation, _parse_period
+from .utils import MISSING, import_optional, to_columns
+
+if TYPE_CHECKING:
+    from .http import HTTPClient
+    from .utils import ColumnarFormat
+    from .types.finance import Inflation as InflationPayload
+
+    SnapshotKey = Tuple[str, str, str]
+
+
+T = TypeVar("T")
+
+
+# fmt: off
+__all__ = (
+    "InflationDataset",
+    "InflationSnapshot",
+)
+# fmt: on
+
+
+def _columns(data: Iterable[InflationPayload]) -> Dict[str, List[Any]]:
+    # the columns of the inflations, built straight from the payloads
+    data = list(data)
+    return {
+        "country": [inflation["country"] for inflation in data],
+        "type": [inflation["type"] for inflation in data],
+        "period": [_parse_period(inflation["period"]) for inflation in data],
+        "monthly_rate": [inflation["monthly_rate_pct"] for inflation in data],
+        "yearly_rate": [inflation["yearly_rate_pct"] for inflation in data],
+    }
+
+
+# periods are months, so they don't need a finer resolution
+_COLUMN_DTYPES = {"period": "datetime64[M]", "monthly_rate": "float64", "yearly_rate": "float64"}
+
+
+def payloads_to_columns(data: Iterable[InflationPayload], format: ColumnarFormat) -> Any:
+    # the columns of InflationDataset.to_columns, for payloads retrieved without a dataset
+    return to_columns(_columns(data), format, dtypes=_COLUMN_DTYPES)
+
+
+class InflationDataset:
+    """Represents every available :class:`Inflation` of an indicator type, retrieved with a single API call.
+
+    The inflations are indexed by country, indicator type and period, and the rates are
+    stored column-wise for vectorized queries if :mod:`numpy` is installed.
+
+    .. container:: operations
+
+        .. describe:: len(x)
+
+            Returns the number of inflations.
+
+        .. describe:: iter(x)
+
+            Returns an iterator over the inflations, in the order of the API.
+
+    Attributes
+    -----------
+    type: Optional[:class:`InflationIndicatorType`]
+        The inflation indicator type of the dataset or ``None`` if it contains all types.
+    max_age: :class:`float`
+        The maximum age of the dataset in seconds until it's considered stale.
+    """
+
+    def __init__(self, http: HTTPClient, *, type: InflationIndicatorType = MISSING, max_age: float = 3600.0):
+        self._http: HTTPClient = http
+        self.type: Optional[InflationIndicatorType] = type or None
+        self.max_age: float = max_age
+
+        self._data: List[InflationPayload] = []
+        self._inflations: List[Inflation] = []
+        self._index: Dict[Tuple[str, str, str], Inflation] = {}
+        # the first inflation of every country, like the API returns for a single country
+        self._latest: Dict[str, Inflation] = {}
+        self._monthly: Any = []
+        self._yearly: Any = []
+        self._loaded: float = 0.0
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    def __repr__(self) -> str:
+        return f"<InflationDataset type={self.type!r} inflations={len(self._inflations)}>"
+
+    def __len__(self) -> int:
+        return len(self._inflations)
+
+    def __iter__(self) -> Iterator[Inflation]:
+        return iter(self._inflations)
+
+    def _load(self, data: List[InflationPayload]) -> None:
+        inflations = [Inflation(data=inflation) for inflation in data]
+
+        index = {}
+        latest = {}
+        for inflation in inflations:
+            index[(inflation.country.value, inflation.type.value, inflation._period)] = inflation
+            latest.setdefault(inflation.country.value, inflation)
+
+        np = import_optional("numpy")
+        monthly = [inflation.monthly_rate for inflation in inflations]
+        yearly = [inflation.yearly_rate for inflation in inflations]
+        if np is not None:
+            monthly = np.asarray(monthly, dtype=np.float64)
+            yearly = np.asarray(yearly, dtype=np.float64)
+
+        self._data = data
+        self._inflations = inflations
+        self._index = index
+        self._latest = latest
+        self._monthly = monthly
+        self._yearly = yearly
+        self._loaded = time.monotonic()
+
+    def is_fresh(self) -> bool:
+        """:class:`bool`: Whether the dataset was loaded within :attr:`max_age`."""
+        return self._loaded != 0.0 and time.monotonic() - self._loaded <= self.max_age
+
+    async def refresh(self, *, force: bool = False) -> None:
+        """|coro|
+
+        Loads the dataset if it's stale.
+
+        .. note::
+
+            This makes an API call if the dataset is stale or ``force`` is ``True``.
+
+        Parameters
+        -----------
+        force: :class:`bool`
+            Whether to load the dataset even if it's fresh. Defaults to ``False``.
+
+        Raises
+        -------
+        HTTPException
+            Retrieving the inflations failed.
+        """
+        async with self._lock:
+            # another task might have loaded it while waiting for the lock
+            if self.is_fresh() and not force:
+                return
+
+            fields = {}
+            if self.type is not None:
+                fields["type"] = self.type.value
+
+            data = await self._http.get_inflation(**fields)
+            self._load(data)
+
+    def get(
+        self,
+        country: InflationCountry,
+        *,
+        type: InflationIndicatorType = MISSING,
+        period: str = MISSING,
+    ) -> Optional[Inflation]:
+        """Returns the inflation of a country without making an API call.
+
+        Parameters
+        -----------
+        country: :class:`InflationCountry`
+            The country of the inflation.
+        type: :class:`InflationIndicatorType`
+            The inflation indicator type. Defaults to the first one available.
+        period: :class:`str`
+            The period of the inflation as returned by the API, e.g. ``Jan 2024``.
+            Defaults to the first one available.
+
+        Returns
+        --------
+        Optional[:class:`Inflation`]
+            The inflation or ``None`` if it's not in the dataset.
+        """
+        if type is MISSING and period is MISSING:
+            return self._latest.get(country.value)
+        if type is not MISSING and period is not MISSING:
+            return self._index.get((country.value, type.value, period))
+
+        for inflation in self._inflations:
+            if (
+                inflation.country.value == country.value
+                and (type is MISSING or inflation.type.value == type.value)
+                and (period is MISSING or inflation._period == period)
+            ):
+                return inflation
+        return None
+
+    def _select(self, mask: Any) -> List[Inflation]:
+        np = import_optional("numpy")
+        if np is not None and not isinstance(mask, list):
+            return [self._inflations[i] for i in np.flatnonzero(mask)]
+        return [inflation for inflation, selected in zip(self._inflations, mask) if selected]
+
+    def filter(
+        self,
+        *,
+        min_yearly: Optional[float] = None,
+        max_yearly: Optional[float] = None,
+        min_monthly: Optional[float] = None,
+        max_monthly: Optional[float] = None,
+    ) -> List[Inflation]:
+        """Returns the inflations whose rates are within the given bounds.
+
+        All bounds are inclusive and in percent.
+
+        Parameters
+        -----------
+        min_yearly: Optional[:class:`float`]
+            The minimum yearly rate.
+        max_yearly: Optional[:class:`float`]
+            The maximum yearly rate.
+        min_monthly: Optional[:class:`float`]
+            The minimum monthly rate.
+        max_monthly: Optional[:class:`float`]
+            The maximum monthly rate.
+
+        Returns
+        --------
+        List[:class:`Inflation`]
+            The matching inflations, in the order of the API.
+        """
+        bounds = (
+            (self._yearly, min_yearly, max_yearly),
+            (self._monthly, min_monthly, max_monthly),
+        )
+
+        if isinstance(self._yearly, list):
+            mask = [True] * len(self._inflations)
+            for column, lower, upper in bounds:
+                mask = [
+                    selected and (lower is None or value >= lower) and (upper is None or value <= upper)
+                    for selected, value in zip(mask, column)
+                ]
+            return self._select(mask)
+
+        mask = True
+        for column, lower, upper in bounds:
+            if lower is not None:
+                mask = mask & (column >= lower)
+            if upper is not None:
+                mask = mask & (column <= upper)
+
+        if mask is True:
+            return list(self._inflations)
+        return self._select(mask)
+
+    def rank(
+        self,
+        *,
+        by: Literal["yearly", "monthly"] = "yearly",
+        descending: bool = True,
+        limit: Optional[int] = None,
+    ) -> List[Inflation]:
+        """Returns the inflations sorted by one of their rates.
+
+        Parameters
+        -----------
+        by: :class:`str`
+            The rate to sort by, either ``yearly`` or ``monthly``. Defaults to ``yearly``.
+        descending: :class:`bool`
+            Whether the highest rate comes first. Defaults to ``True``.
+        limit: Optional[:class:`int`]
+            The maximum number of inflations to return. Defaults to all.
+
+        Returns
+        --------
+        List[:class:`Inflation`]
+            The sorted inflations.
+        """
+        column = self._yearly if by == "yearly" else self._monthly
+        if isinstance(column, list):
+            order = sorted(range(len(column)), key=column.__getitem__, reverse=descending)
+        else:
+            # a stable sort keeps the order of the API for equal rates
+            order = (-column if descending else column).argsort(kind="stable")
+
+        return [self._inflations[i] for i in order[:limit]]
+
+    def to_columns(self, format: ColumnarFormat = "numpy") -> Any:
+        """Returns the inflations column-wise, e.g. for analytics.
+
+        The columns are ``country``, ``type``, ``period``, ``monthly_rate`` and ``yearly_rate``.
+
+        Parameters
+        -----------
+        format: :class:`str`
+            ``numpy`` for a :class:`dict` of :class:`numpy.ndarray`, ``pandas`` for a
+            :class:`pandas.DataFrame` or ``arrow`` for a :class:`pyarrow.Table`.
+            Defaults to ``numpy``.
+
+        Raises
+        -------
+        RuntimeError
+            The library required for the format is not installed.
+
+        Returns
+        --------
+        Union[Dict[:class:`str`, :class:`numpy.ndarray`], :class:`pandas.DataFrame`, :class:`pyarrow.Table`]
+            The columns of the inflations, in the order of the API.
+        """
+        return payloads_to_columns(self._data, format)
+
+
+def _fingerprint(monthly_rate: float, yearly_rate: float) -> str:
+    # stable across restarts, unlike hash()
+    return hashlib.blake2b(struct.pack("<dd", monthly_rate, yearly_rate), digest_size=8).hexdigest()
+
+
+class InflationSnapshot:
+    """Represents the fingerprint of the last seen inflations, used to find the ones that changed.
+
+    Every inflation is keyed by its country, indicator type and period, and only a short
+    fingerprint of its rates is kept. If a ``path`` is passed, the fingerprints are loaded
+    from and saved to that file, so the comparison works across restarts.
+
+    .. container:: operations
+
+        .. describe:: len(x)
+
+            Returns the number of inflations in the snapshot.
+
+    Parameters
+    -----------
+    path: Optional[Union[:class:`str`, :class:`os.PathLike`]]
+        The file to persist the snapshot to. Defaults to ``None``, which keeps it in memory only.
+    """
+
+    def __init__(self, path: Optional[Union[str, os.PathLike[str]]] = None):
+        self.path: Optional[Union[str, os.PathLike[str]]] = path
+        self._fingerprints: Dict[SnapshotKey, str] = {}
+
+        if path is not None and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            self._fingerprints = {
+                (country, type, period): fp for country, type, period, fp in data["inflations"]
+            }
+
+    def __repr__(self) -> str:
+        return f"<InflationSnapshot path={self.path!r} inflations={len(self._fingerprints)}>"
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def _changed(self, rows: Iterable[Tuple[SnapshotKey, str, T]], *, commit: bool) -> List[T]:
+        fingerprints = self._fingerprints
+        changed = []
+        updates = {}
+        for key, fingerprint, item in rows:
+            if fingerprints.get(key) != fingerprint:
+                changed.append(item)
+                updates[key] = fingerprint
+
+        if commit and updates:
+            fingerprints.update(updates)
+            self.save()
+        return changed
+
+    def _diff(self, data: Iterable[InflationPayload], *, commit: bool = True) -> List[Inflation]:
+        rows = (
+            (
+                (payload["country"], payload["type"], payload["period"]),
+                _fingerprint(payload["monthly_rate_pct"], payload["yearly_rate_pct"]),
+                payload,
+            )
+            for payload in data
+        )
+        # only the changed inflations are constructed
+        return [Inflation(data=payload) for payload in self._changed(rows, commit=commit)]
+
+    def diff(self, inflations: Iterable[Inflation], *, commit: bool = True) -> List[Inflation]:
+        """Returns the inflations which were added or changed since the last snapshot.
+
+        Parameters
+        -----------
+        inflations: Iterable[:class:`Inflation`]
+            The newly retrieved inflations.
+        commit: :class:`bool`
+            Whether to update the snapshot with the inflations, and save it if a ``path``
+            was passed. Defaults to ``True``.
+
+        Returns
+        --------
+        List[:class:`Inflation`]
+            The added or changed inflations.
+        """
+        rows = (
+            (
+                (inflation.country.value, inflation.type.value, inflation._period),
+                _fingerprint(inflation.monthly_rate, inflation.yearly_rate),
+                inflation,
+            )
+            for inflation in inflations
+        )
+        return self._changed(rows, commit=commit)
+
+    def save(self) -> None:
+        """Saves the snapshot to its ``path``. Does nothing if no path was passed."""
+        if self.path is None:
+            return
+
+        data = {"inflations": [[*key, fingerprint] for key, fingerprint in self._fingerprints.items()]}
+        temp = f"{os.fspath(self.path)}.tmp"
+        with open(temp, "w", encoding="utf-8") as file:
+            json.dump(data, file, separators=(",", ":"))
+        # replaced atomically so a crash never leaves a partial snapshot behind
+        os.replace(temp, self.path)
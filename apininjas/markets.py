@@ -0,0 +1,321 @@
+"""
+MIT License
+
+Copyright (c) 2024-present codeofandrin
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import datetime
+import functools
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo
+
+
+# fmt: off
+__all__ = (
+    "TradingSession",
+    "get_trading_session",
+)
+# fmt: on
+
+
+_MINUTES_PER_DAY = 24 * 60
+_MINUTES_PER_WEEK = 7 * _MINUTES_PER_DAY
+
+_WEEKDAYS = (0, 1, 2, 3, 4)
+# overnight futures sessions open on Sunday evening and close on Friday
+_SUNDAY_TO_THURSDAY = (6, 0, 1, 2, 3)
+
+
+def _minutes(value: str) -> int:
+    hours, minutes = value.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def _sessions(*hours: Tuple[str, str], days: Sequence[int] = _WEEKDAYS) -> List[Tuple[int, int]]:
+    # converts daily hours into intervals in minutes since Monday 00:00, local time
+    intervals = []
+    for day in days:
+        for opens, closes in hours:
+            start = day * _MINUTES_PER_DAY + _minutes(opens)
+            end = day * _MINUTES_PER_DAY + _minutes(closes)
+            if end <= start:
+                # closes on the next day
+                end += _MINUTES_PER_DAY
+
+            if end > _MINUTES_PER_WEEK:
+                intervals.append((start, _MINUTES_PER_WEEK))
+                intervals.append((0, end - _MINUTES_PER_WEEK))
+            else:
+                intervals.append((start, end))
+
+    return sorted(intervals)
+
+
+def _easter(year: int) -> datetime.date:
+    # anonymous Gregorian algorithm
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return datetime.date(year, month, day + 1)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> datetime.date:
+    # n > 0 counts from the start of the month, n < 0 from the end
+    if n > 0:
+        first = datetime.date(year, month, 1)
+        return first + datetime.timedelta(days=(weekday - first.weekday()) % 7 + (n - 1) * 7)
+
+    next_month = datetime.date(year + month // 12, month % 12 + 1, 1)
+    last = next_month - datetime.timedelta(days=1)
+    return last - datetime.timedelta(days=(last.weekday() - weekday) % 7 + (-n - 1) * 7)
+
+
+def _observed(day: datetime.date) -> datetime.date:
+    if day.weekday() == 5:
+        return day - datetime.timedelta(days=1)
+    if day.weekday() == 6:
+        return day + datetime.timedelta(days=1)
+    return day
+
+
+@functools.lru_cache(maxsize=16)
+def _us_equity_holidays(year: int) -> FrozenSet[datetime.date]:
+    holidays = {
+        _nth_weekday(year, 1, 0, 3),  # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),  # Washington's Birthday
+        _easter(year) - datetime.timedelta(days=2),  # Good Friday
+        _nth_weekday(year, 5, 0, -1),  # Memorial Day
+        _observed(datetime.date(year, 7, 4)),  # Independence Day
+        _nth_weekday(year, 9, 0, 1),  # Labor Day
+        _nth_weekday(year, 11, 3, 4),  # Thanksgiving Day
+        _observed(datetime.date(year, 12, 25)),  # Christmas Day
+    }
+
+    new_year = datetime.date(year, 1, 1)
+    # not observed on the previous Friday if it falls on a Saturday
+    if new_year.weekday() != 5:
+        holidays.add(_observed(new_year))
+    if year >= 2022:
+        holidays.add(_observed(datetime.date(year, 6, 19)))  # Juneteenth
+
+    return frozenset(holidays)
+
+
+class TradingSession:
+    """Represents the regular weekly trading hours of an exchange.
+
+    Sessions are bundled with the library and don't require an API call. Only the
+    regular hours are considered, early closes are treated as full trading days.
+    Holidays are only known for US stock exchanges.
+
+    Attributes
+    -----------
+    name: :class:`str`
+        The name of the exchange.
+    timezone: :class:`zoneinfo.ZoneInfo`
+        The timezone the trading hours are defined in.
+    """
+
+    __slots__ = ("name", "timezone", "_intervals", "_opens", "_holidays")
+
+    def __init__(
+        self,
+        name: str,
+        timezone: str,
+        intervals: List[Tuple[int, int]],
+        *,
+        holidays: Optional[Callable[[int], FrozenSet[datetime.date]]] = None,
+    ):
+        self.name: str = name
+        self.timezone: ZoneInfo = ZoneInfo(timezone)
+        self._intervals: List[Tuple[int, int]] = intervals
+        self._holidays: Optional[Callable[[int], FrozenSet[datetime.date]]] = holidays
+
+        # an interval only opens the market if the market was closed right before it
+        self._opens: List[int] = [
+            start for start, _ in intervals if not self._contains((start - 1) % _MINUTES_PER_WEEK)
+        ]
+
+    def __repr__(self) -> str:
+        return f"<TradingSession name={self.name!r} timezone={self.timezone.key!r}>"
+
+    def _contains(self, minute: int) -> bool:
+        return any(start <= minute < end for start, end in self._intervals)
+
+    def _is_holiday(self, day: datetime.date) -> bool:
+        return self._holidays is not None and day in self._holidays(day.year)
+
+    def _localize(self, when: Optional[datetime.datetime]) -> datetime.datetime:
+        if when is None:
+            return datetime.datetime.now(self.timezone)
+        if when.tzinfo is None:
+            # naive datetimes are treated as local time like datetime.datetime.fromtimestamp does
+            when = when.astimezone()
+        return when.astimezone(self.timezone)
+
+    def is_open(self, when: Optional[datetime.datetime] = None) -> bool:
+        """Checks whether the exchange is open at the given time.
+
+        Parameters
+        -----------
+        when: Optional[:class:`datetime.datetime`]
+            The time to check. Defaults to now.
+
+        Returns
+        --------
+        :class:`bool`
+            Whether the exchange is open.
+        """
+        local = self._localize(when)
+        if self._is_holiday(local.date()):
+            return False
+
+        minute = local.weekday() * _MINUTES_PER_DAY + local.hour * 60 + local.minute
+        return self._contains(minute)
+
+    def next_open(self, when: Optional[datetime.datetime] = None) -> datetime.datetime:
+        """Returns the next time the exchange opens after the given time.
+
+        Parameters
+        -----------
+        when: Optional[:class:`datetime.datetime`]
+            The time to start from. Defaults to now.
+
+        Returns
+        --------
+        :class:`datetime.datetime`
+            The next opening time in the exchange's timezone.
+        """
+        local = self._localize(when)
+        monday = datetime.datetime.combine(
+            local.date() - datetime.timedelta(days=local.weekday()), datetime.time()
+        )
+
+        # a few weeks are enough to skip over any holidays
+        for week in range(5):
+            for start in self._opens:
+                naive = monday + datetime.timedelta(weeks=week, minutes=start)
+                candidate = naive.replace(tzinfo=self.timezone)
+                if candidate > local and not self._is_holiday(candidate.date()):
+                    return candidate
+
+        raise RuntimeError(f"{self.name} does not open within the next weeks")
+
+    def is_closed_between(self, start: datetime.datetime, end: datetime.datetime) -> bool:
+        """Checks whether the exchange is closed during the whole time between ``start`` and ``end``.
+
+        A price observed at ``start`` can't change until ``end`` if this returns ``True``.
+
+        Parameters
+        -----------
+        start: :class:`datetime.datetime`
+            The start of the time range.
+        end: :class:`datetime.datetime`
+            The end of the time range.
+
+        Returns
+        --------
+        :class:`bool`
+            Whether the exchange is closed during the whole time range.
+        """
+        return not self.is_open(start) and self.next_open(start) > self._localize(end)
+
+
+def _equities(name: str, timezone: str, *hours: Tuple[str, str], us: bool = False) -> TradingSession:
+    return TradingSession(name, timezone, _sessions(*hours), holidays=_us_equity_holidays if us else None)
+
+
+def _futures(name: str, timezone: str, opens: str, closes: str) -> TradingSession:
+    return TradingSession(name, timezone, _sessions((opens, closes), days=_SUNDAY_TO_THURSDAY))
+
+
+_NEW_YORK = ("09:30", "16:00")
+
+_SESSIONS: Dict[str, TradingSession] = {}
+for _session in (
+    # US stock exchanges
+    _equities("NASDAQ", "America/New_York", _NEW_YORK, us=True),
+    _equities("NYSE", "America/New_York", _NEW_YORK, us=True),
+    _equities("NYSE ARCA", "America/New_York", _NEW_YORK, us=True),
+    _equities("NYSE AMERICAN", "America/New_York", _NEW_YORK, us=True),
+    _equities("AMEX", "America/New_York", _NEW_YORK, us=True),
+    _equities("BATS", "America/New_York", _NEW_YORK, us=True),
+    _equities("CBOE", "America/New_York", _NEW_YORK, us=True),
+    # other stock exchanges
+    _equities("TSX", "America/Toronto", ("09:30", "16:00")),
+    _equities("LSE", "Europe/London", ("08:00", "16:30")),
+    _equities("XETRA", "Europe/Berlin", ("09:00", "17:30")),
+    _equities("EURONEXT", "Europe/Paris", ("09:00", "17:30")),
+    _equities("SIX", "Europe/Zurich", ("09:00", "17:30")),
+    _equities("TSE", "Asia/Tokyo", ("09:00", "11:30"), ("12:30", "15:30")),
+    _equities("HKEX", "Asia/Hong_Kong", ("09:30", "12:00"), ("13:00", "16:00")),
+    _equities("SSE", "Asia/Shanghai", ("09:30", "11:30"), ("13:00", "15:00")),
+    _equities("SZSE", "Asia/Shanghai", ("09:30", "11:30"), ("13:00", "15:00")),
+    _equities("NSE", "Asia/Kolkata", ("09:15", "15:30")),
+    _equities("BSE", "Asia/Kolkata", ("09:15", "15:30")),
+    _equities("ASX", "Australia/Sydney", ("10:00", "16:00")),
+    # futures exchanges, Sunday evening to Friday with a daily maintenance break
+    _futures("CME", "America/Chicago", "17:00", "16:00"),
+    _futures("NYMEX", "America/Chicago", "17:00", "16:00"),
+    _futures("COMEX", "America/Chicago", "17:00", "16:00"),
+    _futures("CBOT", "America/Chicago", "17:00", "16:00"),
+    _futures("ICE", "America/New_York", "18:00", "17:00"),
+):
+    _SESSIONS[_session.name] = _session
+del _session
+
+
+def get_trading_session(exchange: Optional[str]) -> Optional[TradingSession]:
+    """Returns the bundled :class:`~apininjas.TradingSession` of an exchange.
+
+    Parameters
+    -----------
+    exchange: Optional[:class:`str`]
+        The name of the exchange, e.g. :attr:`.Stock.exchange` or :attr:`.Commodity.exchange`.
+
+    Returns
+    --------
+    Optional[:class:`~apininjas.TradingSession`]
+        The trading session or ``None`` if the exchange is unknown or always open.
+    """
+    if exchange is None:
+        return None
+    return _SESSIONS.get(exchange.upper())
+
+
+def is_closed_since(exchange: Optional[str], timestamp: int) -> bool:
+    # whether the exchange was closed ever since the Unix timestamp, so a price updated then is final,
+    # a price of a delayed feed updated before the close may still change after it
+    session = get_trading_session(exchange)
+    if session is None:
+        return False
+
+    updated = datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc)
+    return session.is_closed_between(updated, datetime.datetime.now(datetime.timezone.utc))
@@ -0,0 +1,424 @@
+"""
+MIT License
+
+Copyright (c) 2024-present codeofandrin
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import math
+import time
+from typing import TYPE_CHECKING, Dict, List, Literal, Mapping, NamedTuple, Optional, Tuple, Union
+
+import aiohttp
+
+from .errors import APINinjasBaseException, ClientException
+from .utils import MISSING
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .finance import Stock, Crypto
+
+    InstrumentKind = Literal["stock", "crypto"]
+
+
+# fmt: off
+__all__ = (
+    "RefreshPlanner",
+    "StalenessReport",
+)
+# fmt: on
+
+
+class StalenessReport(NamedTuple):
+    """A namedtuple which represents the staleness distribution of a :class:`RefreshPlanner`.
+
+    All values are in seconds and measured from the instruments' :attr:`~.FinancialInstrument.updated_at`.
+    """
+
+    count: int
+    pending: int
+    mean: float
+    weighted_mean: float
+    median: float
+    p90: float
+    p99: float
+    max: float
+
+
+class _Entry:
+    __slots__ = ("kind", "key", "weight", "interval", "instrument", "anchor", "not_before", "version")
+
+    def __init__(self, kind: InstrumentKind, key: str, weight: float):
+        self.kind: InstrumentKind = kind
+        self.key: str = key
+        self.weight: float = weight
+        self.interval: float = 0.0
+        self.instrument: Optional[Union[Stock, Crypto]] = None
+        # the time from which the next refresh is scheduled, 0 means never fetched
+        self.anchor: float = 0.0
+        # the exchange is closed or the instrument was just refreshed until then
+        self.not_before: float = 0.0
+        self.version: int = 0
+
+    @property
+    def due(self) -> float:
+        return max(self.anchor + self.interval if self.anchor else 0.0, self.not_before)
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    # nearest-rank on an already sorted list
+    if not values:
+        return 0.0
+    index = max(math.ceil(pct / 100 * len(values)) - 1, 0)
+    return values[index]
+
+
+class RefreshPlanner:
+    """Plans which stocks and cryptocurrencies to refresh next within a fixed call budget.
+
+    Each instrument gets a refresh frequency proportional to the square root of its weight,
+    which minimizes the weighted average staleness for a given number of calls per second.
+    Instruments are kept in a priority queue keyed by the time they are due again, which is
+    derived from the :attr:`~.FinancialInstrument.updated_at` returned by the API.
+
+    .. note::
+
+        An instrument is due once its interval elapsed since its server timestamp, so one
+        whose data was already old when it was refreshed is due sooner, but never before
+        ``min_interval`` elapsed since the refresh. Instruments traded on a closed exchange
+        are not polled again before it opens, unless ``skip_closed_markets`` is disabled on
+        the :class:`Client`.
+
+    Parameters
+    -----------
+    client: :class:`Client`
+        The client used to refresh the instruments.
+    rate: :class:`float`
+        The budget in API calls per second. For a monthly quota, divide it by the number of
+        seconds in a month.
+    stocks: Mapping[:class:`str`, :class:`float`]
+        The tickers of the stocks to refresh, mapped to their importance weight.
+    cryptos: Mapping[:class:`str`, :class:`float`]
+        The symbols of the cryptocurrencies to refresh, mapped to their importance weight.
+    min_interval: Optional[:class:`float`]
+        The minimum time in seconds between two refreshes of an instrument. Defaults to
+        ``None``, which uses a quarter of the interval of each instrument.
+
+    Raises
+    -------
+    ValueError
+        The ``rate`` is not positive.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        *,
+        rate: float,
+        stocks: Mapping[str, float] = MISSING,
+        cryptos: Mapping[str, float] = MISSING,
+        min_interval: Optional[float] = None,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+
+        self.client: Client = client
+        self.rate: float = rate
+        self.min_interval: Optional[float] = min_interval
+        self._entries: Dict[Tuple[InstrumentKind, str], _Entry] = {}
+        self._queue: List[Tuple[float, int, _Entry, int]] = []
+        self._counter: int = 0
+        self._dirty: bool = False
+        self._next_call: float = 0.0
+
+        for ticker, weight in (stocks or {}).items():
+            self.add_stock(ticker, weight=weight)
+        for symbol, weight in (cryptos or {}).items():
+            self.add_crypto(symbol, weight=weight)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _add(self, kind: InstrumentKind, key: str, weight: float) -> None:
+        if weight <= 0:
+            raise ValueError("weight must be greater than 0")
+
+        entry = self._entries.get((kind, key))
+        if entry is None:
+            self._entries[(kind, key)] = _Entry(kind, key, weight)
+        else:
+            entry.weight = weight
+        self._dirty = True
+
+    def _remove(self, kind: InstrumentKind, key: str) -> None:
+        if self._entries.pop((kind, key), None) is not None:
+            self._dirty = True
+
+    def add_stock(self, ticker: str, *, weight: float = 1.0) -> None:
+        """Adds a stock to refresh or updates its weight if it's already planned.
+
+        Parameters
+        -----------
+        ticker: :class:`str`
+            The ticker of the stock.
+        weight: :class:`float`
+            The importance weight of the stock. Defaults to ``1.0``.
+
+        Raises
+        -------
+        ValueError
+            The ``weight`` is not positive.
+        """
+        self._add("stock", ticker, weight)
+
+    def add_crypto(self, symbol: str, *, weight: float = 1.0) -> None:
+        """Adds a cryptocurrency to refresh or updates its weight if it's already planned.
+
+        Parameters
+        -----------
+        symbol: :class:`str`
+            The symbol of the cryptocurrency.
+        weight: :class:`float`
+            The importance weight of the cryptocurrency. Defaults to ``1.0``.
+
+        Raises
+        -------
+        ValueError
+            The ``weight`` is not positive.
+        """
+        self._add("crypto", symbol, weight)
+
+    def remove_stock(self, ticker: str) -> None:
+        """Removes a stock from the plan. Does nothing if it's not planned.
+
+        Parameters
+        -----------
+        ticker: :class:`str`
+            The ticker of the stock.
+        """
+        self._remove("stock", ticker)
+
+    def remove_crypto(self, symbol: str) -> None:
+        """Removes a cryptocurrency from the plan. Does nothing if it's not planned.
+
+        Parameters
+        -----------
+        symbol: :class:`str`
+            The symbol of the cryptocurrency.
+        """
+        self._remove("crypto", symbol)
+
+    def get_stock(self, ticker: str) -> Optional[Stock]:
+        """Returns the most recently refreshed stock with the given ticker.
+
+        Parameters
+        -----------
+        ticker: :class:`str`
+            The ticker of the stock.
+
+        Returns
+        --------
+        Optional[:class:`Stock`]
+            The stock or ``None`` if it has not been refreshed yet.
+        """
+        entry = self._entries.get(("stock", ticker))
+        return entry.instrument if entry is not None else None  # type: ignore # always a stock
+
+    def get_crypto(self, symbol: str) -> Optional[Crypto]:
+        """Returns the most recently refreshed cryptocurrency with the given symbol.
+
+        Parameters
+        -----------
+        symbol: :class:`str`
+            The symbol of the cryptocurrency.
+
+        Returns
+        --------
+        Optional[:class:`Crypto`]
+            The cryptocurrency or ``None`` if it has not been refreshed yet.
+        """
+        entry = self._entries.get(("crypto", symbol))
+        return entry.instrument if entry is not None else None  # type: ignore # always a crypto
+
+    def _push(self, entry: _Entry) -> None:
+        entry.version += 1
+        self._counter += 1
+        heapq.heappush(self._queue, (entry.due, self._counter, entry, entry.version))
+
+    def _rebuild(self) -> None:
+        # optimal frequency per instrument is rate * sqrt(w) / sum(sqrt(w))
+        total = sum(math.sqrt(e.weight) for e in self._entries.values())
+        for entry in self._entries.values():
+            entry.interval = total / (self.rate * math.sqrt(entry.weight))
+
+        self._queue = []
+        for entry in self._entries.values():
+            entry.version += 1
+            self._counter += 1
+            self._queue.append((entry.due, self._counter, entry, entry.version))
+        heapq.heapify(self._queue)
+        self._dirty = False
+
+    def _peek_entry(self) -> Optional[_Entry]:
+        if self._dirty:
+            self._rebuild()
+
+        while self._queue:
+            _, _, entry, version = self._queue[0]
+            if entry.version == version and self._entries.get((entry.kind, entry.key)) is entry:
+                return entry
+            heapq.heappop(self._queue)
+        return None
+
+    def plan(self, n: int = 1) -> List[Tuple[InstrumentKind, str]]:
+        """Returns the next instruments to refresh without refreshing them.
+
+        Parameters
+        -----------
+        n: :class:`int`
+            The maximum number of instruments to return. Defaults to ``1``.
+
+        Returns
+        --------
+        List[Tuple[:class:`str`, :class:`str`]]
+            The kind (``stock`` or ``crypto``) and the ticker or symbol of each instrument,
+            in the order they would be refreshed.
+        """
+        if self._peek_entry() is None:
+            return []
+
+        valid = (item for item in self._queue if item[2].version == item[3])
+        return [(item[2].kind, item[2].key) for item in heapq.nsmallest(n, valid)]
+
+    async def refresh_next(self) -> Union[Stock, Crypto]:
+        """|coro|
+
+        Waits until the next instrument is due and the call budget allows it,
+        then refreshes it.
+
+        .. note::
+
+            This makes an API call.
+
+        Raises
+        -------
+        ClientException
+            There are no instruments to refresh.
+        HTTPException
+            Refreshing the instrument failed. It is rescheduled regardless.
+
+        Returns
+        --------
+        Union[:class:`Stock`, :class:`Crypto`]
+            The refreshed instrument.
+        """
+        while True:
+            entry = self._peek_entry()
+            if entry is None:
+                raise ClientException("there are no instruments to refresh")
+
+            now = time.time()
+            delay = max(entry.due, self._next_call) - now
+            if delay <= 0:
+                break
+
+            # the plan might have changed while sleeping, so peek again afterwards
+            await asyncio.sleep(delay)
+
+        self._next_call = max(now, self._next_call) + 1 / self.rate
+        try:
+            if entry.instrument is not None:
+                await entry.instrument.update()
+            elif entry.kind == "stock":
+                entry.instrument = await self.client.fetch_stock(entry.key)
+            else:
+                entry.instrument = await self.client.fetch_crypto(entry.key)
+        finally:
+            now = time.time()
+            instrument = entry.instrument
+            # an instrument which was never retrieved is retried once its interval elapsed
+            entry.anchor = instrument._updated if instrument is not None else now
+            min_interval = self.min_interval if self.min_interval is not None else entry.interval / 4
+            entry.not_before = now + min_interval
+            if instrument is not None and self.client._http.skip_closed_markets:
+                session = instrument.trading_session
+                if session is not None and not session.is_open():
+                    entry.not_before = max(entry.not_before, session.next_open().timestamp())
+
+            if self._entries.get((entry.kind, entry.key)) is entry:
+                self._push(entry)
+
+        return entry.instrument
+
+    async def run(self) -> None:
+        """|coro|
+
+        Keeps refreshing the planned instruments until cancelled.
+
+        Failed refreshes are skipped and the instrument is retried once it's due again.
+        """
+        while True:
+            if not self._entries:
+                await asyncio.sleep(1 / self.rate)
+                continue
+
+            try:
+                await self.refresh_next()
+            except (APINinjasBaseException, aiohttp.ClientError, asyncio.TimeoutError):
+                pass
+
+    def staleness(self) -> StalenessReport:
+        """Reports the current staleness distribution of the planned instruments.
+
+        Instruments which have not been refreshed yet are only counted as ``pending``.
+
+        Returns
+        --------
+        :class:`StalenessReport`
+            The staleness distribution in seconds.
+        """
+        now = time.time()
+        ages: List[Tuple[float, float]] = []
+        pending = 0
+        for entry in self._entries.values():
+            if entry.instrument is None:
+                pending += 1
+            else:
+                ages.append((max(now - entry.instrument._updated, 0.0), entry.weight))
+
+        if not ages:
+            return StalenessReport(0, pending, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+        values = sorted(age for age, _ in ages)
+        total_weight = sum(weight for _, weight in ages)
+        return StalenessReport(
+            count=len(values),
+            pending=pending,
+            mean=sum(values) / len(values),
+            weighted_mean=sum(age * weight for age, weight in ages) / total_weight,
+            median=_percentile(values, 50),
+            p90=_percentile(values, 90),
+            p99=_percentile(values, 99),
+            max=values[-1],
+        )
@@ -0,0 +1,289 @@
+"""
+MIT License
+
+Copyright (c) 2024-present codeofandrin
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Literal, NamedTuple, Sequence, Tuple, Union
+
+import aiohttp
+
+from .enums import CommodityType
+from .errors import APINinjasBaseException
+from .utils import import_optional
+
+if TYPE_CHECKING:
+    from .client import Client
+
+    HoldingKind = Literal["stock", "crypto", "commodity", "cash"]
+    InstrumentKey = Tuple[HoldingKind, Union[str, CommodityType]]
+
+
+# fmt: off
+__all__ = (
+    "Holding",
+    "Portfolio",
+    "Valuation",
+    "ValuationEngine",
+)
+# fmt: on
+
+
+class Holding(NamedTuple):
+    """A namedtuple which represents a position in a :class:`Portfolio`.
+
+    Attributes
+    -----------
+    kind: :class:`str`
+        The kind of the position. One of ``stock``, ``crypto``, ``commodity`` or ``cash``.
+    key: Union[:class:`str`, :class:`CommodityType`]
+        The ticker, symbol, commodity type or, for cash, the currency name.
+    quantity: :class:`float`
+        The quantity held, or the amount for cash.
+    currency: :class:`str`
+        The currency the instrument's price is quoted in.
+    """
+
+    kind: HoldingKind
+    key: Union[str, CommodityType]
+    quantity: float
+    currency: str
+
+
+class Portfolio:
+    """Represents a portfolio of mixed holdings.
+
+    Attributes
+    -----------
+    id: :class:`collections.abc.Hashable`
+        The identifier of the portfolio, e.g. an account ID.
+    holdings: List[:class:`Holding`]
+        The positions of the portfolio.
+    """
+
+    __slots__ = ("id", "holdings")
+
+    def __init__(self, id: Hashable = None):
+        self.id: Hashable = id
+        self.holdings: List[Holding] = []
+
+    def __repr__(self) -> str:
+        return f"<Portfolio id={self.id!r} holdings={len(self.holdings)}>"
+
+    def __len__(self) -> int:
+        return len(self.holdings)
+
+    def add_stock(self, ticker: str, quantity: float, *, currency: str = "USD") -> None:
+        """Adds a stock position.
+
+        Parameters
+        -----------
+        ticker: :class:`str`
+            The ticker of the stock.
+        quantity: :class:`float`
+            The number of shares.
+        currency: :class:`str`
+            The currency the stock's price is quoted in. Defaults to ``USD``.
+        """
+        self.holdings.append(Holding("stock", ticker, quantity, currency))
+
+    def add_crypto(self, symbol: str, quantity: float, *, currency: str = "USD") -> None:
+        """Adds a cryptocurrency position.
+
+        Parameters
+        -----------
+        symbol: :class:`str`
+            The symbol of the cryptocurrency, e.g. ``BTCUSD``.
+        quantity: :class:`float`
+            The number of coins.
+        currency: :class:`str`
+            The currency the cryptocurrency's price is quoted in. Defaults to ``USD``.
+        """
+        self.holdings.append(Holding("crypto", symbol, quantity, currency))
+
+    def add_commodity(self, type: CommodityType, quantity: float, *, currency: str = "USD") -> None:
+        """Adds a commodity future position.
+
+        Parameters
+        -----------
+        type: :class:`CommodityType`
+            The type of the commodity future.
+        quantity: :class:`float`
+            The number of contracts.
+        currency: :class:`str`
+            The currency the commodity future's price is quoted in. Defaults to ``USD``.
+        """
+        self.holdings.append(Holding("commodity", type, quantity, currency))
+
+    def add_cash(self, currency: str, amount: float) -> None:
+        """Adds a cash position.
+
+        Parameters
+        -----------
+        currency: :class:`str`
+            The currency name, e.g. ``CHF``.
+        amount: :class:`float`
+            The amount of cash.
+        """
+        self.holdings.append(Holding("cash", currency, amount, currency))
+
+
+class Valuation(NamedTuple):
+    """A namedtuple which represents the result of :meth:`ValuationEngine.value`.
+
+    Attributes
+    -----------
+    totals: Union[:class:`numpy.ndarray`, List[:class:`float`]]
+        The total value of each portfolio in the base currency, in the order they were passed.
+        ``nan`` for portfolios holding an instrument which could not be retrieved.
+    prices: Dict[Tuple[:class:`str`, Union[:class:`str`, :class:`CommodityType`]], :class:`float`]
+        The retrieved price of each distinct instrument. Tickers and symbols are upper case.
+    rates: Dict[:class:`str`, :class:`float`]
+        The retrieved exchange rate of each distinct currency into the base currency.
+        Currency names are upper case.
+    errors: Dict[Union[Tuple[:class:`str`, Union[:class:`str`, :class:`CommodityType`]], :class:`str`], :exc:`Exception`]
+        The error of each instrument or currency which could not be retrieved, either an
+        :exc:`APINinjasBaseException`, :exc:`aiohttp.ClientError` or :exc:`asyncio.TimeoutError`.
+    """
+
+    totals: Any
+    prices: Dict[InstrumentKey, float]
+    rates: Dict[str, float]
+    errors: Dict[Union[InstrumentKey, str], Exception]
+
+
+class ValuationEngine:
+    """Values many portfolios at once with as few API calls as possible.
+
+    Every distinct instrument and currency across all portfolios is retrieved once and
+    concurrently. The totals are then computed in a single vectorized pass if :mod:`numpy`
+    is installed, so valuing many portfolios costs roughly one API call per distinct
+    instrument and currency.
+
+    Parameters
+    -----------
+    client: :class:`Client`
+        The client used to retrieve prices and exchange rates.
+    concurrency: :class:`int`
+        The maximum number of concurrent API calls. Defaults to ``10``.
+    """
+
+    def __init__(self, client: Client, *, concurrency: int = 10):
+        self.client: Client = client
+        self.concurrency: int = concurrency
+
+    async def _fetch_price(self, key: InstrumentKey) -> float:
+        kind, name = key
+        if kind == "stock":
+            instrument = await self.client.fetch_stock(name)  # type: ignore # always a ticker
+        elif kind == "crypto":
+            instrument = await self.client.fetch_crypto(name)  # type: ignore # always a symbol
+        else:
+            instrument = await self.client.fetch_commodity(name)  # type: ignore # always a type
+        return instrument.price
+
+    async def _fetch_rate(self, currency: str, base: str) -> float:
+        if currency.upper() == base.upper():
+            return 1.0
+        converted = await self.client.fetch_currency(base, reference=currency)
+        return converted.exchange_rate
+
+    async def value(self, portfolios: Sequence[Portfolio], *, base: str) -> Valuation:
+        """|coro|
+
+        Values the given portfolios in the base currency.
+
+        .. note::
+
+            This makes one API call per distinct instrument and currency,
+            or less if a :attr:`Client.currency_graph` is set up.
+
+        Parameters
+        -----------
+        portfolios: Sequence[:class:`Portfolio`]
+            The portfolios to value.
+        base: :class:`str`
+            The currency to value the portfolios in, e.g. ``EUR``.
+
+        Returns
+        --------
+        :class:`Valuation`
+            The totals of the portfolios along with the retrieved prices and rates.
+        """
+        instruments: Dict[InstrumentKey, int] = {}
+        currencies: Dict[str, int] = {}
+        rows: List[Tuple[int, int, int, float]] = []
+        for index, portfolio in enumerate(portfolios):
+            for holding in portfolio.holdings:
+                instrument = -1
+                if holding.kind != "cash":
+                    key = holding.key if holding.kind == "commodity" else holding.key.upper()  # type: ignore
+                    instrument = instruments.setdefault((holding.kind, key), len(instruments))
+                currency = currencies.setdefault(holding.currency.upper(), len(currencies))
+                rows.append((index, instrument, currency, holding.quantity))
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        errors: Dict[Union[InstrumentKey, str], Exception] = {}
+
+        async def run(key: Union[InstrumentKey, str], coro: Any) -> float:
+            async with semaphore:
+                try:
+                    return await coro
+                except (APINinjasBaseException, aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                    errors[key] = exc
+                    return math.nan
+
+        results = await asyncio.gather(
+            *(run(key, self._fetch_price(key)) for key in instruments),
+            *(run(currency, self._fetch_rate(currency, base)) for currency in currencies),
+        )
+        price_values = results[: len(instruments)]
+        rate_values = results[len(instruments) :]
+
+        np = import_optional("numpy")
+        if np is None:
+            totals = [0.0] * len(portfolios)
+            for index, instrument, currency, quantity in rows:
+                price = price_values[instrument] if instrument != -1 else 1.0
+                totals[index] += quantity * price * rate_values[currency]
+        else:
+            table = np.array(rows, dtype=np.float64).reshape(-1, 4)
+            index, instrument, currency = (
+                table[:, 0].astype(np.intp),
+                table[:, 1].astype(np.intp),
+                table[:, 2],
+            )
+            # cash has no instrument and is priced at 1, which is stored at the end
+            prices = np.append(np.asarray(price_values, dtype=np.float64), 1.0)
+            rates = np.asarray(rate_values, dtype=np.float64)
+            values = table[:, 3] * prices[instrument] * rates[currency.astype(np.intp)]
+            totals = np.bincount(index, weights=values, minlength=len(portfolios))
+
+        return Valuation(
+            totals=totals,
+            prices=dict(zip(instruments, price_values)),
+            rates=dict(zip(currencies, rate_values)),
+            errors=errors,
+        )
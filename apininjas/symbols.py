@@ -0,0 +1,245 @@
+"""
+MIT License
+
+Copyright (c) 2024-present codeofandrin
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import time
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .http import HTTPClient
+
+
+# fmt: off
+__all__ = (
+    "CryptoSymbolIndex",
+)
+# fmt: on
+
+
+# fmt: off
+_QUOTE_ASSETS = (
+    "USDT", "USDC", "BUSD", "TUSD", "FDUSD", "USDP", "DAI", "UST",
+    "BTC", "ETH", "BNB", "XRP", "TRX", "DOGE",
+    "USD", "EUR", "GBP", "JPY", "AUD", "CAD", "CHF", "TRY", "BRL", "RUB", "UAH", "ZAR", "IDR", "NGN",
+)
+# fmt: on
+# longest first, so e.g. BUSD is not split into B and USD
+_QUOTE_ASSETS = tuple(sorted(_QUOTE_ASSETS, key=len, reverse=True))
+
+
+class CryptoSymbolIndex:
+    """Represents an index of the available cryptocurrency symbols for local lookups.
+
+    The symbols are retrieved from the API once and refreshed in the background once
+    they are older than :attr:`max_age`, while the stale ones keep being served.
+
+    .. container:: operations
+
+        .. describe:: x in y
+
+            Checks if a symbol is available, case-insensitive.
+
+        .. describe:: len(x)
+
+            Returns the number of available symbols.
+
+        .. describe:: iter(x)
+
+            Returns an iterator over the available symbols in alphabetical order.
+
+    Attributes
+    -----------
+    max_age: :class:`float`
+        The maximum age of the symbols in seconds until they are refreshed.
+    """
+
+    def __init__(self, http: HTTPClient, *, max_age: float = 3600.0):
+        self._http: HTTPClient = http
+        self.max_age: float = max_age
+
+        self._symbols: FrozenSet[str] = frozenset()
+        self._sorted: List[str] = []
+        self._by_base: Dict[str, List[str]] = {}
+        self._by_quote: Dict[str, List[str]] = {}
+        self._loaded: float = 0.0
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def __repr__(self) -> str:
+        return f"<CryptoSymbolIndex symbols={len(self._symbols)}>"
+
+    def __contains__(self, symbol: object) -> bool:
+        return isinstance(symbol, str) and symbol.upper() in self._symbols
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sorted)
+
+    @staticmethod
+    def split(symbol: str) -> Optional[Tuple[str, str]]:
+        """Splits a symbol into its base and quote asset.
+
+        Only common quote assets like ``USDT``, ``BTC`` or ``EUR`` are recognized.
+
+        Parameters
+        -----------
+        symbol: :class:`str`
+            The symbol to split, e.g. ``ETHUSDT``.
+
+        Returns
+        --------
+        Optional[Tuple[:class:`str`, :class:`str`]]
+            The base and quote asset, e.g. ``("ETH", "USDT")``, or ``None`` if the quote asset is unknown.
+        """
+        symbol = symbol.upper()
+        for quote in _QUOTE_ASSETS:
+            if symbol.endswith(quote) and len(symbol) > len(quote):
+                return symbol[: -len(quote)], quote
+        return None
+
+    def _load(self, symbols: Iterable[str]) -> None:
+        ordered = sorted({symbol.upper() for symbol in symbols})
+
+        by_base: Dict[str, List[str]] = {}
+        by_quote: Dict[str, List[str]] = {}
+        for symbol in ordered:
+            assets = self.split(symbol)
+            if assets is not None:
+                by_base.setdefault(assets[0], []).append(symbol)
+                by_quote.setdefault(assets[1], []).append(symbol)
+
+        self._symbols = frozenset(ordered)
+        self._sorted = ordered
+        self._by_base = by_base
+        self._by_quote = by_quote
+        self._loaded = time.monotonic()
+
+    def is_loaded(self) -> bool:
+        """:class:`bool`: Whether the symbols have been retrieved at least once."""
+        return self._loaded != 0.0
+
+    def is_fresh(self) -> bool:
+        """:class:`bool`: Whether the symbols were retrieved within :attr:`max_age`."""
+        return self.is_loaded() and time.monotonic() - self._loaded <= self.max_age
+
+    async def refresh(self) -> None:
+        """|coro|
+
+        Retrieves the available symbols.
+
+        .. note::
+
+            This makes an API call.
+
+        Raises
+        -------
+        HTTPException
+            Retrieving the symbols failed.
+        """
+        data = await self._http.get_crypto_symbols()
+        self._load(data["symbols"])
+
+    async def _refresh_in_background(self) -> None:
+        try:
+            await self.refresh()
+        except Exception:
+            # the stale symbols are kept and the next lookup tries again
+            pass
+        finally:
+            self._task = None
+
+    async def ensure_loaded(self) -> None:
+        """|coro|
+
+        Retrieves the symbols if they were never retrieved, or schedules a refresh in
+        the background if they are stale.
+
+        Raises
+        -------
+        HTTPException
+            Retrieving the symbols for the first time failed.
+        """
+        if not self.is_loaded():
+            await self.refresh()
+        elif not self.is_fresh() and self._task is None:
+            self._task = asyncio.create_task(self._refresh_in_background())
+
+    def close(self) -> None:
+        """Cancels a running background refresh."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def startswith(self, prefix: str) -> List[str]:
+        """Returns the symbols starting with the given prefix, case-insensitive.
+
+        Parameters
+        -----------
+        prefix: :class:`str`
+            The prefix, e.g. ``BTC``.
+
+        Returns
+        --------
+        List[:class:`str`]
+            The matching symbols in alphabetical order.
+        """
+        prefix = prefix.upper()
+        start = bisect.bisect_left(self._sorted, prefix)
+        # every symbol with the prefix sorts before the prefix followed by the highest character
+        end = bisect.bisect_left(self._sorted, prefix + "\U0010ffff", lo=start)
+        return self._sorted[start:end]
+
+    def with_base(self, base: str) -> List[str]:
+        """Returns the symbols with the given base asset, e.g. all ``BTC*`` pairs.
+
+        Parameters
+        -----------
+        base: :class:`str`
+            The base asset, e.g. ``BTC``.
+
+        Returns
+        --------
+        List[:class:`str`]
+            The matching symbols in alphabetical order.
+        """
+        return list(self._by_base.get(base.upper(), ()))
+
+    def with_quote(self, quote: str) -> List[str]:
+        """Returns the symbols with the given quote asset, e.g. all ``*USDT`` pairs.
+
+        Parameters
+        -----------
+        quote: :class:`str`
+            The quote asset, e.g. ``USDT``.
+
+        Returns
+        --------
+        List[:class:`str`]
+            The matching symbols in alphabetical order.
+        """
+        return list(self._by_quote.get(quote.upper(), ()))
@@ -0,0 +1,409 @@
+"""
+MIT License
+
+Copyright (c) 2024-present codeofandrin
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import urllib.parse
+from array import array
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .abc import _PriceListener
+from .utils import import_optional
+
+if TYPE_CHECKING:
+    from .abc import FinancialInstrument
+    from .client import Client
+
+    Columns = Tuple[Any, Any]
+
+
+# fmt: off
+__all__ = (
+    "TickStore",
+)
+# fmt: on
+
+
+_TIMESTAMPS = ".timestamps"
+_PRICES = ".prices"
+# marks a compaction whose rewritten files are complete but not yet all in place
+_COMPACTING = ".compacting"
+
+
+def _numpy() -> Any:
+    np = import_optional("numpy")
+    if np is None:
+        raise RuntimeError("numpy is required to read from a TickStore, but it's not installed")
+    return np
+
+
+class TickStore(_PriceListener):
+    """Represents an append-only store of the prices of many instruments on disk.
+
+    Every instrument is stored in two columnar files in the directory, one with the
+    timestamps as 64-bit integers and one with the prices as 64-bit floats. The files
+    are memory-mapped for reading, so queries return views into them without copying.
+
+    The ticks of an instrument are kept in ascending order of their timestamps. A tick
+    which is not newer than the last one of the instrument is ignored, e.g. when an
+    unchanged price is polled again.
+
+    .. note::
+
+        Reading requires :mod:`numpy`.
+
+    .. container:: operations
+
+        .. describe:: x in y
+
+            Checks if the store has ticks of an instrument.
+
+        .. describe:: len(x)
+
+            Returns the number of instruments in the store.
+
+    Parameters
+    -----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        The directory of the store. It's created if it doesn't exist.
+    buffer_size: :class:`int`
+        The number of ticks of an instrument buffered in memory until they are written
+        to disk. Defaults to ``1024``.
+    retention: Optional[:class:`int`]
+        The time in seconds ticks are kept for. Older ticks of an instrument are removed
+        when its buffered ticks are written, once they make up a quarter of the retention,
+        so the files aren't rewritten on every write. This requires :mod:`numpy`.
+        Defaults to ``None``, which keeps all ticks until :meth:`compact` is called.
+
+    Raises
+    -------
+    RuntimeError
+        ``retention`` is passed, but :mod:`numpy` is not installed.
+    """
+
+    def __init__(
+        self, path: Union[str, os.PathLike[str]], *, buffer_size: int = 1024, retention: Optional[int] = None
+    ):
+        if retention is not None:
+            _numpy()
+
+        self.path: Union[str, os.PathLike[str]] = path
+        self.buffer_size: int = buffer_size
+        self.retention: Optional[int] = retention
+        os.makedirs(path, exist_ok=True)
+        self._recover()
+
+        self._pending: Dict[str, Tuple[array[int], array[float]]] = {}
+        self._last: Dict[str, int] = {}
+        # key -> (number of ticks, timestamps, prices) of the open memory maps
+        self._maps: Dict[str, Tuple[int, Any, Any]] = {}
+
+    def __repr__(self) -> str:
+        return f"<TickStore path={self.path!r}>"
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and (key in self._pending or os.path.exists(self._file(key, _TIMESTAMPS)))
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def _file(self, key: str, column: str) -> str:
+        return os.path.join(self.path, urllib.parse.quote(key, safe="") + column)
+
+    def _recover(self) -> None:
+        # finishes the compactions interrupted by a crash and removes the files of unfinished ones
+        names = os.listdir(self.path)
+        for name in names:
+            if name.endswith(_COMPACTING):
+                key = urllib.parse.unquote(name[: -len(_COMPACTING)])
+                self._replace_compacted(key)
+        for name in names:
+            if name.endswith(".tmp") and os.path.exists(path := os.path.join(self.path, name)):
+                os.remove(path)
+
+    def _replace_compacted(self, key: str) -> None:
+        for column in (_PRICES, _TIMESTAMPS):
+            path = self._file(key, column)
+            if os.path.exists(f"{path}.tmp"):
+                os.replace(f"{path}.tmp", path)
+        os.remove(self._file(key, _COMPACTING))
+
+    def _stored(self, key: str) -> int:
+        # the number of ticks of the instrument on disk
+        try:
+            return os.path.getsize(self._file(key, _TIMESTAMPS)) // 8
+        except FileNotFoundError:
+            return 0
+
+    def _last_timestamp(self, key: str) -> Optional[int]:
+        last = self._last.get(key)
+        if last is None and self._stored(key):
+            with open(self._file(key, _TIMESTAMPS), "rb") as file:
+                file.seek(-8, os.SEEK_END)
+                last = array("q", file.read(8))[0]
+            self._last[key] = last
+        return last
+
+    def _first_timestamp(self, key: str) -> Optional[int]:
+        if not self._stored(key):
+            return None
+        with open(self._file(key, _TIMESTAMPS), "rb") as file:
+            return array("q", file.read(8))[0]
+
+    def keys(self) -> List[str]:
+        """Returns the instruments in the store.
+
+        Returns
+        --------
+        List[:class:`str`]
+            The keys of the instruments, in alphabetical order.
+        """
+        stored = {
+            urllib.parse.unquote(name[: -len(_TIMESTAMPS)])
+            for name in os.listdir(self.path)
+            if name.endswith(_TIMESTAMPS)
+        }
+        return sorted(stored.union(self._pending))
+
+    def append(self, key: str, timestamp: int, price: float) -> bool:
+        """Appends a tick of an instrument.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The key of the instrument, e.g. ``stock:AAPL`` like the ticks recorded with :meth:`attach`.
+        timestamp: :class:`int`
+            The Unix timestamp the price was updated at.
+        price: :class:`float`
+            The price.
+
+        Returns
+        --------
+        :class:`bool`
+            Whether the tick was appended. ``False`` if it's not newer than the last one.
+        """
+        last = self._last_timestamp(key)
+        if last is not None and timestamp <= last:
+            return False
+
+        self._last[key] = timestamp
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = (array("q"), array("d"))
+        pending[0].append(timestamp)
+        pending[1].append(price)
+
+        if len(pending[0]) >= self.buffer_size:
+            self.flush(key)
+        return True
+
+    def _on_price(self, instrument: FinancialInstrument, previous: Optional[float]) -> None:
+        self.append(f"{instrument._kind()}:{instrument._key()}", instrument._updated, instrument.price)
+
+    def _on_close(self) -> Optional[Callable[[], None]]:
+        return self.flush
+
+    def attach(self, client: Client) -> None:
+        """Records every price the client retrieves from now on, e.g. with
+        :meth:`Client.fetch_stock` or :meth:`.FinancialInstrument.update`.
+
+        The ticks are stored with the kind of the instrument prepended to its key,
+        e.g. ``stock:AAPL``, ``commodity:gold`` or ``crypto:BTCUSD``, so instruments
+        of different kinds never share their files. The buffered ticks are written
+        to disk when the client is closed.
+
+        Parameters
+        -----------
+        client: :class:`Client`
+            The client to record the prices of.
+        """
+        self._attach(client)
+
+    def detach(self, client: Client) -> None:
+        """Stops recording the prices of the client.
+
+        Parameters
+        -----------
+        client: :class:`Client`
+            The client to stop recording the prices of.
+        """
+        self._detach(client)
+
+    def flush(self, key: Optional[str] = None) -> None:
+        """Writes the buffered ticks to disk.
+
+        Parameters
+        -----------
+        key: Optional[:class:`str`]
+            The instrument to write the ticks of. Defaults to ``None``, which writes all.
+        """
+        keys = list(self._pending) if key is None else [key]
+        for key in keys:
+            pending = self._pending.pop(key, None)
+            if pending is None:
+                continue
+            # prices first, so the timestamps never refer to missing prices after a crash,
+            # and prices left over by one are cut off
+            stored = self._stored(key)
+            with open(self._file(key, _PRICES), "ab") as file:
+                file.truncate(stored * 8)
+                pending[1].tofile(file)
+            with open(self._file(key, _TIMESTAMPS), "ab") as file:
+                pending[0].tofile(file)
+
+            retention = self.retention
+            if retention is not None:
+                before = int(time.time()) - retention
+                first = self._first_timestamp(key)
+                if first is not None and first < before - retention // 4:
+                    self._compact(key, before)
+
+    def _columns(self, key: str) -> Columns:
+        np = _numpy()
+        self.flush(key)
+
+        count = self._stored(key)
+        cached = self._maps.get(key)
+        if cached is not None and cached[0] == count:
+            return cached[1], cached[2]
+
+        if not count:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        timestamps = np.memmap(self._file(key, _TIMESTAMPS), dtype=np.int64, mode="r", shape=(count,))
+        prices = np.memmap(self._file(key, _PRICES), dtype=np.float64, mode="r", shape=(count,))
+        self._maps[key] = (count, timestamps, prices)
+        return timestamps, prices
+
+    def range(self, key: str, start: Optional[int] = None, end: Optional[int] = None) -> Columns:
+        """Returns the ticks of an instrument within a time range.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The key of the instrument, e.g. ``stock:AAPL`` for ticks recorded with :meth:`attach`.
+        start: Optional[:class:`int`]
+            The Unix timestamp to start at, inclusive. Defaults to the first tick.
+        end: Optional[:class:`int`]
+            The Unix timestamp to end at, exclusive. Defaults to after the last tick.
+
+        Raises
+        -------
+        RuntimeError
+            :mod:`numpy` is not installed.
+
+        Returns
+        --------
+        Tuple[:class:`numpy.ndarray`, :class:`numpy.ndarray`]
+            The timestamps and prices, as read-only views into the memory-mapped files.
+        """
+        np = _numpy()
+        timestamps, prices = self._columns(key)
+        lower = 0 if start is None else int(np.searchsorted(timestamps, start, side="left"))
+        upper = len(timestamps) if end is None else int(np.searchsorted(timestamps, end, side="left"))
+        return timestamps[lower:upper], prices[lower:upper]
+
+    def scan(
+        self, start: Optional[int] = None, end: Optional[int] = None, *, keys: Optional[Iterable[str]] = None
+    ) -> Dict[str, Columns]:
+        """Returns the ticks of many instruments within a time range.
+
+        Parameters
+        -----------
+        start: Optional[:class:`int`]
+            The Unix timestamp to start at, inclusive. Defaults to the first tick.
+        end: Optional[:class:`int`]
+            The Unix timestamp to end at, exclusive. Defaults to after the last tick.
+        keys: Optional[Iterable[:class:`str`]]
+            The keys of the instruments to scan, e.g. ``stock:AAPL``. Defaults to ``None``, which scans all.
+
+        Raises
+        -------
+        RuntimeError
+            :mod:`numpy` is not installed.
+
+        Returns
+        --------
+        Dict[:class:`str`, Tuple[:class:`numpy.ndarray`, :class:`numpy.ndarray`]]
+            The timestamps and prices of every instrument with ticks in the range, see :meth:`range`.
+        """
+        result = {}
+        for key in self.keys() if keys is None else keys:
+            timestamps, prices = self.range(key, start, end)
+            if len(timestamps):
+                result[key] = (timestamps, prices)
+        return result
+
+    def compact(self, *, before: int) -> int:
+        """Removes the ticks older than a timestamp.
+
+        The files are rewritten and replaced atomically. Views returned before
+        stay valid and keep referring to the old data. A compaction interrupted by
+        a crash is completed when the store is opened again.
+
+        Parameters
+        -----------
+        before: :class:`int`
+            The Unix timestamp before which the ticks are removed.
+
+        Raises
+        -------
+        RuntimeError
+            :mod:`numpy` is not installed.
+
+        Returns
+        --------
+        :class:`int`
+            The number of removed ticks.
+        """
+        _numpy()
+        return sum(self._compact(key, before) for key in self.keys())
+
+    def _compact(self, key: str, before: int) -> int:
+        np = _numpy()
+        timestamps, prices = self._columns(key)
+        cut = int(np.searchsorted(timestamps, before, side="left"))
+        if not cut:
+            return 0
+
+        self._maps.pop(key, None)
+        if cut == len(timestamps):
+            os.remove(self._file(key, _TIMESTAMPS))
+            os.remove(self._file(key, _PRICES))
+            return cut
+
+        # both columns are replaced only once both are written, and the marker lets a store
+        # opened after a crash in between replace the rest, so the columns never misalign
+        for column, values in ((_PRICES, prices[cut:]), (_TIMESTAMPS, timestamps[cut:])):
+            values.tofile(f"{self._file(key, column)}.tmp")
+        open(self._file(key, _COMPACTING), "wb").close()
+        self._replace_compacted(key)
+        return cut
+
+    def close(self) -> None:
+        """Writes the buffered ticks to disk and closes the memory maps."""
+        self.flush()
+        self._maps.clear()
@@ -25,8 +25,10 @@ SOFTWARE.
 from __future__ import annotations
 
 import datetime
+import functools
+import importlib
 import inspect
-from typing import Callable, Any, TypeVar
+from typing import Callable, Any, Dict, Generic, List, Literal, Optional, TypeVar, overload
 
 
 # fmt: off
@@ -38,6 +40,9 @@ __all__ = (
 
 
 T = TypeVar("T")
+T_co = TypeVar("T_co", covariant=True)
+
+ColumnarFormat = Literal["numpy", "pandas", "arrow"]
 
 
 class _MissingSentinel:
@@ -56,8 +61,52 @@ class _MissingSentinel:
 MISSING: Any = _MissingSentinel()
 
 
+class CachedSlotProperty(Generic[T, T_co]):
+    def __init__(self, name: str, function: Callable[[T], T_co]) -> None:
+        self.name = name
+        self.function = function
+        self.__doc__ = getattr(function, "__doc__")
+
+    @overload
+    def __get__(self, instance: None, owner: type[T]) -> CachedSlotProperty[T, T_co]: ...
+
+    @overload
+    def __get__(self, instance: T, owner: type[T]) -> T_co: ...
+
+    def __get__(self, instance: T | None, owner: type[T]) -> Any:
+        if instance is None:
+            return self
+
+        try:
+            return getattr(instance, self.name)
+        except AttributeError:
+            value = self.function(instance)
+            setattr(instance, self.name, value)
+            return value
+
+
+def cached_slot_property(name: str) -> Callable[[Callable[[T], T_co]], CachedSlotProperty[T, T_co]]:
+    # like a property, but the value is computed once and stored in the given slot
+    def decorator(func: Callable[[T], T_co]) -> CachedSlotProperty[T, T_co]:
+        return CachedSlotProperty(name, func)
+
+    return decorator
+
+
+def reset_cached_slots(instance: Any, *names: str) -> None:
+    # invalidates the values stored by cached_slot_property
+    for name in names:
+        try:
+            delattr(instance, name)
+        except AttributeError:
+            pass
+
+
+@functools.lru_cache(maxsize=4096)
 def from_timestamp(timestamp: int, /) -> datetime.datetime:
-    """A helper function that converts a given timestamp into a :class:`~datetime.datetime` object.
+    """A helper function that converts a given timestamp into an aware :class:`~datetime.datetime` object in UTC.
+
+    The results are cached, since many objects usually share the same timestamps.
 
     Parameters
     -----------
@@ -69,7 +118,7 @@ def from_timestamp(timestamp: int, /) -> datetime.datetime:
     :class:`datetime.datetime`
         The datetime object from the given timestamp.
     """
-    return datetime.datetime.fromtimestamp(timestamp)
+    return datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc)
 
 
 def copy_doc(original: Callable[..., Any]) -> Callable[[T], T]:
@@ -79,3 +128,47 @@ def copy_doc(original: Callable[..., Any]) -> Callable[[T], T]:
         return overridden
 
     return decorator
+
+
+@functools.lru_cache(maxsize=None)
+def import_optional(name: str) -> Any:
+    # returns None if the optional dependency is not installed
+    try:
+        return importlib.import_module(name)
+    except ModuleNotFoundError:
+        return None
+
+
+_COLUMNAR_MODULES: Dict[str, str] = {"numpy": "numpy", "pandas": "pandas", "arrow": "pyarrow"}
+
+
+def to_columns(
+    columns: Dict[str, List[Any]], format: ColumnarFormat, *, dtypes: Optional[Dict[str, str]] = None
+) -> Any:
+    # builds a dict of numpy arrays, a pandas DataFrame or a pyarrow Table from lists of values
+    try:
+        name = _COLUMNAR_MODULES[format]
+    except KeyError:
+        raise ValueError(f"format must be one of 'numpy', 'pandas' or 'arrow', not {format!r}") from None
+
+    module = import_optional(name)
+    if module is None:
+        raise RuntimeError(f"{name} is required for format={format!r}, but it's not installed")
+
+    if format == "numpy":
+        arrays = {}
+        for column, values in columns.items():
+            dtype = (dtypes or {}).get(column)
+            if dtype is not None and dtype.startswith("datetime64"):
+                # converting datetimes is slow, so each distinct one is converted only once
+                distinct = {value: code for code, value in enumerate(dict.fromkeys(values))}
+                codes = module.fromiter(
+                    map(distinct.__getitem__, values), dtype=module.intp, count=len(values)
+                )
+                arrays[column] = module.asarray(list(distinct), dtype=dtype)[codes]
+            else:
+                arrays[column] = module.asarray(values, dtype=dtype)
+        return arrays
+    if format == "pandas":
+        return module.DataFrame(columns)
+    return module.table(columns)
@@ -0,0 +1,77 @@
+"""
+MIT License
+
+Copyright (c) 2024-present codeofandrin
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# Measures decoding and constructing models from large response bodies with the schema
+# decoders against json.loads, which is also used when msgspec is not installed.
+#
+# Usage: python benchmarks/bench_decoders.py
+
+from __future__ import annotations
+
+import json
+import timeit
+import types
+from typing import List
+
+from apininjas.decoders import get_decoder
+from apininjas.finance import Crypto, Inflation
+from apininjas.types import finance
+
+
+ROWS = 200_000
+BODIES = 1_000_000
+
+
+def main() -> None:
+    decoder = get_decoder(List[finance.Inflation])
+    if decoder is json.loads:
+        print("msgspec is not installed, both sides use json.loads")
+
+    body = json.dumps(
+        [
+            {
+                "country": "Germany",
+                "type": "CPI",
+                "period": "Jan 2024",
+                "monthly_rate_pct": 0.1,
+                "yearly_rate_pct": 2.0,
+            }
+        ]
+        * ROWS
+    ).encode()
+    before = timeit.timeit(lambda: [Inflation(data=data) for data in json.loads(body)], number=1)
+    after = timeit.timeit(lambda: [Inflation(data=data) for data in decoder(body)], number=1)
+    print(f"{ROWS} Inflation rows from one body  {before:8.3f}s -> {after:8.3f}s")
+
+    # only what the models access on the client
+    http = types.SimpleNamespace(price_listeners=[], price_history=None)
+    crypto = get_decoder(finance.Crypto)
+    body = b'{"symbol": "BTCUSDT", "price": "42000.50000000", "timestamp": 1706302801}'
+    before = timeit.timeit(lambda: Crypto(http=http, data=json.loads(body)), number=BODIES)  # type: ignore
+    after = timeit.timeit(lambda: Crypto(http=http, data=crypto(body)), number=BODIES)  # type: ignore
+    print(f"{BODIES} single Crypto bodies          {before:8.3f}s -> {after:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+MIT License
+
+Copyright (c) 2024-present codeofandrin
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# Measures the enum lookups of bulk Inflation construction against the previous lookup,
+# which went through Enum.__new__ and allocated a new fallback object for every unknown value.
+#
+# Usage: python benchmarks/bench_enums.py
+
+from __future__ import annotations
+
+import enum
+import random
+import timeit
+
+from apininjas.enums import InflationCountry, InflationIndicatorType
+from apininjas.finance import Inflation
+
+
+ROWS = 100_000
+# the share of countries the enum doesn't know
+UNKNOWN = 0.1
+
+
+class _LegacyMeta(enum.EnumMeta):
+    def __call__(cls, value, names=None, **kwargs):
+        if names is not None:
+            return super().__call__(value, names=names, **kwargs)
+        try:
+            return super().__call__(value)
+        except ValueError:
+            obj = object.__new__(cls)
+            obj._value_ = value
+            obj._name_ = f"unknown_{value}"
+            return obj
+
+
+class _LegacyEnum(enum.Enum, metaclass=_LegacyMeta):
+    pass
+
+
+def _legacy(cls: type[enum.Enum]) -> type[enum.Enum]:
+    return _LegacyEnum(f"Legacy{cls.__name__}", names=[(member.name, member.value) for member in cls])  # type: ignore
+
+
+def make_payloads() -> list[dict]:
+    rng = random.Random(0)
+    countries = [country.value for country in InflationCountry]
+    unknown = [f"Country {index}" for index in range(20)]
+    return [
+        {
+            "country": rng.choice(unknown) if rng.random() < UNKNOWN else rng.choice(countries),
+            "type": rng.choice(("CPI", "HICP")),
+            "period": "Jan 2024",
+            "monthly_rate_pct": 0.1,
+            "yearly_rate_pct": 2.0,
+        }
+        for _ in range(ROWS)
+    ]
+
+
+def main() -> None:
+    payloads = make_payloads()
+    legacy_country = _legacy(InflationCountry)
+    legacy_type = _legacy(InflationIndicatorType)
+
+    before = timeit.timeit(
+        lambda: [(legacy_country(data["country"]), legacy_type(data["type"])) for data in payloads], number=1
+    )
+    after = timeit.timeit(
+        lambda: [
+            (InflationCountry(data["country"]), InflationIndicatorType(data["type"])) for data in payloads
+        ],
+        number=1,
+    )
+    print(f"{ROWS} enum lookups ({UNKNOWN:.0%} unknown)  {before:8.3f}s -> {after:8.3f}s")
+
+    construct = timeit.timeit(lambda: [Inflation(data=data) for data in payloads], number=1)  # type: ignore
+    print(f"{ROWS} Inflation constructions        {construct:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
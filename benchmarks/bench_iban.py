@@ -0,0 +1,77 @@
+"""
+MIT License
+
+Copyright (c) 2024-present codeofandrin
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# Measures the local validation of 1M IBANs, comparing the vectorized mod-97 check with
+# numpy against the pure-Python fallback used when numpy is not installed.
+#
+# Usage: python benchmarks/bench_iban.py
+
+from __future__ import annotations
+
+import random
+import timeit
+from unittest import mock
+
+from apininjas import iban
+from apininjas.utils import import_optional
+
+
+ROWS = 1_000_000
+# the share of IBANs with a wrong check digit
+INVALID = 0.05
+
+
+def make_ibans() -> list[str]:
+    rng = random.Random(0)
+    ibans = []
+    for _ in range(ROWS):
+        bban = "".join(rng.choice("0123456789") for _ in range(18))
+        check = 98 - int(f"{bban}DE00".translate(iban._DIGITS)) % 97
+        if rng.random() < INVALID:
+            check = check % 97 + 1
+        ibans.append(f"DE{check:02d}{bban}")
+    return ibans
+
+
+def main() -> None:
+    ibans = make_ibans()
+
+    # the fallback runs when numpy can't be imported
+    with mock.patch.object(iban, "import_optional", return_value=None):
+        fallback = timeit.timeit(lambda: iban._mod97(ibans), number=1)
+        expected = iban._mod97(ibans)
+
+    if import_optional("numpy") is None:
+        print("numpy is not installed, only the fallback is measured")
+    else:
+        vectorized = timeit.timeit(lambda: iban._mod97(ibans), number=1)
+        assert iban._mod97(ibans) == expected
+        print(f"{ROWS} mod-97 checks  {fallback:8.3f}s -> {vectorized:8.3f}s")
+
+    validate = timeit.timeit(lambda: iban.validate_ibans(ibans), number=1)
+    print(f"{ROWS} validate_ibans {validate:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
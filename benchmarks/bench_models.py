@@ -0,0 +1,109 @@
+"""
+MIT License
+
+Copyright (c) 2024-present codeofandrin
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# Measures the memoized Stock.updated_at and Inflation.period against computing them on
+# every access, as before they were cached in slots.
+#
+# Usage: python benchmarks/bench_models.py
+
+from __future__ import annotations
+
+import datetime
+import random
+import timeit
+import types
+
+from apininjas.finance import Inflation, Stock
+
+
+ROWS = 100_000
+MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+# 300 distinct periods, like the full dataset of the Inflation API
+PERIODS = [f"{month} {year}" for year in range(2000, 2025) for month in MONTHS]
+
+
+def make_inflations() -> list[Inflation]:
+    rng = random.Random(0)
+    return [
+        Inflation(
+            data={
+                "country": "Germany",
+                "type": "CPI",
+                "period": rng.choice(PERIODS),
+                "monthly_rate_pct": 0.1,
+                "yearly_rate_pct": 2.0,
+            }
+        )
+        for _ in range(ROWS)
+    ]
+
+
+def make_stock() -> Stock:
+    # only what the models access on the client
+    http = types.SimpleNamespace(price_listeners=[], price_history=None)
+    data = {
+        "ticker": "AAPL",
+        "name": "Apple Inc.",
+        "exchange": "NASDAQ",
+        "price": 192.42,
+        "updated": 1706302801,
+    }
+    return Stock(http=http, data=data)  # type: ignore
+
+
+def parse_period(inflation: Inflation) -> datetime.datetime:
+    return datetime.datetime.strptime(inflation._period, "%b %Y")
+
+
+def bench(name: str, baseline, current, number: int = 1) -> None:
+    before = timeit.timeit(baseline, number=number)
+    after = timeit.timeit(current, number=number)
+    print(f"{name:<32} {before:8.3f}s -> {after:8.3f}s")
+
+
+def main() -> None:
+    rows = make_inflations()
+    other = rows[1:] + rows[:1]
+    stock = make_stock()
+
+    bench(
+        f"sort {ROWS} rows by period",
+        lambda: sorted(rows, key=parse_period),
+        lambda: sorted(rows, key=lambda row: row.period),
+    )
+    bench(
+        f"{ROWS} Inflation.__eq__",
+        lambda: [parse_period(a) == parse_period(b) for a, b in zip(rows, other)],
+        lambda: [a == b for a, b in zip(rows, other)],
+    )
+    bench(
+        "1M Stock.updated_at",
+        lambda: datetime.datetime.fromtimestamp(stock._updated, tz=datetime.timezone.utc),
+        lambda: stock.updated_at,
+        number=1_000_000,
+    )
+
+
+if __name__ == "__main__":
+    main()